@@ -0,0 +1,41 @@
+"""index gameplays in ranking order
+
+랭킹 정렬(score DESC, created_at, id)과 같은 순서의 인덱스로 바꿉니다. 기존 (score, created_at),
+(model_id, score) 인덱스는 정렬 방향이 섞인 ORDER BY 를 만족하지 못해 페이지마다 정렬이 필요했습니다.
+
+Revision ID: 0b7c8d9e1f2a
+Revises: f1a5b6c7d8e9
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0b7c8d9e1f2a"
+down_revision: Union[str, None] = "f1a5b6c7d8e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_gameplays_ranking", "gameplays", [sa.text("score DESC"), "created_at", "id"]
+    )
+    op.create_index(
+        "ix_gameplays_model_ranking",
+        "gameplays",
+        ["model_id", sa.text("score DESC"), "created_at", "id"],
+    )
+    op.drop_index("ix_gameplays_model_score", table_name="gameplays")
+    op.drop_index("ix_gameplays_score_created", table_name="gameplays")
+
+
+def downgrade() -> None:
+    op.create_index("ix_gameplays_score_created", "gameplays", ["score", "created_at"])
+    op.create_index("ix_gameplays_model_score", "gameplays", ["model_id", "score"])
+    op.drop_index("ix_gameplays_model_ranking", table_name="gameplays")
+    op.drop_index("ix_gameplays_ranking", table_name="gameplays")
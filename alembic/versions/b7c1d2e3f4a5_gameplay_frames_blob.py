@@ -0,0 +1,82 @@
+"""store gameplay frames as columnar blob
+
+Revision ID: b7c1d2e3f4a5
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from src.db.frames_codec import decode_frames, encode_frames
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c1d2e3f4a5"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 100
+
+gameplays = sa.table(
+    "gameplays",
+    sa.column("id", mysql.CHAR(32)),
+    sa.column("frames_data", sa.JSON()),
+    sa.column("frames_blob", sa.LargeBinary()),
+)
+
+
+def _iter_batches(conn, column):
+    # id 기준 키셋 페이지네이션으로 큰 테이블도 일정한 메모리로 처리
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            sa.select(gameplays.c.id, column)
+            .where(gameplays.c.id > last_id, column.is_not(None))
+            .order_by(gameplays.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "gameplays",
+        sa.Column("frames_blob", sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"), nullable=True),
+    )
+
+    conn = op.get_bind()
+    for rows in _iter_batches(conn, gameplays.c.frames_data):
+        for gameplay_id, frames in rows:
+            if isinstance(frames, (str, bytes)):
+                frames = json.loads(frames)
+            conn.execute(
+                gameplays.update()
+                .where(gameplays.c.id == gameplay_id)
+                .values(frames_blob=encode_frames(frames))
+            )
+
+    op.drop_column("gameplays", "frames_data")
+
+
+def downgrade() -> None:
+    op.add_column("gameplays", sa.Column("frames_data", sa.JSON(), nullable=True))
+
+    conn = op.get_bind()
+    for rows in _iter_batches(conn, gameplays.c.frames_blob):
+        for gameplay_id, blob in rows:
+            conn.execute(
+                gameplays.update()
+                .where(gameplays.c.id == gameplay_id)
+                .values(frames_data=decode_frames(blob))
+            )
+
+    op.drop_column("gameplays", "frames_blob")
@@ -0,0 +1,112 @@
+"""split gameplay frames into gameplay_frames table
+
+Revision ID: c8d2e3f4a5b6
+Revises: b7c1d2e3f4a5
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from src.db.frames_codec import decode_frames, encode_frames
+from src.db.frames_store import FRAME_CHUNK_SIZE, iter_frame_chunks
+
+# revision identifiers, used by Alembic.
+revision: str = "c8d2e3f4a5b6"
+down_revision: Union[str, None] = "b7c1d2e3f4a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 100
+
+gameplays = sa.table(
+    "gameplays",
+    sa.column("id", mysql.CHAR(32)),
+    sa.column("frames_blob", sa.LargeBinary()),
+)
+gameplay_frames = sa.table(
+    "gameplay_frames",
+    sa.column("gameplay_id", mysql.CHAR(32)),
+    sa.column("chunk_index", sa.Integer()),
+    sa.column("frame_start", sa.Integer()),
+    sa.column("frame_end", sa.Integer()),
+    sa.column("frame_count", sa.Integer()),
+    sa.column("data", sa.LargeBinary()),
+)
+
+
+def _iter_gameplay_ids(conn):
+    last_id = ""
+    while True:
+        ids = conn.execute(
+            sa.select(gameplays.c.id)
+            .where(gameplays.c.id > last_id)
+            .order_by(gameplays.c.id)
+            .limit(BATCH_SIZE)
+        ).scalars().all()
+        if not ids:
+            return
+        yield from ids
+        last_id = ids[-1]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "gameplay_frames",
+        sa.Column("gameplay_id", mysql.CHAR(32), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("frame_start", sa.Integer(), nullable=False),
+        sa.Column("frame_end", sa.Integer(), nullable=False),
+        sa.Column("frame_count", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"), nullable=False),
+        sa.ForeignKeyConstraint(["gameplay_id"], ["gameplays.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("gameplay_id", "chunk_index"),
+        mysql_engine="InnoDB",
+        mysql_charset="utf8mb4",
+    )
+
+    # 기존 frames_blob 을 청크로 나누어 이관 (한 번에 한 게임 플레이씩)
+    conn = op.get_bind()
+    for gameplay_id in _iter_gameplay_ids(conn):
+        blob = conn.execute(
+            sa.select(gameplays.c.frames_blob).where(gameplays.c.id == gameplay_id)
+        ).scalar_one_or_none()
+        if blob is None:
+            continue
+        rows = [
+            {"gameplay_id": gameplay_id, **row}
+            for row in iter_frame_chunks(decode_frames(blob), FRAME_CHUNK_SIZE)
+        ]
+        if rows:
+            conn.execute(gameplay_frames.insert(), rows)
+
+    op.drop_column("gameplays", "frames_blob")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "gameplays",
+        sa.Column("frames_blob", sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"), nullable=True),
+    )
+
+    conn = op.get_bind()
+    for gameplay_id in _iter_gameplay_ids(conn):
+        chunks = conn.execute(
+            sa.select(gameplay_frames.c.data)
+            .where(gameplay_frames.c.gameplay_id == gameplay_id)
+            .order_by(gameplay_frames.c.chunk_index)
+        ).scalars().all()
+        if not chunks:
+            continue
+        frames = [frame for data in chunks for frame in decode_frames(data)]
+        conn.execute(
+            gameplays.update()
+            .where(gameplays.c.id == gameplay_id)
+            .values(frames_blob=encode_frames(frames))
+        )
+
+    op.drop_table("gameplay_frames")
@@ -0,0 +1,44 @@
+"""add gameplay_counters table
+
+Revision ID: d9e3f4a5b6c7
+Revises: c8d2e3f4a5b6
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d9e3f4a5b6c7"
+down_revision: Union[str, None] = "c8d2e3f4a5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "gameplay_counters",
+        sa.Column("model_id", sa.String(length=32), nullable=False),
+        sa.Column("total", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("model_id"),
+        mysql_engine="InnoDB",
+        mysql_charset="utf8mb4",
+    )
+
+    # 기존 데이터로 초기값 채우기 (전역 합계는 model_id="")
+    op.execute(
+        "INSERT INTO gameplay_counters (model_id, total) "
+        "SELECT '', COUNT(*) FROM gameplays"
+    )
+    op.execute(
+        "INSERT INTO gameplay_counters (model_id, total) "
+        "SELECT model_id, COUNT(*) FROM gameplays "
+        "WHERE model_id IS NOT NULL AND model_id <> '' GROUP BY model_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("gameplay_counters")
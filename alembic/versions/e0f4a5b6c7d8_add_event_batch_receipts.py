@@ -0,0 +1,41 @@
+"""add event_batch_receipts table
+
+Revision ID: e0f4a5b6c7d8
+Revises: d9e3f4a5b6c7
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.mysql import CHAR
+
+# revision identifiers, used by Alembic.
+revision: str = "e0f4a5b6c7d8"
+down_revision: Union[str, None] = "d9e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_batch_receipts",
+        sa.Column("session_id", CHAR(32), nullable=False),
+        sa.Column("request_id", sa.String(length=64), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("session_id", "request_id"),
+        mysql_engine="InnoDB",
+        mysql_charset="utf8mb4",
+    )
+    op.create_index(
+        "ix_event_batch_receipts_created_at", "event_batch_receipts", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_batch_receipts_created_at", table_name="event_batch_receipts")
+    op.drop_table("event_batch_receipts")
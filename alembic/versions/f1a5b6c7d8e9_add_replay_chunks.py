@@ -0,0 +1,40 @@
+"""add replay_chunks table
+
+Revision ID: f1a5b6c7d8e9
+Revises: e0f4a5b6c7d8
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.mysql import CHAR
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a5b6c7d8e9"
+down_revision: Union[str, None] = "e0f4a5b6c7d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "replay_chunks",
+        sa.Column("replay_id", CHAR(32), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("t_start", sa.Integer(), nullable=False),
+        sa.Column("t_end", sa.Integer(), nullable=False),
+        sa.Column("byte_offset", sa.BigInteger(), nullable=False),
+        sa.Column("byte_length", sa.Integer(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["replay_id"], ["replays.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("replay_id", "chunk_index"),
+        mysql_engine="InnoDB",
+        mysql_charset="utf8mb4",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("replay_chunks")
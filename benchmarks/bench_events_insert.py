@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+이벤트 INSERT 벤치마크
+
+기존 경로(이벤트마다 Event ORM 객체 생성 + add_all + commit)와
+Core 일괄 경로(event_rows + insert_events + commit)의 초당 기록 행 수를 비교합니다.
+요청 하나에 해당하는 배치를 트랜잭션 하나로 기록하는 것을 1회로 봅니다.
+
+기본은 임시 SQLite 파일(aiosqlite)이며, ``BENCH_DATABASE_URL`` 로 MySQL 등을 지정할 수 있습니다
+(벤치마크용 세션을 만들고 그 세션의 이벤트만 지웁니다).
+네트워크 왕복이 있는 MySQL 에서는 다중 행 VALUES 의 이점이 더 크게 나타납니다.
+
+    rye run python -m benchmarks.bench_events_insert
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.api.schemas import EventsBatchItem, EventsBatchRequest
+from src.db.base import Base
+from src.db.models import Event, Participant, Session
+from src.ingest.events import event_rows, insert_events
+
+BATCH_SIZES = (10, 100, 1_000)
+BATCHES = 50  # 배치 크기별 기록 횟수(트랜잭션 수)
+
+
+def make_request(session_id: str, n: int) -> EventsBatchRequest:
+    rng = random.Random(n)
+    return EventsBatchRequest(
+        session_id=session_id,
+        events=[
+            EventsBatchItem(
+                t_ms=i * 16,
+                type=rng.choice(("input", "spawn", "hit", "death")),
+                payload={"x": rng.uniform(0, 480), "y": rng.uniform(0, 640), "combo": rng.randint(0, 9)},
+            )
+            for i in range(n)
+        ],
+    )
+
+
+async def orm_path(db: AsyncSession, body: EventsBatchRequest) -> None:
+    db.add_all(
+        [
+            Event(session_id=body.session_id, t_ms=e.t_ms, type=e.type, payload=e.payload)
+            for e in body.events
+        ]
+    )
+    await db.commit()
+
+
+async def core_path(db: AsyncSession, body: EventsBatchRequest) -> None:
+    await insert_events(db, event_rows(body.session_id, body.events))
+    await db.commit()
+
+
+async def rows_per_second(
+    factory: async_sessionmaker[AsyncSession],
+    fn: Callable[[AsyncSession, EventsBatchRequest], Awaitable[None]],
+    body: EventsBatchRequest,
+) -> float:
+    async with factory() as db:
+        start = time.perf_counter()
+        for _ in range(BATCHES):
+            await fn(db, body)
+        elapsed = time.perf_counter() - start
+        await db.execute(delete(Event).where(Event.session_id == body.session_id))
+        await db.commit()
+    return BATCHES * len(body.events) / elapsed
+
+
+async def run(url: str) -> None:
+    engine = create_async_engine(url)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with factory() as db:
+        participant = Participant(created_at=datetime.now(tz=timezone.utc))
+        db.add(participant)
+        await db.flush()
+        session = Session(
+            participant_id=participant.id, mode="human", started_at=datetime.now(tz=timezone.utc)
+        )
+        db.add(session)
+        await db.commit()
+        session_id = session.id
+
+    results: list[tuple[int, float, float]] = []
+    for n in BATCH_SIZES:
+        body = make_request(session_id, n)
+        # 준비 운동: 연결/문장 캐시 예열
+        await rows_per_second(factory, core_path, make_request(session_id, 1))
+        slow = await rows_per_second(factory, orm_path, body)
+        fast = await rows_per_second(factory, core_path, body)
+        results.append((n, slow, fast))
+    await engine.dispose()
+
+    print(f"{'batch':>6} | {'ORM (rows/s)':>12} | {'Core (rows/s)':>13} | {'speedup':>7}")
+    print("-" * 50)
+    for n, slow, fast in results:
+        print(f"{n:>6} | {slow:>12,.0f} | {fast:>13,.0f} | {fast / slow:>6.1f}x")
+
+
+def main() -> None:
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if url:
+        asyncio.run(run(url))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"))
+
+
+if __name__ == "__main__":
+    main()
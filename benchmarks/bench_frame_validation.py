@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+프레임 검증 마이크로 벤치마크
+
+기존 경로(프레임마다 GamePlayFrame 생성 + model_dump)와
+컬럼 단위 일괄 검증 경로(GamePlaySubmitRequest + find_frame_error)를 비교합니다.
+JSON 파싱은 두 경로가 같으므로 측정에서 제외합니다.
+
+    rye run python -m benchmarks.bench_frame_validation
+"""
+
+import json
+import random
+import time
+from typing import Any, Callable
+
+from src.api.frame_validation import find_frame_error
+from src.api.schemas import GamePlayFrame, GamePlaySubmitHeader, GamePlaySubmitRequest
+
+SIZES = (1_000, 10_000, 100_000)
+REPEAT = 5
+
+
+class PerFrameSubmitRequest(GamePlaySubmitHeader):
+    """변경 전 스키마: 프레임마다 Pydantic 모델을 생성"""
+
+    frames: list[GamePlayFrame]
+
+
+def make_body(n: int) -> dict[str, Any]:
+    rng = random.Random(n)
+    frames = [
+        {
+            "frame_number": i,
+            "player_x": rng.uniform(0, 480),
+            "player_y": rng.uniform(0, 640),
+            "player_lives": 3,
+            "player_score": i * 10,
+            "current_weapon": rng.randint(0, 3),
+            "input_left": rng.randint(0, 1),
+            "input_right": rng.randint(0, 1),
+            "enemies": rng.randint(0, 20),
+        }
+        for i in range(n)
+    ]
+    body = {
+        "nickname": "bench",
+        "score": n * 10,
+        "final_stage": 3,
+        "model_id": "intermediate",
+        "statistics": {"total_frames": n},
+        "frames": frames,
+    }
+    # 요청마다 새로 파싱된 본문과 같은 상태가 되도록 JSON 왕복
+    return json.loads(json.dumps(body))
+
+
+def per_frame_path(data: dict[str, Any]) -> None:
+    body = PerFrameSubmitRequest.model_validate(data)
+    [frame.model_dump() for frame in body.frames]
+
+
+def bulk_path(data: dict[str, Any]) -> None:
+    body = GamePlaySubmitRequest.model_validate(data)
+    assert find_frame_error(body.frames) is None
+
+
+def best_of(fn: Callable[[dict[str, Any]], None], data: dict[str, Any]) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    print(f"{'frames':>8} | {'per-frame (ms)':>14} | {'bulk (ms)':>10} | {'speedup':>7}")
+    print("-" * 50)
+    for n in SIZES:
+        data = make_body(n)
+        slow = best_of(per_frame_path, data)
+        fast = best_of(bulk_path, data)
+        print(f"{n:>8} | {slow * 1000:>14.2f} | {fast * 1000:>10.2f} | {slow / fast:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+JSON 직렬화 마이크로 벤치마크
+
+랭킹 한 페이지(100개) 응답 본문을 행마다 GamePlayRankingItem 을 만들어 ``model_dump_json`` 하는
+경로와 행을 dict 로 바로 인코딩하는 경로를 백엔드(orjson / pydantic-core / 표준 json)별로 비교하고,
+이벤트 ``payload`` 같은 JSON 컬럼 값의 인코딩/디코딩 시간도 잽니다.
+
+    rye run python -m benchmarks.bench_json
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from src import serialization
+from src.api.routes.gameplay import _ranking_dict, _ranking_item
+from src.api.schemas import GamePlayRankingResponse
+from src.ranking.leaderboard import LeaderboardEntry
+
+PAGE_SIZE = 100
+PAYLOADS = 1_000
+REPEAT = 200
+
+
+def make_rows() -> list[LeaderboardEntry]:
+    rng = random.Random(0)
+    now = datetime(2024, 1, 1)
+    return [
+        LeaderboardEntry(
+            id=f"{i:032x}",
+            nickname=f"플레이어{rng.randint(1, 100_000)}",
+            score=50_000 - i * 10,
+            final_stage=rng.randint(1, 10),
+            model_id=rng.choice((None, "beginner", "advanced")),
+            total_frames=rng.randint(600, 60_000),
+            play_duration=rng.uniform(10, 1_000),
+            created_at=now - timedelta(seconds=i),
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def make_payloads() -> list[dict[str, Any]]:
+    rng = random.Random(1)
+    return [
+        {"x": round(rng.uniform(0, 480), 1), "y": round(rng.uniform(0, 640), 1), "combo": rng.randint(0, 9)}
+        for _ in range(PAYLOADS)
+    ]
+
+
+def best_of(fn: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def backends() -> list[str]:
+    return [b for b in serialization.BACKENDS if b != "orjson" or serialization.orjson is not None]
+
+
+def main() -> None:
+    rows = make_rows()
+    payloads = make_payloads()
+
+    def model_path() -> bytes:
+        items = [_ranking_item(row, i + 1) for i, row in enumerate(rows)]
+        return GamePlayRankingResponse(
+            rankings=items, total=PAGE_SIZE, page=1, page_size=PAGE_SIZE
+        ).model_dump_json().encode("utf-8")
+
+    baseline = best_of(model_path)
+    print(f"rankings page ({PAGE_SIZE} rows)")
+    print(f"{'path':>24} | {'ms':>8} | {'speedup':>7}")
+    print("-" * 46)
+    print(f"{'pydantic model per row':>24} | {baseline * 1000:>8.3f} | {1.0:>6.1f}x")
+
+    dumps_for = {
+        "orjson": serialization._orjson_dumps,
+        "pydantic": serialization._pydantic_dumps,
+        "stdlib": serialization._stdlib_dumps,
+    }
+    for name in backends():
+        dumps = dumps_for[name]
+
+        def direct_path() -> bytes:
+            return dumps(
+                {
+                    "rankings": [_ranking_dict(row, i + 1) for i, row in enumerate(rows)],
+                    "total": PAGE_SIZE,
+                    "page": 1,
+                    "page_size": PAGE_SIZE,
+                    "next_cursor": None,
+                }
+            )
+
+        assert direct_path() == model_path()
+        took = best_of(direct_path)
+        print(f"{'direct, ' + name:>24} | {took * 1000:>8.3f} | {baseline / took:>6.1f}x")
+
+    print(f"\nJSON column values ({PAYLOADS} event payloads)")
+    print(f"{'backend':>10} | {'dumps ms':>9} | {'loads ms':>9}")
+    print("-" * 34)
+    loads_for = {
+        "orjson": getattr(serialization.orjson, "loads", None),
+        "pydantic": serialization.pydantic_core.from_json,
+        "stdlib": serialization.json.loads,
+    }
+    for name in backends():
+        dumps, loads = dumps_for[name], loads_for[name]
+        encoded = [dumps(p) for p in payloads]
+        dump_time = best_of(lambda: [dumps(p) for p in payloads])
+        load_time = best_of(lambda: [loads(b) for b in encoded])
+        print(f"{name:>10} | {dump_time * 1000:>9.3f} | {load_time * 1000:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
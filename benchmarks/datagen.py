@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 합성 데이터 생성기
+
+``gameplays`` 와 ``events`` 를 실제 운영 규모(수백만 행)까지 채워, 테이블 크기에 따른
+랭킹/수집 성능을 측정할 수 있게 합니다. 같은 ``--seed`` 면 같은 점수/이벤트 분포를 만듭니다.
+행은 Core 다중 행 INSERT 로 ``--batch-size`` 단위마다 커밋하며, 끝나면 ``gameplay_counters`` 를 다시 계산합니다.
+
+기본 대상은 ``BENCH_DATABASE_URL`` (없으면 앱 설정의 DB) 입니다. 운영 DB 에는 실행하지 마세요.
+
+    rye run python -m benchmarks.datagen --gameplays 1000000
+    rye run python -m benchmarks.datagen --sessions 2000 --events-per-session 2500
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.db.models import GamePlay, Participant, Session
+from src.ingest.events import insert_events
+from src.ranking.counters import reconcile_counters
+
+MODEL_IDS = (None, "beginner", "intermediate", "advanced")
+EVENT_TYPES = ("input", "spawn", "hit", "death", "pickup")
+DEFAULT_BATCH_SIZE = 5_000
+
+
+def _progress(label: str, done: int, total: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    rate = done / elapsed if elapsed else 0.0
+    print(f"\r{label}: {done:,}/{total:,} ({rate:,.0f} rows/s)", end="", file=sys.stderr, flush=True)
+
+
+def gameplay_rows(rng: random.Random, n: int, now: datetime) -> list[dict]:
+    rows = []
+    for _ in range(n):
+        stage = rng.randint(1, 10)
+        frames = rng.randint(600, 60_000)
+        rows.append(
+            {
+                "id": uuid.uuid4().hex,
+                "nickname": f"player{rng.randint(1, 100_000)}",
+                # 대부분 낮은 점수, 소수의 고득점 (랭킹 상위가 촘촘하지 않은 실제 분포와 비슷하게)
+                "score": int(rng.gammavariate(2.0, 5_000)) + stage * 100,
+                "final_stage": stage,
+                "model_id": rng.choice(MODEL_IDS),
+                "total_frames": frames,
+                "play_duration": frames / 60,
+                "enemies_destroyed": rng.randint(0, 500),
+                "shots_fired": rng.randint(0, 5_000),
+                "hits": rng.randint(0, 2_000),
+                "deaths": rng.randint(0, 3),
+                "created_at": now - timedelta(seconds=rng.randint(0, 90 * 86_400)),
+            }
+        )
+    return rows
+
+
+async def generate_gameplays(
+    session_factory: async_sessionmaker[AsyncSession],
+    count: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    seed: int = 0,
+    quiet: bool = False,
+) -> int:
+    """gameplays 에 ``count`` 행을 추가하고 카운터를 다시 계산합니다."""
+    rng = random.Random(seed)
+    now = datetime.now(tz=timezone.utc)
+    started = time.perf_counter()
+    done = 0
+    async with session_factory() as db:
+        while done < count:
+            n = min(batch_size, count - done)
+            await db.execute(insert(GamePlay), gameplay_rows(rng, n, now))
+            await db.commit()
+            done += n
+            if not quiet:
+                _progress("gameplays", done, count, started)
+        await reconcile_counters(db)
+    if not quiet and count:
+        print(file=sys.stderr)
+    return done
+
+
+async def generate_events(
+    session_factory: async_sessionmaker[AsyncSession],
+    sessions: int,
+    events_per_session: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    seed: int = 0,
+    quiet: bool = False,
+) -> list[str]:
+    """종료된 세션 ``sessions`` 개와 세션마다 이벤트 ``events_per_session`` 개를 만듭니다."""
+    rng = random.Random(seed)
+    now = datetime.now(tz=timezone.utc)
+    total = sessions * events_per_session
+    started = time.perf_counter()
+    done = 0
+    session_ids: list[str] = []
+    async with session_factory() as db:
+        participant_id = uuid.uuid4().hex
+        await db.execute(insert(Participant), [{"id": participant_id, "created_at": now}])
+        for _ in range(sessions):
+            session_id = uuid.uuid4().hex
+            duration_ms = events_per_session * 16
+            await db.execute(
+                insert(Session),
+                [
+                    {
+                        "id": session_id,
+                        "participant_id": participant_id,
+                        "mode": rng.choice(("human", "agent")),
+                        "started_at": now - timedelta(milliseconds=duration_ms),
+                        "ended_at": now,
+                        "duration_ms": duration_ms,
+                    }
+                ],
+            )
+            session_ids.append(session_id)
+            for start in range(0, events_per_session, batch_size):
+                n = min(batch_size, events_per_session - start)
+                await insert_events(
+                    db,
+                    [
+                        {
+                            "session_id": session_id,
+                            "t_ms": (start + i) * 16,
+                            "type": rng.choice(EVENT_TYPES),
+                            "payload": {
+                                "x": round(rng.uniform(0, 480), 1),
+                                "y": round(rng.uniform(0, 640), 1),
+                                "combo": rng.randint(0, 9),
+                            },
+                        }
+                        for i in range(n)
+                    ],
+                )
+                await db.commit()
+                done += n
+                if not quiet:
+                    _progress("events", done, total, started)
+        await db.commit()
+    if not quiet and total:
+        print(file=sys.stderr)
+    return session_ids
+
+
+async def run(
+    url: Optional[str],
+    gameplays: int,
+    sessions: int,
+    events_per_session: int,
+    batch_size: int,
+    seed: int,
+    create_schema: bool,
+) -> None:
+    if url:
+        engine = create_async_engine(url)
+        factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    else:
+        from src.db.session import async_session_factory as factory, engine
+    try:
+        if create_schema:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        if gameplays:
+            await generate_gameplays(factory, gameplays, batch_size, seed)
+        if sessions and events_per_session:
+            await generate_events(factory, sessions, events_per_session, batch_size, seed)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--url", default=os.environ.get("BENCH_DATABASE_URL"), help="대상 DB (기본: 앱 설정)")
+    parser.add_argument("--gameplays", type=int, default=0)
+    parser.add_argument("--sessions", type=int, default=0)
+    parser.add_argument("--events-per-session", type=int, default=1_000)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--create-schema", action="store_true", help="테이블이 없으면 metadata 로 생성")
+    args = parser.parse_args()
+    asyncio.run(
+        run(
+            args.url,
+            args.gameplays,
+            args.sessions,
+            args.events_per_session,
+            args.batch_size,
+            args.seed,
+            args.create_schema,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
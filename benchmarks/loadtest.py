@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+API 부하/지연 벤치마크
+
+``create_app()`` 을 같은 프로세스에서 ASGI transport(httpx)로 호출해 ``benchmarks/scenarios.py`` 의
+시나리오를 실행하고, 시나리오별 처리량, p50/p95/p99 지연 시간, 최대 RSS 를 JSON 으로 남깁니다.
+네트워크와 서버 프로세스가 빠지므로 앱 코드와 DB 비용만 측정됩니다 (클라이언트 오버헤드는 포함).
+
+DB 는 기본적으로 임시 SQLite 파일이며, ``BENCH_DATABASE_URL`` / ``--database-url`` 로 버려도 되는
+로컬 MySQL 을 지정할 수 있습니다. 시작 전에 ``--gameplays`` 행을 합성해 랭킹 시나리오의 테이블 크기를 맞춥니다.
+랭킹 응답 캐시는 DB 경로를 재기 위해 기본으로 끕니다 (``--rankings-cache`` 로 켬).
+
+기준 보고서(기본 ``benchmarks/baseline.json``)와 같은 이름의 시나리오끼리 비교해, p95 지연이 늘거나
+처리량이 ``--tolerance`` 비율 이상 떨어지면(또는 오류가 있으면) 종료 코드 1 로 끝납니다.
+기준은 머신마다 다르므로 자기 머신에서 ``--output benchmarks/baseline.json`` 으로 다시 기록해 씁니다.
+
+    rye run python -m benchmarks.loadtest --output benchmarks/baseline.json   # 기준 기록/갱신
+    rye run python -m benchmarks.loadtest --quick --scenario 'rankings_*'     # 기준과 비교
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import httpx
+
+from .scenarios import Context, Scenario, all_scenarios
+
+QUICK_DIVISOR = 5
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# 기준과 측정 조건이 다르면 비교 결과가 의미 없으므로 경고
+COMPARABLE_META = ("database", "seed_gameplays", "rankings_cache")
+WARMUP_REQUESTS = 3
+RSS_SAMPLE_SECONDS = 0.02
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # /proc 이 없으면 프로세스 최대값 (Linux 는 KiB, macOS 는 바이트)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    def __init__(self) -> None:
+        self.peak = current_rss_bytes()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            self.peak = max(self.peak, current_rss_bytes())
+            await asyncio.sleep(RSS_SAMPLE_SECONDS)
+
+    def __enter__(self) -> "RssSampler":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self.peak = max(self.peak, current_rss_bytes())
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_scenario(ctx: Context, scenario: Scenario, quick: bool) -> dict[str, Any]:
+    requests = max(2, scenario.requests // QUICK_DIVISOR) if quick else scenario.requests
+    call = await scenario.prepare(ctx)
+    for i in range(min(WARMUP_REQUESTS, requests)):
+        await call(-1 - i)
+
+    latencies: list[float] = []
+    errors: list[str] = []
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < requests:
+            i = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                await call(i)
+            except Exception as exc:
+                errors.append(f"{type(exc).__name__}: {exc}")
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    with RssSampler() as rss:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(scenario.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    ms = [v * 1000 for v in latencies]
+    return {
+        "description": scenario.description,
+        "requests": requests,
+        "concurrency": scenario.concurrency,
+        "errors": len(errors),
+        "error_samples": errors[:3],
+        "duration_s": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ms) / len(ms), 3) if ms else 0.0,
+            "p50": round(percentile(ms, 0.50), 3),
+            "p95": round(percentile(ms, 0.95), 3),
+            "p99": round(percentile(ms, 0.99), 3),
+            "max": round(ms[-1], 3) if ms else 0.0,
+        },
+        "peak_rss_mb": round(rss.peak / (1024 * 1024), 1),
+    }
+
+
+def select_scenarios(patterns: list[str]) -> list[Scenario]:
+    scenarios = all_scenarios()
+    if not patterns:
+        return scenarios
+    return [s for s in scenarios if any(fnmatch.fnmatch(s.name, p) for p in patterns)]
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """기준 대비 회귀 목록 (비어 있으면 통과)."""
+    problems: list[str] = []
+    for name, current in report["scenarios"].items():
+        if current["errors"]:
+            problems.append(f"{name}: {current['errors']} errors ({current['error_samples'][0]})")
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        p95, base_p95 = current["latency_ms"]["p95"], base["latency_ms"]["p95"]
+        if base_p95 and p95 > base_p95 * (1 + tolerance):
+            problems.append(
+                f"{name}: p95 {p95:.1f}ms > baseline {base_p95:.1f}ms ({p95 / base_p95 - 1:+.0%})"
+            )
+        rps, base_rps = current["throughput_rps"], base["throughput_rps"]
+        if base_rps and rps < base_rps * (1 - tolerance):
+            problems.append(
+                f"{name}: {rps:.1f} req/s < baseline {base_rps:.1f} req/s ({rps / base_rps - 1:+.0%})"
+            )
+    return problems
+
+
+def meta_mismatches(report: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    base_meta = baseline.get("meta", {})
+    return [
+        f"{key}: {report['meta'][key]!r} (baseline {base_meta.get(key)!r})"
+        for key in COMPARABLE_META
+        if base_meta.get(key) != report["meta"][key]
+    ]
+
+
+def print_summary(report: dict[str, Any], baseline: Optional[dict[str, Any]]) -> None:
+    print(
+        f"{'scenario':<32} | {'req/s':>9} | {'p50 ms':>8} | {'p95 ms':>8} | "
+        f"{'p99 ms':>8} | {'RSS MB':>7} | {'err':>3}",
+        file=sys.stderr,
+    )
+    print("-" * 93, file=sys.stderr)
+    for name, r in report["scenarios"].items():
+        lat = r["latency_ms"]
+        line = (
+            f"{name:<32} | {r['throughput_rps']:>9.1f} | {lat['p50']:>8.2f} | {lat['p95']:>8.2f} | "
+            f"{lat['p99']:>8.2f} | {r['peak_rss_mb']:>7.1f} | {r['errors']:>3}"
+        )
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        if base and base["latency_ms"]["p95"]:
+            line += f"  (p95 {lat['p95'] / base['latency_ms']['p95'] - 1:+.0%} vs baseline)"
+        print(line, file=sys.stderr)
+
+
+def configure_environment(database_url: str, storage_root: str, rankings_cache: bool) -> None:
+    """앱 설정은 import 시점에 환경 변수에서 읽으므로 ``src`` 를 불러오기 전에 호출해야 합니다."""
+    os.environ["APP_DATABASE_URL"] = database_url
+    os.environ["APP_STORAGE_BACKEND"] = "local"
+    os.environ["APP_STORAGE_LOCAL_ROOT"] = storage_root
+    os.environ.setdefault("APP_DB_SLOW_QUERY_MS", "0")
+    if not rankings_cache:
+        os.environ["APP_RANKINGS_CACHE_TTL_SECONDS"] = "0"
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    from src.db.base import Base
+    from src.db.session import async_session_factory, engine
+    from src.main import create_app
+
+    from .datagen import generate_gameplays
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    if args.gameplays:
+        print(f"seeding {args.gameplays:,} gameplays...", file=sys.stderr)
+        await generate_gameplays(async_session_factory, args.gameplays, quiet=True)
+
+    scenarios = select_scenarios(args.scenario)
+    results: dict[str, Any] = {}
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            ctx = Context(client=client)
+            for scenario in scenarios:
+                print(f"running {scenario.name}...", file=sys.stderr)
+                results[scenario.name] = await run_scenario(ctx, scenario, args.quick)
+
+    return {
+        "meta": {
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": engine.dialect.name,
+            "seed_gameplays": args.gameplays,
+            "quick": args.quick,
+            "rankings_cache": args.rankings_cache,
+        },
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="In-process API load benchmark")
+    parser.add_argument("--scenario", action="append", default=[], help="시나리오 이름 패턴 (glob, 여러 번 지정 가능)")
+    parser.add_argument("--list", action="store_true", help="시나리오 목록만 출력")
+    parser.add_argument("--quick", action="store_true", help=f"반복 수를 1/{QUICK_DIVISOR} 로 줄임")
+    parser.add_argument("--gameplays", type=int, default=20_000, help="시작 전에 채울 gameplays 행 수")
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument("--rankings-cache", action="store_true", help="랭킹 응답 캐시를 켠 채 측정")
+    parser.add_argument("--output", help="JSON 보고서를 쓸 경로 (없으면 표준 출력)")
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="비교할 기준 보고서 (기본 benchmarks/baseline.json, 빈 문자열이면 비교하지 않음)",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 회귀 비율 (기본 0.25)")
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in select_scenarios(args.scenario):
+            print(
+                f"{scenario.name:<32} {scenario.requests:>5} x c{scenario.concurrency:<3} "
+                f"{scenario.description}"
+            )
+        return
+
+    baseline = None
+    # 기준 파일로 저장하는 실행(기준 기록/갱신)은 비교하지 않음.
+    # 기본 경로에 기준이 없어도 비교 없이 실행 (직접 지정한 파일이 없으면 오류)
+    recording = bool(args.output) and os.path.abspath(args.output) == os.path.abspath(args.baseline or "")
+    if (
+        args.baseline
+        and not recording
+        and (args.baseline != DEFAULT_BASELINE or os.path.exists(args.baseline))
+    ):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory(prefix="rldda-bench-") as tmp:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        configure_environment(database_url, os.path.join(tmp, "storage"), args.rankings_cache)
+        report = asyncio.run(run(args))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    print_summary(report, baseline)
+    if baseline is not None:
+        for mismatch in meta_mismatches(report, baseline):
+            print(f"warning: measured with different {mismatch}", file=sys.stderr)
+    problems = compare(report, baseline or {}, args.tolerance)
+    if problems:
+        print("\nregressions:", file=sys.stderr)
+        for problem in problems:
+            print(f"  - {problem}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+부하 벤치마크 시나리오
+
+각 시나리오는 ``prepare(ctx)`` 에서 필요한 상태(세션, 토큰, 미리 인코딩한 본문)를 만들고
+``i`` 번째 반복을 실행하는 함수를 돌려줍니다. 반복 하나의 소요 시간이 지연 시간 샘플이 됩니다.
+본문은 미리 JSON 바이트로 만들어 두므로 측정에는 클라이언트 쪽 인코딩이 들어가지 않습니다.
+"""
+
+import gzip
+import json
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+Call = Callable[[int], Awaitable[None]]
+
+
+class ScenarioError(Exception):
+    """응답 상태 코드가 기대와 다를 때 발생합니다 (오류로 집계)."""
+
+
+@dataclass
+class Context:
+    client: httpx.AsyncClient
+
+
+@dataclass
+class Scenario:
+    name: str
+    requests: int
+    concurrency: int
+    prepare: Callable[[Context], Awaitable[Call]]
+    description: str = ""
+
+
+def check(response: httpx.Response, status: int = 200) -> httpx.Response:
+    if response.status_code != status:
+        request = response.request
+        raise ScenarioError(
+            f"{request.method} {request.url.path}: {response.status_code} {response.text[:200]}"
+        )
+    return response
+
+
+def gameplay_body(n: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    frames = [
+        {
+            "frame_number": i,
+            "player_x": round(rng.uniform(0, 480), 2),
+            "player_y": round(rng.uniform(0, 640), 2),
+            "player_lives": 3,
+            "player_score": i * 10,
+            "current_weapon": rng.randint(0, 3),
+            "input_left": rng.randint(0, 1),
+            "input_right": rng.randint(0, 1),
+            "enemies": rng.randint(0, 20),
+        }
+        for i in range(n)
+    ]
+    body = {
+        "nickname": "bench",
+        "score": rng.randint(0, 50_000),
+        "final_stage": 3,
+        "model_id": "intermediate",
+        "statistics": {"total_frames": n, "play_duration": n / 60},
+        "frames": frames,
+    }
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def events_body(session_id: str, n: int, seed: int = 0) -> dict[str, Any]:
+    rng = random.Random(seed)
+    return {
+        "session_id": session_id,
+        "events": [
+            {
+                "t_ms": i * 16,
+                "type": rng.choice(("input", "spawn", "hit", "death")),
+                "payload": {"x": round(rng.uniform(0, 480), 1), "y": round(rng.uniform(0, 640), 1)},
+            }
+            for i in range(n)
+        ],
+    }
+
+
+async def start_session(client: httpx.AsyncClient, participant_id: Optional[str] = None) -> dict[str, Any]:
+    body: dict[str, Any] = {"mode": "agent", "agent_skill": "intermediate"}
+    if participant_id:
+        body["participant_id"] = participant_id
+    return check(await client.post("/api/session/bootstrap", json=body)).json()
+
+
+def gameplay_submit(frames: int, requests: int, concurrency: int, gzipped: bool = False) -> Scenario:
+    async def prepare(ctx: Context) -> Call:
+        # 같은 본문을 반복해서 보냄 (점수는 랭킹 위치만 바꿀 뿐 처리 비용과 무관)
+        payload = gameplay_body(frames, seed=frames)
+        headers = JSON_HEADERS
+        if gzipped:
+            payload = gzip.compress(payload, compresslevel=6)
+            headers = {**JSON_HEADERS, "content-encoding": "gzip"}
+
+        async def call(i: int) -> None:
+            check(await ctx.client.post("/api/gameplay", content=payload, headers=headers))
+
+        return call
+
+    return Scenario(
+        f"gameplay_submit_{frames // 1000}k" + ("_gzip" if gzipped else ""),
+        requests,
+        concurrency,
+        prepare,
+        f"POST /api/gameplay with {frames:,} frames" + (" (Content-Encoding: gzip)" if gzipped else ""),
+    )
+
+
+def rankings(deep: bool, model_id: Optional[str], requests: int, concurrency: int) -> Scenario:
+    page_size = 100
+
+    async def prepare(ctx: Context) -> Call:
+        params: dict[str, Any] = {"page_size": page_size}
+        if model_id:
+            params["model_id"] = model_id
+        total = check(await ctx.client.get("/api/gameplay/rankings", params=params)).json()["total"]
+        # 깊은 페이지: 전체의 90% 지점 (OFFSET 비용이 가장 큰 구간)
+        params["page"] = max(1, int(total * 0.9) // page_size) if deep else 1
+
+        async def call(i: int) -> None:
+            check(await ctx.client.get("/api/gameplay/rankings", params=params))
+
+        return call
+
+    name = f"rankings_{'deep' if deep else 'first'}_page" + (f"_{model_id}" if model_id else "")
+    return Scenario(name, requests, concurrency, prepare, f"GET /api/gameplay/rankings page_size={page_size}")
+
+
+def events_batch(batch_size: int, requests: int, concurrency: int) -> Scenario:
+    async def prepare(ctx: Context) -> Call:
+        # 동시 요청마다 다른 세션으로 보냄 (실제 클라이언트 분포)
+        sessions = [await start_session(ctx.client) for _ in range(concurrency)]
+        template = events_body("", batch_size, seed=batch_size)
+
+        async def call(i: int) -> None:
+            session = sessions[i % len(sessions)]
+            body = {**template, "session_id": session["session_id"], "request_id": uuid.uuid4().hex}
+            check(
+                await ctx.client.post(
+                    "/api/events/batch",
+                    content=json.dumps(body, separators=(",", ":")).encode("utf-8"),
+                    headers={**JSON_HEADERS, "authorization": f"Bearer {session['ingest_token']}"},
+                )
+            )
+
+        return call
+
+    return Scenario(
+        f"events_batch_{batch_size}_c{concurrency}",
+        requests,
+        concurrency,
+        prepare,
+        f"POST /api/events/batch with {batch_size} events",
+    )
+
+
+def session_churn(requests: int, concurrency: int) -> Scenario:
+    async def prepare(ctx: Context) -> Call:
+        participant_id = check(await ctx.client.post("/api/participants")).json()["id"]
+
+        async def call(i: int) -> None:
+            session = check(
+                await ctx.client.post(
+                    "/api/session/start", json={"participant_id": participant_id, "mode": "human"}
+                )
+            ).json()
+            check(
+                await ctx.client.post(
+                    "/api/session/end", json={"session_id": session["session_id"], "duration_ms": 60_000}
+                )
+            )
+
+        return call
+
+    return Scenario(
+        f"session_churn_c{concurrency}",
+        requests,
+        concurrency,
+        prepare,
+        "POST /api/session/start + /api/session/end",
+    )
+
+
+def all_scenarios() -> list[Scenario]:
+    return [
+        rankings(deep=False, model_id=None, requests=300, concurrency=8),
+        rankings(deep=False, model_id="beginner", requests=300, concurrency=8),
+        rankings(deep=True, model_id=None, requests=150, concurrency=8),
+        rankings(deep=True, model_id="beginner", requests=150, concurrency=8),
+        gameplay_submit(1_000, requests=50, concurrency=4),
+        gameplay_submit(10_000, requests=20, concurrency=4),
+        gameplay_submit(50_000, requests=6, concurrency=2),
+        gameplay_submit(10_000, requests=20, concurrency=4, gzipped=True),
+        events_batch(10, requests=400, concurrency=1),
+        events_batch(10, requests=400, concurrency=8),
+        events_batch(100, requests=200, concurrency=1),
+        events_batch(100, requests=200, concurrency=8),
+        events_batch(1_000, requests=50, concurrency=1),
+        events_batch(1_000, requests=50, concurrency=8),
+        session_churn(requests=200, concurrency=1),
+        session_churn(requests=200, concurrency=8),
+    ]
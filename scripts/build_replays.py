@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+리플레이 생성 스크립트
+
+종료된 세션의 events 를 리플레이 파일로 압축해 저장소(APP_STORAGE_BACKEND)에 올리고
+replays 행을 만듭니다. 세션 id 를 주지 않으면 리플레이가 없는 종료 세션 전체를 처리합니다.
+.env 파일의 설정을 사용합니다.
+
+    rye run python scripts/build_replays.py [SESSION_ID ...] [--limit N] [--prune-events]
+"""
+
+import sys
+import argparse
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.db.session import async_session_factory, engine
+from src.replays.builder import ReplayBuildError, build_replay, ended_sessions_without_replay
+
+
+async def main(session_ids: list[str], limit: int | None, prune_events: bool | None) -> int:
+    failures = 0
+    try:
+        if not session_ids:
+            async with async_session_factory() as db:
+                session_ids = await ended_sessions_without_replay(db, limit)
+        print(f"📦 대상 세션: {len(session_ids)}개")
+
+        for session_id in session_ids:
+            try:
+                result = await build_replay(async_session_factory, session_id, prune_events=prune_events)
+            except ReplayBuildError as exc:
+                failures += 1
+                print(f"❌ {session_id}: {exc}")
+                continue
+            if not result.created:
+                print(f"⏭️  {session_id}: 이미 리플레이가 있습니다 ({result.replay_id})")
+                continue
+            print(
+                f"✅ {session_id}: 이벤트 {result.events}개, 청크 {result.chunks}개, "
+                f"{result.size:,} bytes (삭제한 원본 이벤트 {result.pruned_events}개)"
+            )
+    finally:
+        await engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="종료된 세션의 리플레이 생성")
+    parser.add_argument("session_ids", nargs="*", help="처리할 세션 id (생략하면 리플레이가 없는 종료 세션 전체)")
+    parser.add_argument("--limit", type=int, default=None, help="자동 선택할 최대 세션 수")
+    parser.add_argument(
+        "--prune-events",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="업로드 후 원본 events 행 삭제 (기본값: APP_REPLAY_PRUNE_EVENTS)",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.session_ids, args.limit, args.prune_events)))
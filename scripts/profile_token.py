@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+프로파일링 요청 토큰 발급
+
+APP_PROFILING_SECRET 으로 서명한 X-Profile 헤더 값을 출력합니다.
+이 헤더가 붙은 요청은 샘플링 확률과 관계없이 프로파일됩니다 (APP_PROFILING_ENABLED=true 필요).
+.env 파일의 설정을 사용합니다.
+
+    rye run python scripts/profile_token.py [유효 시간(초), 기본 600]
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import settings
+from src.profiling.middleware import PROFILE_SUBJECT
+from src.security.ingest_token import sign_ingest_token
+
+
+def main() -> None:
+    if not settings.profiling_secret:
+        sys.exit("APP_PROFILING_SECRET 이 설정되어 있지 않습니다")
+    ttl = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    print(sign_ingest_token(settings.profiling_secret, PROFILE_SUBJECT, ttl_seconds=ttl))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+event_batch_receipts 정리 스크립트
+
+보관 기간(APP_EVENTS_RECEIPT_RETENTION_HOURS)이 지난 이벤트 배치 영수증을 지웁니다.
+그보다 오래된 request_id 재시도는 더 이상 중복으로 걸러지지 않습니다.
+.env 파일의 설정을 사용합니다.
+
+    rye run python scripts/prune_event_receipts.py
+"""
+
+import sys
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import settings
+from src.db.session import async_session_factory, engine
+from src.ingest.receipts import prune_receipts
+
+
+async def main() -> None:
+    cutoff = datetime.now(tz=timezone.utc) - timedelta(hours=settings.events_receipt_retention_hours)
+    try:
+        async with async_session_factory() as db:
+            deleted = await prune_receipts(db, cutoff)
+    finally:
+        await engine.dispose()
+
+    print(f"✅ {cutoff.isoformat()} 이전 영수증 {deleted}건 삭제")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+gameplay_counters 재계산 스크립트
+
+gameplays 테이블을 다시 집계해 랭킹 전체 개수 카운터를 바로잡습니다.
+.env 파일의 설정을 사용합니다.
+
+    rye run python scripts/reconcile_gameplay_counters.py
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.db.session import async_session_factory, engine
+from src.ranking.counters import GLOBAL_SCOPE, reconcile_counters
+
+
+async def main() -> None:
+    try:
+        async with async_session_factory() as db:
+            totals = await reconcile_counters(db)
+    finally:
+        await engine.dispose()
+
+    print(f"✅ 전체: {totals.pop(GLOBAL_SCOPE)}")
+    for model_id, total in sorted(totals.items()):
+        print(f"   {model_id}: {total}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
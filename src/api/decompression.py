@@ -0,0 +1,235 @@
+"""
+압축된 요청 본문 (Content-Encoding: gzip / deflate / zstd)
+
+``RequestDecompressionMiddleware`` 는 ``request_decompression_paths`` 경로에서 ASGI ``receive`` 를 감싸
+본문을 받는 대로 조금씩 풀어 넘깁니다. 뒤의 본문 파서(FastAPI 본문 파싱, ``/api/gameplay/stream`` 의
+증분 파서)는 압축되지 않은 본문을 받을 때와 똑같이 동작하며, 압축 본문 전체를 따로 모으지 않습니다.
+
+압축 폭탄 방지를 위해 한 번에 푸는 출력은 ``OUTPUT_CHUNK`` 로 제한하고, 풀린 크기가
+``request_decompressed_max_bytes`` 를 넘는 즉시 413 으로 중단합니다.
+zstd 는 ``compression.zstd`` (Python 3.14+) 또는 ``backports.zstd`` 가 있을 때만 받습니다.
+"""
+
+from __future__ import annotations
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import settings
+
+try:
+    from compression import zstd  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        from backports import zstd  # type: ignore[import-not-found,no-redef]
+    except ImportError:
+        zstd = None  # type: ignore[assignment]
+
+OUTPUT_CHUNK = 256 * 1024
+
+
+class DecompressionError(ValueError):
+    """압축 데이터가 손상되었거나 중간에 끊겼을 때 발생합니다."""
+
+
+class DecompressedTooLarge(ValueError):
+    """풀린 본문이 한도를 넘었을 때 발생합니다."""
+
+
+class _Decoder(ABC):
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.total = 0
+        self.fed = False
+
+    def _count(self, piece: bytes) -> bytes:
+        self.total += len(piece)
+        if self.total > self.limit:
+            raise DecompressedTooLarge(self.total)
+        return piece
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        """``data`` 를 풀어 ``OUTPUT_CHUNK`` 이하 조각으로 내보냅니다."""
+
+    @abstractmethod
+    def finish(self) -> None:
+        """본문이 끝났을 때 호출합니다. 압축 스트림이 끝나지 않았으면 DecompressionError."""
+
+
+class _ZlibDecoder(_Decoder):
+    def __init__(self, limit: int, wbits: int) -> None:
+        super().__init__(limit)
+        self._wbits = wbits
+        self._d = zlib.decompressobj(wbits)
+
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        self.fed = self.fed or bool(data)
+        while data:
+            if self._d.eof:
+                # gzip 은 여러 멤버를 이어 붙일 수 있음 (zlib/deflate 는 뒤에 오는 데이터를 거부)
+                if self._wbits != zlib.MAX_WBITS | 16:
+                    raise DecompressionError("trailing data after compressed stream")
+                self._d = zlib.decompressobj(self._wbits)
+            try:
+                piece = self._d.decompress(data, OUTPUT_CHUNK)
+            except zlib.error as e:
+                raise DecompressionError(str(e)) from e
+            if piece:
+                yield self._count(piece)
+            data = self._d.unconsumed_tail or self._d.unused_data
+
+    def finish(self) -> None:
+        if self.fed and not self._d.eof:
+            raise DecompressionError("truncated compressed stream")
+
+
+class _DeflateDecoder(_ZlibDecoder):
+    """HTTP deflate 는 zlib 형식이지만 헤더 없는 raw deflate 를 보내는 클라이언트도 있어 둘 다 받습니다."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(limit, zlib.MAX_WBITS)
+        self._head = b""
+        self._sniffed = False
+
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        if not self._sniffed:
+            self._head += data
+            if len(self._head) < 2:
+                return
+            data, self._head = self._head, b""
+            self._sniffed = True
+            if data[0] & 0x0F != 8 or int.from_bytes(data[:2], "big") % 31:
+                self._wbits = -zlib.MAX_WBITS
+                self._d = zlib.decompressobj(self._wbits)
+        yield from super().decompress(data)
+
+    def finish(self) -> None:
+        if self._head:
+            raise DecompressionError("truncated compressed stream")
+        super().finish()
+
+
+class _ZstdDecoder(_Decoder):
+    def __init__(self, limit: int) -> None:
+        super().__init__(limit)
+        self._d = zstd.ZstdDecompressor()
+
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        self.fed = self.fed or bool(data)
+        while True:
+            if self._d.eof:
+                # 이어지는 프레임은 새 디코더로
+                data = self._d.unused_data + data
+                if not data:
+                    return
+                self._d = zstd.ZstdDecompressor()
+            try:
+                piece = self._d.decompress(data, OUTPUT_CHUNK)
+            except zstd.ZstdError as e:
+                raise DecompressionError(str(e)) from e
+            data = b""
+            if piece:
+                yield self._count(piece)
+            if self._d.needs_input and not self._d.eof:
+                return
+
+    def finish(self) -> None:
+        if self.fed and not self._d.eof:
+            raise DecompressionError("truncated compressed stream")
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ("gzip", "deflate", "zstd") if zstd is not None else ("gzip", "deflate")
+
+
+def make_decoder(encoding: str, limit: int) -> Optional[_Decoder]:
+    """지원하지 않는 인코딩이면 None."""
+    if encoding in ("gzip", "x-gzip"):
+        return _ZlibDecoder(limit, zlib.MAX_WBITS | 16)
+    if encoding == "deflate":
+        return _DeflateDecoder(limit)
+    if encoding == "zstd" and zstd is not None:
+        return _ZstdDecoder(limit)
+    return None
+
+
+class RequestDecompressionMiddleware:
+    """설정된 경로의 압축 요청 본문을 스트리밍으로 풉니다.
+
+    본문을 읽는 중에 발생한 오류는 HTTPException 으로 올려 라우트의 다른 본문 오류와 같은 형태로 응답합니다
+    (손상/절단 400, 한도 초과 413). 지원하지 않는 인코딩은 본문을 읽기 전에 415 로 거절합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.paths = frozenset(settings.request_decompression_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        encoding: Optional[str] = None
+        for name, value in scope["headers"]:
+            if name == b"content-encoding":
+                encoding = value.decode("latin-1").strip().lower()
+        if encoding is None or encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        decoder = make_decoder(encoding, settings.request_decompressed_max_bytes)
+        if decoder is None:
+            response = JSONResponse(
+                {"detail": f"지원하지 않는 Content-Encoding 입니다: {encoding}"},
+                status_code=415,
+                headers={"Accept-Encoding": ", ".join(supported_encodings())},
+            )
+            await response(scope, receive, send)
+            return
+
+        # 풀린 본문의 길이는 미리 알 수 없음. scope 는 바깥 미들웨어(메트릭의 라우트 라벨)와 공유하므로 제자리에서 바꿈
+        scope["headers"] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+
+        pending: Iterator[bytes] = iter(())
+        more_body = True
+        done = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal pending, more_body, done
+            if done:
+                return await receive()
+            try:
+                while True:
+                    piece = next(pending, None)
+                    if piece is not None:
+                        return {"type": "http.request", "body": piece, "more_body": True}
+                    if not more_body:
+                        decoder.finish()
+                        done = True
+                        return {"type": "http.request", "body": b"", "more_body": False}
+                    message = await receive()
+                    if message["type"] != "http.request":
+                        return message
+                    more_body = message.get("more_body", False)
+                    pending = decoder.decompress(message.get("body", b""))
+            except DecompressedTooLarge:
+                limit = settings.request_decompressed_max_bytes
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"압축을 푼 요청 본문이 허용 크기({limit} bytes)를 초과했습니다.",
+                )
+            except DecompressionError as e:
+                raise HTTPException(
+                    status_code=400, detail=f"압축된 요청 본문을 풀 수 없습니다 ({encoding}): {e}"
+                )
+
+        await self.app(scope, receive_decompressed, send)
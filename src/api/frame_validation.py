@@ -0,0 +1,120 @@
+"""
+게임 플레이 프레임 일괄(컬럼 단위) 검증
+
+프레임마다 ``GamePlayFrame`` 모델을 만드는 대신, 고정 필드를 컬럼으로 뽑아
+타입/범위/순서를 C 레벨 내장 함수(zip, map, min, max)로 한 번에 검사합니다.
+엄격한 타입(int/float)이 아닌 입력이 섞여 있으면 Pydantic 경로로 넘겨
+기존과 동일한 변환 규칙과 오류 형식을 유지합니다.
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import Any, Callable, Optional, Sequence
+
+from ..db.frames_codec import CORE_FIELDS, FLOAT_FIELDS
+
+# frame_number 는 gameplay_frames.frame_start/frame_end (INT) 에 저장되므로 32비트,
+# 나머지 정수 필드는 frames_codec 이 표현할 수 있는 64비트 범위
+FIELD_RANGES: dict[str, tuple[int, int]] = {
+    field: (-(2**31), 2**31 - 1) if field == "frame_number" else (-(2**63), 2**63 - 1)
+    for field in CORE_FIELDS
+    if field not in FLOAT_FIELDS
+}
+
+_core_getter = operator.itemgetter(*CORE_FIELDS)
+_INT_TYPES = {int}
+_FLOAT_TYPES = {float}
+_NUMBER_TYPES = {float, int}
+
+
+def frames_have_strict_types(frames: Any) -> bool:
+    """모든 프레임이 dict 이고 고정 필드가 정확한 타입이면 True.
+
+    좌표 필드의 int 값은 Pydantic 과 동일하게 float 로 바꿔 둡니다(제자리 수정).
+    """
+    if type(frames) is not list:
+        return False
+    if not frames:
+        return True
+    if set(map(type, frames)) != {dict}:
+        return False
+    try:
+        columns = list(zip(*map(_core_getter, frames)))
+    except KeyError:
+        return False
+
+    for field, column in zip(CORE_FIELDS, columns):
+        types = set(map(type, column))
+        if field in FLOAT_FIELDS:
+            if types == _FLOAT_TYPES:
+                continue
+            if not types <= _NUMBER_TYPES:
+                return False
+            for frame, value in zip(frames, column):
+                frame[field] = float(value)
+        elif types != _INT_TYPES:
+            return False
+    return True
+
+
+def _error(index: int, field: str, type_: str, msg: str, value: Any, **ctx: Any) -> dict[str, Any]:
+    error: dict[str, Any] = {"type": type_, "loc": (index, field), "msg": msg, "input": value}
+    if ctx:
+        error["ctx"] = ctx
+    return error
+
+
+def find_frame_error(
+    frames: Sequence[dict[str, Any]],
+    previous_frame_number: Optional[int] = None,
+) -> Optional[dict[str, Any]]:
+    """타입이 확인된 프레임의 범위와 frame_number 단조 증가를 검사합니다.
+
+    첫 번째 위반을 Pydantic 오류 형식의 dict(loc 는 (프레임 인덱스, 필드))로 돌려줍니다.
+    """
+    if not frames:
+        return None
+
+    for field, (lo, hi) in FIELD_RANGES.items():
+        column = list(map(operator.itemgetter(field), frames))
+        if min(column) < lo:
+            index = next(i for i, v in enumerate(column) if v < lo)
+            return _error(
+                index, field, "greater_than_equal",
+                f"Input should be greater than or equal to {lo}", column[index], ge=lo,
+            )
+        if max(column) > hi:
+            index = next(i for i, v in enumerate(column) if v > hi)
+            return _error(
+                index, field, "less_than_equal",
+                f"Input should be less than or equal to {hi}", column[index], le=hi,
+            )
+
+    numbers = list(map(operator.itemgetter("frame_number"), frames))
+    previous = numbers[:-1]
+    if previous_frame_number is not None:
+        previous.insert(0, previous_frame_number)
+        current = numbers
+    else:
+        current = numbers[1:]
+    if not all(map(operator.lt, previous, current)):
+        index = next(i for i, (a, b) in enumerate(zip(previous, current)) if a >= b)
+        if previous_frame_number is None:
+            index += 1
+        return _error(
+            index, "frame_number", "frame_number_order",
+            "frame_number must be strictly increasing", numbers[index],
+        )
+    return None
+
+
+def validate_frames(value: Any, handler: Callable[[Any], Any]) -> list[dict[str, Any]]:
+    """``GamePlaySubmitRequest.frames`` 용 WrapValidator.
+
+    빠른 경로를 통과하면 입력 dict 목록을 그대로, 아니면 Pydantic 검증 결과를
+    ``model_dump()`` 한 dict 목록을 반환합니다.
+    """
+    if frames_have_strict_types(value):
+        return value
+    return [frame.model_dump() for frame in handler(value)]
@@ -0,0 +1,196 @@
+"""
+게임 플레이 제출 본문을 위한 증분(스트리밍) JSON 파서
+
+최상위 객체의 헤더 필드는 값 단위로, ``frames`` 배열은 원소(프레임) 단위로
+잘라 내보냅니다. 파서가 들고 있는 버퍼는 "현재 파싱 중인 값 하나" 크기로 제한되므로
+본문 전체나 프레임 목록 전체를 메모리에 올리지 않습니다.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Iterator, Literal, Tuple, Union
+
+FRAMES_KEY = "frames"
+
+_WS = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+StreamEvent = Union[
+    Tuple[Literal["field"], str, Any],
+    Tuple[Literal["frames_start"]],
+    Tuple[Literal["frame"], int, Any],
+    Tuple[Literal["frames_end"], int],
+]
+
+
+class JSONStreamError(ValueError):
+    """본문이 올바른 JSON 이 아니거나 허용 크기를 넘을 때 발생합니다."""
+
+    def __init__(self, message: str, position: int) -> None:
+        super().__init__(message)
+        self.position = position
+
+
+class GamePlayStreamParser:
+    """``feed()`` 로 바이트 조각을 넣으면 완성된 필드/프레임 이벤트를 돌려줍니다."""
+
+    def __init__(self, max_value_chars: int = 1024 * 1024) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._consumed = 0  # 버퍼 앞에서 잘라낸 문자 수 (오류 위치 보고용)
+        self._state = "start"
+        self._key = ""
+        self._frame_index = 0
+        self._max_value_chars = max_value_chars
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, data: bytes) -> list[StreamEvent]:
+        self._buf += self._text.decode(data)
+        events = list(self._parse(final=False))
+        self._compact()
+        return events
+
+    def close(self) -> list[StreamEvent]:
+        self._buf += self._text.decode(b"", final=True)
+        events = list(self._parse(final=True))
+        if self._state != "done":
+            self._error("unexpected end of JSON body")
+        self._skip_ws()
+        if self._pos != len(self._buf):
+            self._error("extra data after JSON body")
+        return events
+
+    # -- 내부 구현 -----------------------------------------------------------
+
+    def _error(self, message: str) -> None:
+        raise JSONStreamError(message, self._consumed + self._pos)
+
+    def _compact(self) -> None:
+        if self._pos:
+            self._consumed += self._pos
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        if len(self._buf) > self._max_value_chars:
+            self._error("JSON value exceeds the maximum allowed size")
+
+    def _skip_ws(self) -> None:
+        self._pos = _WS.match(self._buf, self._pos).end()
+
+    def _peek(self) -> str:
+        self._skip_ws()
+        return self._buf[self._pos : self._pos + 1]
+
+    def _expect(self, char: str) -> bool:
+        c = self._peek()
+        if not c:
+            return False
+        if c != char:
+            self._error(f"expected {char!r}")
+        self._pos += 1
+        return True
+
+    def _value(self, final: bool) -> tuple[bool, Any]:
+        """버퍼에서 값 하나를 읽습니다. 아직 값이 끝나지 않았으면 (False, None)."""
+        self._skip_ws()
+        if self._pos >= len(self._buf):
+            return False, None
+        try:
+            value, end = _decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as e:
+            if final:
+                self._error(e.msg)
+            return False, None
+        # 숫자 등 스칼라는 버퍼 끝에서 잘렸을 수 있으므로 구분자를 볼 때까지 기다림
+        if end == len(self._buf) and not final:
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _parse(self, final: bool) -> Iterator[StreamEvent]:
+        while True:
+            state = self._state
+            if state == "start":
+                if not self._expect("{"):
+                    return
+                self._state = "key_or_end"
+            elif state in ("key_or_end", "key"):
+                c = self._peek()
+                if not c:
+                    return
+                if c == "}" and state == "key_or_end":
+                    self._pos += 1
+                    self._state = "done"
+                    return
+                if c != '"':
+                    self._error("expected object key")
+                ok, key = self._value(final)
+                if not ok:
+                    return
+                self._key = key
+                self._state = "colon"
+            elif state == "colon":
+                if not self._expect(":"):
+                    return
+                if self._key == FRAMES_KEY:
+                    self._state = "frames_open"
+                else:
+                    self._state = "field_value"
+            elif state == "field_value":
+                ok, value = self._value(final)
+                if not ok:
+                    return
+                yield ("field", self._key, value)
+                self._state = "after_value"
+            elif state == "frames_open":
+                if not self._expect("["):
+                    return
+                yield ("frames_start",)
+                self._state = "frame_or_end"
+            elif state in ("frame_or_end", "frame"):
+                c = self._peek()
+                if not c:
+                    return
+                if c == "]" and state == "frame_or_end":
+                    self._pos += 1
+                    yield ("frames_end", self._frame_index)
+                    self._state = "after_value"
+                    continue
+                ok, value = self._value(final)
+                if not ok:
+                    return
+                yield ("frame", self._frame_index, value)
+                self._frame_index += 1
+                self._state = "after_frame"
+            elif state == "after_frame":
+                c = self._peek()
+                if not c:
+                    return
+                self._pos += 1
+                if c == ",":
+                    self._state = "frame"
+                elif c == "]":
+                    yield ("frames_end", self._frame_index)
+                    self._state = "after_value"
+                else:
+                    self._error("expected ',' or ']'")
+            elif state == "after_value":
+                c = self._peek()
+                if not c:
+                    return
+                self._pos += 1
+                if c == ",":
+                    self._state = "key"
+                elif c == "}":
+                    self._state = "done"
+                    return
+                else:
+                    self._error("expected ',' or '}'")
+            else:
+                return
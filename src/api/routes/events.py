@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...config import settings
-from ...db.models import Event, Session
+from ...db.models import Session
 from ...db.session import get_db_session
-from ...security.ingest_token import verify_ingest_token
+from ...ingest.buffer import BufferFullError, event_buffer
+from ...ingest.events import event_rows, insert_events
+from ...ingest.receipts import existing_receipts, insert_receipts, receipt_row, receipt_window
+from ...security.auth_cache import ingest_auth
 from ..schemas import EventsBatchRequest
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -20,23 +23,62 @@ async def ingest_events_batch(
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="missing bearer token")
     token = authorization.split(" ", 1)[1]
-    payload = verify_ingest_token(settings.ingest_secret, token)
-    if payload.get("sid") != body.session_id:
+    try:
+        verified = ingest_auth.verify(token)
+    except ValueError:
+        raise HTTPException(status_code=401, detail="invalid token")
+    if verified.sid != body.session_id:
         raise HTTPException(status_code=403, detail="session mismatch")
 
-    # validate session exists
-    res = await db.execute(select(Session.id).where(Session.id == body.session_id))
-    if res.scalar_one_or_none() is None:
+    # validate session exists (캐시에 없을 때만 DB 조회)
+    live = ingest_auth.session_live(body.session_id)
+    if live is None:
+        res = await db.execute(select(Session.id).where(Session.id == body.session_id))
+        live = res.scalar_one_or_none() is not None
+        if live:
+            ingest_auth.remember_session(body.session_id, verified.exp)
+        else:
+            ingest_auth.remember_missing(body.session_id)
+    if not live:
         raise HTTPException(status_code=404, detail="session not found")
 
-    # insert events
-    db.add_all(
-        [
-            Event(session_id=body.session_id, t_ms=e.t_ms, type=e.type, payload=e.payload)
-            for e in body.events
-        ]
-    )
-    await db.commit()
-    return {"accepted": True, "count": len(body.events)}
+    # 같은 request_id 재시도는 INSERT 없이 성공 처리
+    request_id = body.request_id
+    if request_id and receipt_window.seen(body.session_id, request_id):
+        receipt_window.record_duplicate(len(body.events), from_db=False)
+        return {"accepted": True, "count": len(body.events), "duplicate": True}
 
+    rows = event_rows(body.session_id, body.events)
+    receipt = receipt_row(body.session_id, request_id, len(rows)) if request_id else None
+    if event_buffer.running:
+        # write-behind: 버퍼에 넣은 즉시 응답하고 백그라운드에서 모아서 INSERT
+        try:
+            await event_buffer.put(rows, receipt)
+        except BufferFullError:
+            raise HTTPException(
+                status_code=503,
+                detail="event buffer is full",
+                headers={"Retry-After": "1"},
+            )
+        if request_id:
+            receipt_window.add(body.session_id, request_id)
+        return {"accepted": True, "count": len(body.events), "buffered": True}
 
+    # insert events (Core 다중 행 INSERT, ORM 객체 생성 없음)
+    # 영수증을 먼저 INSERT 해 이미 처리한 request_id 면 키 충돌로 바로 멈춤
+    try:
+        if receipt:
+            await insert_receipts(db, [receipt])
+        await insert_events(db, rows)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        # 영수증 키 충돌(이미 기록된 배치)만 중복으로 처리하고, 그 밖의 무결성 오류는 그대로 올림
+        if not receipt or not await existing_receipts(db, [(body.session_id, request_id)]):
+            raise
+        receipt_window.add(body.session_id, request_id)
+        receipt_window.record_duplicate(len(body.events), from_db=True)
+        return {"accepted": True, "count": len(body.events), "duplicate": True}
+    if request_id:
+        receipt_window.add(body.session_id, request_id)
+    return {"accepted": True, "count": len(body.events)}
@@ -1,25 +1,141 @@
+import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...config import settings
+from ...db.frames_store import FrameChunkWriter, build_frame_chunks
 from ...db.models import GamePlay
 from ...db.session import get_db_session
+from ...ranking.leaderboard import (
+    LeaderboardEntry,
+    leaderboard,
+    ranking_columns,
+    ranking_order,
+)
+from ...ranking.counters import gameplay_counters, increment_counters
+from ...ranking.cursor import RankingCursor
+from ...ranking.rank import locate
+from ...ranking.response_cache import etag_matches, rankings_cache
+from ...serialization import dumps
+from ..frame_validation import find_frame_error, frames_have_strict_types
+from ..json_stream import GamePlayStreamParser, JSONStreamError
 from ..schemas import (
+    GamePlayFrame,
+    GamePlayRankResponse,
     GamePlayRankingItem,
     GamePlayRankingResponse,
+    GamePlaySubmitHeader,
     GamePlaySubmitRequest,
     GamePlaySubmitResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/gameplay", tags=["gameplay"])
 
+SUBMIT_SUCCESS_MESSAGE = "게임 플레이 데이터가 성공적으로 저장되었습니다."
+
+
+def _too_many_frames() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"프레임 수가 허용 한도({settings.gameplay_max_frames})를 초과했습니다.",
+    )
+
+
+def _body_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"요청 본문이 허용 크기({settings.gameplay_max_body_bytes} bytes)를 초과했습니다.",
+    )
+
+
+def _body_validation_error(exc: ValidationError, *loc: object) -> RequestValidationError:
+    # FastAPI 기본 본문 검증 오류와 같은 형태(loc 가 "body" 로 시작)로 변환
+    return RequestValidationError(
+        [
+            {**err, "loc": ("body", *loc, *err["loc"])}
+            for err in exc.errors(include_url=False)
+        ]
+    )
+
+
+def _frame_error(error: dict, offset: int = 0) -> RequestValidationError:
+    index, field = error["loc"]
+    return RequestValidationError(
+        [{**error, "loc": ("body", "frames", offset + index, field)}]
+    )
+
+
+def _new_gameplay(header: GamePlaySubmitHeader) -> GamePlay:
+    # created_at 은 초 단위로 저장 (MySQL DATETIME 정밀도와 맞춰 메모리 인덱스와 정렬을 일치시킴)
+    return GamePlay(
+        nickname=header.nickname,
+        score=header.score,
+        final_stage=header.final_stage,
+        model_id=header.model_id,
+        total_frames=header.statistics.total_frames,
+        play_duration=header.statistics.play_duration,
+        enemies_destroyed=header.statistics.enemies_destroyed,
+        shots_fired=header.statistics.shots_fired,
+        hits=header.statistics.hits,
+        deaths=header.statistics.deaths,
+        created_at=datetime.now(tz=timezone.utc).replace(microsecond=0),
+    )
+
+
+def _on_gameplay_saved(gameplay: GamePlay) -> None:
+    gameplay_counters.bump(gameplay.model_id)
+    rankings_cache.invalidate_for_score(gameplay.model_id, gameplay.score)
+    if settings.leaderboard_index_enabled:
+        leaderboard.add(LeaderboardEntry.from_row(gameplay))
+
+
+def _ranking_item(row: Any, rank: int) -> GamePlayRankingItem:
+    return GamePlayRankingItem(
+        id=row.id,
+        nickname=row.nickname,
+        score=row.score,
+        final_stage=row.final_stage,
+        model_id=row.model_id,
+        total_frames=row.total_frames,
+        play_duration=row.play_duration,
+        created_at=row.created_at.isoformat() if row.created_at else "",
+        rank=rank,
+    )
+
+
+def _ranking_dict(row: Any, rank: int) -> dict[str, Any]:
+    """``_ranking_item`` 과 같은 필드를 검증 없이 dict 로 (응답 본문을 직접 인코딩할 때)."""
+    return {
+        "id": row.id,
+        "nickname": row.nickname,
+        "score": row.score,
+        "final_stage": row.final_stage,
+        "model_id": row.model_id,
+        "total_frames": row.total_frames,
+        "play_duration": row.play_duration,
+        "created_at": row.created_at.isoformat() if row.created_at else "",
+        "rank": rank,
+    }
+
 
-@router.post("", response_model=GamePlaySubmitResponse)
+class _RankingsPage(NamedTuple):
+    body: bytes  # 인코딩된 GamePlayRankingResponse
+    min_score: Optional[int]
+    full: bool
+
+
+@router.post("", response_model=GamePlaySubmitResponse, response_model_exclude_unset=True)
 async def submit_gameplay(
     body: GamePlaySubmitRequest,
+    with_rank: bool = Query(False, description="응답에 순위(rank, model_rank)를 포함"),
     db: AsyncSession = Depends(get_db_session),
 ) -> GamePlaySubmitResponse:
     """
@@ -31,36 +147,179 @@ async def submit_gameplay(
     - **model_id**: 사용한 AI 모델 ID (beginner, intermediate, advanced)
     - **statistics**: 게임 통계 정보
     - **frames**: 프레임별 상세 데이터
+    - **with_rank**: true 이면 저장 직후 순위를 함께 반환 (별도 순위 조회 불필요)
     """
+    if len(body.frames) > settings.gameplay_max_frames:
+        raise _too_many_frames()
+    error = find_frame_error(body.frames)
+    if error is not None:
+        raise _frame_error(error)
+
     try:
-        # 프레임 데이터를 딕셔너리 리스트로 변환
-        frames_data = [frame.model_dump() for frame in body.frames]
-
-        # GamePlay 인스턴스 생성
-        gameplay = GamePlay(
-            nickname=body.nickname,
-            score=body.score,
-            final_stage=body.final_stage,
-            model_id=body.model_id,
-            total_frames=body.statistics.total_frames,
-            play_duration=body.statistics.play_duration,
-            enemies_destroyed=body.statistics.enemies_destroyed,
-            shots_fired=body.statistics.shots_fired,
-            hits=body.statistics.hits,
-            deaths=body.statistics.deaths,
-            frames_data=frames_data,
-            created_at=datetime.now(tz=timezone.utc),
-        )
+        # GamePlay 인스턴스 생성 후 프레임 데이터를 청크 단위 컬럼형 바이너리로 인코딩
+        gameplay = _new_gameplay(body)
+        gameplay.frame_chunks = build_frame_chunks(body.frames)
 
         db.add(gameplay)
+        await increment_counters(db, gameplay.model_id)
         await db.commit()
-        await db.refresh(gameplay)
+        _on_gameplay_saved(gameplay)
 
-        return GamePlaySubmitResponse(
-            id=gameplay.id,
-            message="게임 플레이 데이터가 성공적으로 저장되었습니다.",
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"게임 플레이 데이터 저장 중 오류가 발생했습니다: {str(e)}",
         )
 
+    response = GamePlaySubmitResponse(id=gameplay.id, message=SUBMIT_SUCCESS_MESSAGE)
+    if with_rank:
+        # 이미 커밋된 뒤이므로 순위 조회가 실패해도 저장 결과(id)는 돌려줌 (재시도로 중복 저장되지 않도록)
+        entry = LeaderboardEntry.from_row(gameplay)
+        # 순위 필드는 with_rank 일 때만 응답에 포함 (response_model_exclude_unset)
+        response.rank = response.model_rank = None
+        try:
+            response.rank = (await locate(db, entry.score, neighbors=0, entry=entry)).rank
+            if entry.model_id:
+                response.model_rank = (
+                    await locate(db, entry.score, entry.model_id, neighbors=0, entry=entry)
+                ).rank
+        except Exception:
+            logger.warning("rank lookup failed after saving gameplay %s", gameplay.id, exc_info=True)
+            response.rank = response.model_rank = None
+    return response
+
+
+@router.post("/stream", response_model=GamePlaySubmitResponse, response_model_exclude_unset=True)
+async def submit_gameplay_stream(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+) -> GamePlaySubmitResponse:
+    """
+    게임 플레이 데이터를 스트리밍 방식으로 제출합니다.
+
+    본문 형식은 `POST /api/gameplay` 와 같지만, 헤더 필드(nickname, score, final_stage,
+    model_id, statistics)가 **frames 보다 앞에** 와야 합니다. 헤더는 프레임 수신 전에
+    검증되고, 프레임은 받는 즉시 검증되어 청크 단위로 인코딩되므로 원본 프레임 목록을
+    메모리에 쌓지 않습니다. DB 기록은 본문을 모두 받은 뒤 한 트랜잭션으로 하므로
+    느린 업로드가 DB 연결을 잡고 있지 않습니다.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length:
+        try:
+            declared = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 Content-Length 헤더입니다.")
+        if declared > settings.gameplay_max_body_bytes:
+            raise _body_too_large()
+
+    parser = GamePlayStreamParser()
+    fields: dict = {}
+    header: GamePlaySubmitHeader | None = None
+    writer: FrameChunkWriter | None = None
+    last_frame_number: int | None = None
+    received = 0
+
+    def handle(events: list) -> None:
+        nonlocal header, writer, last_frame_number
+        frames: list = []
+        offset = writer.frame_count if writer is not None else 0
+        for event in events:
+            kind = event[0]
+            if kind == "field":
+                if writer is not None:
+                    raise RequestValidationError(
+                        [
+                            {
+                                "type": "value_error",
+                                "loc": ("body", event[1]),
+                                "msg": "스트리밍 제출에서는 헤더 필드가 frames 보다 앞에 와야 합니다.",
+                                "input": event[2],
+                            }
+                        ]
+                    )
+                fields[event[1]] = event[2]
+            elif kind == "frames_start":
+                if writer is not None:
+                    raise RequestValidationError(
+                        [
+                            {
+                                "type": "value_error",
+                                "loc": ("body", "frames"),
+                                "msg": "frames 는 한 번만 올 수 있습니다.",
+                                "input": None,
+                            }
+                        ]
+                    )
+                # 프레임을 받기 전에 헤더를 검증
+                try:
+                    header = GamePlaySubmitHeader.model_validate(fields)
+                except ValidationError as e:
+                    raise _body_validation_error(e)
+                writer = FrameChunkWriter()
+            elif kind == "frame":
+                if event[1] >= settings.gameplay_max_frames:
+                    raise _too_many_frames()
+                frames.append(event[2])
+        if not frames:
+            return
+
+        # 수신된 프레임 묶음 단위로 일괄 검증, 엄격한 타입이 아니면 Pydantic 으로 검증
+        if not frames_have_strict_types(frames):
+            validated = []
+            for index, raw in enumerate(frames, start=offset):
+                try:
+                    validated.append(GamePlayFrame.model_validate(raw).model_dump())
+                except ValidationError as e:
+                    raise _body_validation_error(e, "frames", index)
+            frames = validated
+        error = find_frame_error(frames, last_frame_number)
+        if error is not None:
+            raise _frame_error(error, offset)
+        last_frame_number = frames[-1]["frame_number"]
+        writer.add(frames)
+
+    try:
+        async for data in request.stream():
+            received += len(data)
+            if received > settings.gameplay_max_body_bytes:
+                raise _body_too_large()
+            handle(parser.feed(data))
+        handle(parser.close())
+
+        if writer is None:
+            # frames 가 없는 본문: 일반 제출과 같은 검증 오류를 돌려줌
+            try:
+                GamePlaySubmitRequest.model_validate(fields)
+            except ValidationError as e:
+                raise _body_validation_error(e)
+
+        gameplay = _new_gameplay(header)
+        db.add(gameplay)
+        await db.flush()
+        await writer.write(db, gameplay.id)
+        await increment_counters(db, gameplay.model_id)
+        await db.commit()
+        _on_gameplay_saved(gameplay)
+
+        return GamePlaySubmitResponse(id=gameplay.id, message=SUBMIT_SUCCESS_MESSAGE)
+
+    except JSONStreamError as e:
+        await db.rollback()
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", e.position),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": str(e)},
+                }
+            ]
+        )
+    except (HTTPException, RequestValidationError):
+        await db.rollback()
+        raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -71,81 +330,177 @@ async def submit_gameplay(
 
 @router.get("/rankings", response_model=GamePlayRankingResponse)
 async def get_rankings(
+    request: Request,
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     page_size: int = Query(10, ge=1, le=100, description="페이지당 항목 수 (최대 100)"),
     model_id: Optional[str] = Query(
         None, description="특정 모델로 필터링 (예: beginner, intermediate, advanced)"
     ),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (지정 시 page 대신 커서 이후부터 조회)"
+    ),
     db: AsyncSession = Depends(get_db_session),
-) -> GamePlayRankingResponse:
+) -> Response:
     """
     게임 플레이 랭킹을 조회합니다.
 
     - **page**: 페이지 번호 (1부터 시작)
     - **page_size**: 페이지당 항목 수 (기본 10, 최대 100)
     - **model_id**: 특정 모델로 필터링 (선택 사항)
+    - **cursor**: 이전 응답의 `next_cursor` (선택 사항, 깊은 페이지도 일정한 비용으로 조회)
 
     점수 기준 내림차순으로 정렬되며, 동점일 경우 먼저 등록된 순서로 정렬됩니다.
+    응답은 서버에서 캐시되며 `ETag` 를 포함하므로 `If-None-Match` 로 304 응답을 받을 수 있습니다.
     """
-    try:
-        # 기본 쿼리 구성 - 랭킹에 필요한 컬럼만 선택 (frames_data 제외)
-        base_query = select(
-            GamePlay.id,
-            GamePlay.nickname,
-            GamePlay.score,
-            GamePlay.final_stage,
-            GamePlay.model_id,
-            GamePlay.total_frames,
-            GamePlay.play_duration,
-            GamePlay.created_at,
+    model_id = model_id or None
+    key = (model_id, page, page_size, cursor)
+    cached = rankings_cache.get(key)
+    if cached is None:
+        generation = rankings_cache.generation
+        rankings = await _build_rankings(db, page, page_size, model_id, cursor)
+        cached = rankings_cache.put(
+            key,
+            rankings.body,
+            min_score=rankings.min_score,
+            full=rankings.full,
+            generation=generation,
+        )
+
+    # 서버 캐시는 새 점수로 무효화되지만 브라우저 캐시는 그렇지 않으므로, 매번 ETag 로 재검증하게 함
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+async def _build_rankings(
+    db: AsyncSession,
+    page: int,
+    page_size: int,
+    model_id: Optional[str],
+    cursor: Optional[str],
+) -> _RankingsPage:
+    after: Optional[RankingCursor] = None
+    if cursor:
+        try:
+            after = RankingCursor.decode(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+        if after.model_id != model_id:
+            raise HTTPException(status_code=400, detail="커서의 model_id 필터가 요청과 다릅니다.")
+        # 커서 모드: 순위는 커서에 담긴 직전 순위에서 이어짐
+        rank_base = after.rank
+        page = rank_base // page_size + 1
+    else:
+        rank_base = (page - 1) * page_size
+
+    def respond(rows: list, total: int) -> _RankingsPage:
+        next_cursor = None
+        if len(rows) == page_size:
+            next_cursor = RankingCursor.after(rows[-1], rank_base + len(rows), model_id).encode()
+        # 행마다 GamePlayRankingItem 을 만들지 않고 바로 인코딩 (스키마는 GamePlayRankingResponse 와 같음)
+        body = dumps(
+            {
+                "rankings": [_ranking_dict(row, rank_base + idx + 1) for idx, row in enumerate(rows)],
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "next_cursor": next_cursor,
+            }
         )
-        count_query = select(func.count(GamePlay.id))
+        return _RankingsPage(body, rows[-1].score if rows else None, len(rows) == page_size)
+
+    # 리더보드 인덱스가 적재되어 있으면 DB 를 거치지 않고 응답
+    if leaderboard.ready:
+        index = leaderboard.index_for(model_id)
+        start = index.position_after(after.sort_key) if after else rank_base
+        return respond(index.slice(start, page_size), len(index))
+
+    try:
+        # 기본 쿼리 구성 - 랭킹에 필요한 컬럼만 선택 (프레임은 gameplay_frames 에 분리)
+        base_query = select(*ranking_columns())
 
         # 모델별 필터링
         if model_id:
             base_query = base_query.where(GamePlay.model_id == model_id)
-            count_query = count_query.where(GamePlay.model_id == model_id)
 
-        # 전체 개수 조회
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
+        # 전체 개수 조회 (gameplay_counters 캐시, 집계 쿼리 없음)
+        total = await gameplay_counters.get(db, model_id)
 
         # 랭킹 조회 (점수 내림차순, 동점일 경우 생성일 오름차순)
-        offset = (page - 1) * page_size
-        rankings_query = (
-            base_query.order_by(desc(GamePlay.score), GamePlay.created_at)
-            .limit(page_size)
-            .offset(offset)
-        )
+        # 커서가 있으면 OFFSET 대신 (score, created_at, id) 키 이후부터 읽음
+        rankings_query = base_query.order_by(*ranking_order()).limit(page_size)
+        if after:
+            rankings_query = rankings_query.where(after.seek_predicate())
+        else:
+            rankings_query = rankings_query.offset(rank_base)
 
         result = await db.execute(rankings_query)
-        rows = result.all()
-
-        # 랭킹 아이템 생성
-        rankings = [
-            GamePlayRankingItem(
-                id=row.id,
-                nickname=row.nickname,
-                score=row.score,
-                final_stage=row.final_stage,
-                model_id=row.model_id,
-                total_frames=row.total_frames,
-                play_duration=row.play_duration,
-                created_at=row.created_at.isoformat() if row.created_at else "",
-                rank=offset + idx + 1,
-            )
-            for idx, row in enumerate(rows)
-        ]
-
-        return GamePlayRankingResponse(
-            rankings=rankings,
-            total=total,
-            page=page,
-            page_size=page_size,
-        )
+        return respond(result.all(), total)
 
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"랭킹 조회 중 오류가 발생했습니다: {str(e)}",
         )
+
+
+async def _rank_response(
+    db: AsyncSession,
+    score: int,
+    model_id: Optional[str],
+    neighbors: int,
+    entry: Optional[LeaderboardEntry] = None,
+) -> GamePlayRankResponse:
+    def items(position: Any) -> list[GamePlayRankingItem]:
+        return [_ranking_item(row, rank) for rank, row in position.neighbors]
+
+    overall = await locate(db, score, None, neighbors, entry)
+    response = GamePlayRankResponse(
+        id=entry.id if entry else None,
+        score=score,
+        model_id=model_id,
+        rank=overall.rank,
+        total=overall.total,
+        neighbors=items(overall),
+    )
+    if model_id:
+        by_model = await locate(db, score, model_id, neighbors, entry)
+        response.model_rank = by_model.rank
+        response.model_total = by_model.total
+        response.model_neighbors = items(by_model)
+    return response
+
+
+@router.get("/rank", response_model=GamePlayRankResponse)
+async def get_score_rank(
+    score: int = Query(..., description="순위를 확인할 점수"),
+    model_id: Optional[str] = Query(None, description="모델별 순위도 함께 조회"),
+    neighbors: int = Query(2, ge=0, le=10, description="앞뒤로 함께 반환할 항목 수"),
+    db: AsyncSession = Depends(get_db_session),
+) -> GamePlayRankResponse:
+    """
+    점수를 지금 제출했을 때의 순위를 조회합니다.
+
+    동점은 먼저 등록된 순서가 앞이므로, 같은 점수의 기존 기록들 바로 뒤 순위가 반환됩니다.
+    """
+    return await _rank_response(db, score, model_id or None, neighbors)
+
+
+@router.get("/{gameplay_id}/rank", response_model=GamePlayRankResponse)
+async def get_gameplay_rank(
+    gameplay_id: str,
+    neighbors: int = Query(2, ge=0, le=10, description="앞뒤로 함께 반환할 항목 수"),
+    db: AsyncSession = Depends(get_db_session),
+) -> GamePlayRankResponse:
+    """
+    저장된 게임 플레이의 전체 순위와 모델별 순위, 앞뒤 이웃을 조회합니다.
+    """
+    entry = leaderboard.get(gameplay_id) if leaderboard.ready else None
+    if entry is None:
+        result = await db.execute(select(*ranking_columns()).where(GamePlay.id == gameplay_id))
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="게임 플레이를 찾을 수 없습니다.")
+        entry = LeaderboardEntry.from_row(row)
+    return await _rank_response(db, entry.score, entry.model_id, neighbors, entry)
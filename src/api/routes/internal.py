@@ -0,0 +1,100 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import settings
+from ...db.pool import pool_telemetry
+from ...db.session import engine, get_db_session
+from ...db.slow_queries import slow_query_log
+from ...ingest.buffer import event_buffer
+from ...ingest.receipts import receipt_window
+from ...profiling.store import list_profiles, profile_path
+from ...ranking.leaderboard import leaderboard
+from ...ranking.response_cache import rankings_cache
+from ...replays.chunk_cache import replay_chunk_cache
+from ...security.auth_cache import ingest_auth
+from ...storage.backend import get_storage
+from ...storage.s3 import S3Storage
+
+
+async def require_internal_token(
+    token: str | None = Header(default=None, alias="X-Internal-Token"),
+) -> None:
+    if not settings.internal_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not token or not hmac.compare_digest(token, settings.internal_token):
+        raise HTTPException(status_code=403, detail="invalid internal token")
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    dependencies=[Depends(require_internal_token)],
+    include_in_schema=False,
+)
+
+
+@router.get("/leaderboard/check")
+async def check_leaderboard(db: AsyncSession = Depends(get_db_session)) -> dict:
+    if not leaderboard.ready:
+        raise HTTPException(status_code=409, detail="leaderboard index is not loaded")
+    return await leaderboard.check_consistency(db)
+
+
+@router.get("/cache/rankings")
+async def rankings_cache_stats() -> dict:
+    return rankings_cache.stats()
+
+
+@router.get("/events/buffer")
+async def event_buffer_stats() -> dict:
+    return event_buffer.stats()
+
+
+@router.get("/cache/ingest-auth")
+async def ingest_auth_cache_stats() -> dict:
+    return ingest_auth.stats()
+
+
+@router.get("/events/dedupe")
+async def event_dedupe_stats() -> dict:
+    return receipt_window.stats()
+
+
+@router.get("/cache/replay-chunks")
+async def replay_chunk_cache_stats() -> dict:
+    return replay_chunk_cache.stats()
+
+
+@router.get("/cache/presign")
+async def presign_cache_stats() -> dict:
+    storage = get_storage()
+    if not isinstance(storage, S3Storage):
+        return {"backend": settings.storage_backend}
+    return {"backend": settings.storage_backend, **(await storage.get_client()).presign_cache.stats()}
+
+
+@router.get("/db/pool")
+async def db_pool_stats() -> dict:
+    return pool_telemetry.stats(engine.pool)
+
+
+@router.get("/db/slow-queries")
+async def db_slow_queries(flagged: bool = False) -> dict:
+    return {**slow_query_log.stats(), "entries": slow_query_log.entries(flagged_only=flagged)}
+
+
+@router.get("/profiles")
+async def profiles() -> dict:
+    return {"profiles": list_profiles()}
+
+
+@router.get("/profiles/{name}")
+async def download_profile(name: str) -> FileResponse:
+    path = profile_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    media_type = "application/json" if path.suffix == ".json" else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=name)
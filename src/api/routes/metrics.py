@@ -0,0 +1,24 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response
+
+from ...config import settings
+from ...metrics.exposition import render_metrics
+from ...metrics.registry import CONTENT_TYPE
+
+
+async def require_metrics_token(authorization: str | None = Header(default=None)) -> None:
+    if not settings.metrics_token:
+        return
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token, settings.metrics_token):
+        raise HTTPException(status_code=401, detail="invalid metrics token")
+
+
+router = APIRouter(tags=["metrics"], include_in_schema=False)
+
+
+@router.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def metrics() -> Response:
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
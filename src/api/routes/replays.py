@@ -1,24 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...config import settings
 from ...db.models import Replay
 from ...db.session import get_db_session
-from ...storage.s3 import S3Client
+from ...replays.reader import chunks_between, has_chunk_index, read_slice
+from ...storage.backend import get_storage
+from ...storage.base import Storage
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/replays", tags=["replays"])
 
 
-@router.get("/{replay_id}")
-async def get_replay(replay_id: str, db: AsyncSession = Depends(get_db_session)) -> dict:
-    res = await db.execute(select(Replay).where(Replay.id == replay_id))
-    replay = res.scalar_one_or_none()
-    if not replay:
-        raise HTTPException(status_code=404, detail="replay not found")
-
-    key = replay.storage_url
-    s3 = S3Client()
-    signed = s3.presign_get(key)
+async def _replay_item(replay: Replay, storage: Storage) -> dict:
+    signed = await storage.presign_get(replay.storage_url)
     return {
         "id": replay.id,
         "session_id": replay.session_id,
@@ -34,3 +33,71 @@ async def get_replay(replay_id: str, db: AsyncSession = Depends(get_db_session))
     }
 
 
+@router.get("")
+async def get_replays(
+    ids: str = Query(..., description="쉼표로 구분한 리플레이 id 목록"),
+    db: AsyncSession = Depends(get_db_session),
+) -> dict:
+    """여러 리플레이의 메타데이터와 서명 URL 을 IN 조회 한 번으로 돌려줍니다."""
+    replay_ids = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+    if not replay_ids:
+        raise HTTPException(status_code=400, detail="ids is required")
+    if len(replay_ids) > settings.replay_batch_max_ids:
+        raise HTTPException(
+            status_code=400, detail=f"at most {settings.replay_batch_max_ids} ids per request"
+        )
+
+    res = await db.execute(select(Replay).where(Replay.id.in_(replay_ids)))
+    found = {replay.id: replay for replay in res.scalars()}
+    storage = get_storage()
+    return {
+        "replays": [await _replay_item(found[i], storage) for i in replay_ids if i in found],
+        "missing": [i for i in replay_ids if i not in found],
+    }
+
+
+@router.get("/{replay_id}")
+async def get_replay(replay_id: str, db: AsyncSession = Depends(get_db_session)) -> dict:
+    res = await db.execute(select(Replay).where(Replay.id == replay_id))
+    replay = res.scalar_one_or_none()
+    if not replay:
+        raise HTTPException(status_code=404, detail="replay not found")
+    return await _replay_item(replay, get_storage())
+
+
+@router.get("/{replay_id}/slice")
+async def get_replay_slice(
+    replay_id: str,
+    from_ms: int = Query(default=0, ge=0),
+    to_ms: int = Query(..., ge=0),
+    db: AsyncSession = Depends(get_db_session),
+) -> dict:
+    """[from_ms, to_ms] 구간의 이벤트만 돌려줍니다. 필요한 청크만 범위 요청으로 읽습니다."""
+    if to_ms < from_ms:
+        raise HTTPException(status_code=400, detail="to_ms must be >= from_ms")
+    res = await db.execute(select(Replay.storage_url).where(Replay.id == replay_id))
+    key = res.scalar_one_or_none()
+    if key is None:
+        raise HTTPException(status_code=404, detail="replay not found")
+
+    chunks = await chunks_between(db, replay_id, from_ms, to_ms)
+    if not chunks and not await has_chunk_index(db, replay_id):
+        # 빈 구간과 구별: 인덱스가 없으면 구간 조회를 할 수 없음 (전체 파일은 GET /replays/{id} 의 URL 로)
+        raise HTTPException(
+            status_code=409,
+            detail="replay has no chunk index; rebuild it to enable slicing or download the full file",
+        )
+    if len(chunks) > settings.replay_slice_max_chunks:
+        raise HTTPException(status_code=400, detail="requested range is too large")
+    try:
+        events = await read_slice(get_storage(), key, chunks, from_ms, to_ms)
+    except Exception:
+        logger.exception("failed to read replay %s slice [%d, %d]", replay_id, from_ms, to_ms)
+        raise HTTPException(status_code=502, detail="failed to read replay from storage")
+    return {
+        "id": replay_id,
+        "from_ms": from_ms,
+        "to_ms": to_ms,
+        "chunks": len(chunks),
+        "events": events,
+    }
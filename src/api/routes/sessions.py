@@ -1,28 +1,32 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...config import settings
-from ...db.models import Participant, Session
-from ...db.session import get_db_session
+from ...db.models import Participant, Session, uuid_pk
+from ...db.session import async_session_factory, get_db_session
+from ...replays.builder import build_replay_in_background
+from ...security.auth_cache import ingest_auth
 from ...security.ingest_token import sign_ingest_token
-from ..schemas import SessionStartRequest, SessionStartResponse, SessionEndRequest
+from ..schemas import (
+    SessionBootstrapRequest,
+    SessionBootstrapResponse,
+    SessionEndRequest,
+    SessionStartRequest,
+    SessionStartResponse,
+)
 
 router = APIRouter(prefix="/session", tags=["sessions"])
 
+INGEST_TOKEN_TTL_SECONDS = 3600
 
-@router.post("/start", response_model=SessionStartResponse)
-async def start_session(
-    body: SessionStartRequest,
-    db: AsyncSession = Depends(get_db_session),
-) -> SessionStartResponse:
-    stmt = select(Participant).where(Participant.id == body.participant_id)
-    res = await db.execute(stmt)
-    _ = res.scalar_one()
 
-    s = Session(
-        participant_id=body.participant_id,
+def _new_session(participant_id: str, body: SessionStartRequest) -> Session:
+    return Session(
+        id=uuid_pk(),
+        participant_id=participant_id,
         mode=body.mode,
         agent_skill=body.agent_skill,
         game_version=body.game_version,
@@ -30,15 +34,66 @@ async def start_session(
         seed=body.seed,
         started_at=datetime.now(tz=timezone.utc),
     )
+
+
+async def _participant_missing(db: AsyncSession, participant_id: str) -> bool:
+    return await db.get(Participant, participant_id) is None
+
+
+def _issue_token(session_id: str) -> str:
+    token = sign_ingest_token(settings.ingest_secret, session_id, ttl_seconds=INGEST_TOKEN_TTL_SECONDS)
+    ingest_auth.seed(token, session_id, INGEST_TOKEN_TTL_SECONDS)
+    return token
+
+
+@router.post("/start", response_model=SessionStartResponse)
+async def start_session(
+    body: SessionStartRequest,
+    db: AsyncSession = Depends(get_db_session),
+) -> SessionStartResponse:
+    # 참가자 존재는 SELECT 대신 sessions.participant_id FK 로 확인
+    s = _new_session(body.participant_id, body)
     db.add(s)
-    await db.commit()
-    token = sign_ingest_token(settings.ingest_secret, s.id, ttl_seconds=3600)
-    return SessionStartResponse(session_id=s.id, ingest_token=token)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        # FK 위반(참가자 없음)만 404 로, 그 밖의 무결성 오류는 그대로 올림
+        if not await _participant_missing(db, body.participant_id):
+            raise
+        raise HTTPException(status_code=404, detail="participant not found")
+    return SessionStartResponse(session_id=s.id, ingest_token=_issue_token(s.id))
+
+
+@router.post("/bootstrap", response_model=SessionBootstrapResponse)
+async def bootstrap_session(
+    body: SessionBootstrapRequest,
+    db: AsyncSession = Depends(get_db_session),
+) -> SessionBootstrapResponse:
+    """참가자 생성(또는 재사용)과 세션 시작을 한 트랜잭션으로 처리하고 수집 토큰까지 돌려줍니다."""
+    participant_id = body.participant_id
+    if participant_id is None:
+        participant_id = uuid_pk()
+        db.add(Participant(id=participant_id, created_at=datetime.now(tz=timezone.utc)))
+    s = _new_session(participant_id, body)
+    db.add(s)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        # 기존 참가자를 지정했는데 없는 경우만 404 로, 그 밖의 무결성 오류는 그대로 올림
+        if body.participant_id is None or not await _participant_missing(db, body.participant_id):
+            raise
+        raise HTTPException(status_code=404, detail="participant not found")
+    return SessionBootstrapResponse(
+        participant_id=participant_id, session_id=s.id, ingest_token=_issue_token(s.id)
+    )
 
 
 @router.post("/end")
 async def end_session(
     body: SessionEndRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
     stmt = select(Session).where(Session.id == body.session_id)
@@ -48,6 +103,9 @@ async def end_session(
     s.duration_ms = body.duration_ms
     s.result = body.result
     await db.commit()
+    ingest_auth.forget_session(body.session_id)
+    if settings.replay_build_on_session_end:
+        background_tasks.add_task(build_replay_in_background, async_session_factory, body.session_id)
     return {"ok": True}
 
 
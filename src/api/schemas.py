@@ -1,6 +1,8 @@
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, WrapValidator
+
+from .frame_validation import validate_frames
 
 
 class Participant(BaseModel):
@@ -21,6 +23,15 @@ class SessionStartResponse(BaseModel):
     ingest_token: str
 
 
+class SessionBootstrapRequest(SessionStartRequest):
+    # 없으면 새 참가자를 만듦
+    participant_id: Optional[str] = None
+
+
+class SessionBootstrapResponse(SessionStartResponse):
+    participant_id: str
+
+
 class SessionEndRequest(BaseModel):
     session_id: str
     duration_ms: Optional[int] = None
@@ -35,7 +46,7 @@ class EventsBatchItem(BaseModel):
 
 class EventsBatchRequest(BaseModel):
     session_id: str
-    request_id: Optional[str] = None
+    request_id: Optional[str] = Field(default=None, min_length=1, max_length=64)
     events: list[EventsBatchItem]
 
 
@@ -61,18 +72,32 @@ class GamePlayFrame(BaseModel):
     model_config = {"extra": "allow"}
 
 
-class GamePlaySubmitRequest(BaseModel):
+class GamePlaySubmitHeader(BaseModel):
+    # model_id 필드가 pydantic 보호 네임스페이스(model_)와 겹침
+    model_config = ConfigDict(protected_namespaces=())
+
     nickname: str
     score: int
     final_stage: int
     model_id: Optional[str] = None
     statistics: GamePlayStatistics
-    frames: list[GamePlayFrame]
+
+
+class GamePlaySubmitRequest(GamePlaySubmitHeader):
+    # OpenAPI 스키마는 GamePlayFrame 기준이지만, 검증은 컬럼 단위로 일괄 처리하며
+    # 실제 값은 프레임 dict 목록입니다 (frame_validation 참고)
+    frames: Annotated[list[GamePlayFrame], WrapValidator(validate_frames)]
 
 
 class GamePlaySubmitResponse(BaseModel):
+    # model_rank 등 model_ 접두사 필드가 pydantic 보호 네임스페이스와 겹침
+    model_config = ConfigDict(protected_namespaces=())
+
     id: str
     message: str
+    # with_rank=true 로 요청한 경우에만 응답에 포함됨
+    rank: Optional[int] = None
+    model_rank: Optional[int] = None
 
 
 class GamePlayRankingItem(BaseModel):
@@ -92,3 +117,19 @@ class GamePlayRankingResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+
+
+class GamePlayRankResponse(BaseModel):
+    # model_rank 등 model_ 접두사 필드가 pydantic 보호 네임스페이스와 겹침
+    model_config = ConfigDict(protected_namespaces=())
+
+    id: Optional[str] = None  # 점수로 조회한 경우 None
+    score: int
+    model_id: Optional[str] = None
+    rank: int
+    total: int
+    model_rank: Optional[int] = None
+    model_total: Optional[int] = None
+    neighbors: list[GamePlayRankingItem]
+    model_neighbors: Optional[list[GamePlayRankingItem]] = None
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,6 +11,9 @@ class Settings(BaseSettings):
 
     app_name: str = "rl-dda-demo-back"
 
+    # JSON 인코더: "auto" (orjson 이 있으면 orjson, 없으면 pydantic-core) | "orjson" | "pydantic" | "stdlib"
+    json_backend: Literal["auto", "orjson", "pydantic", "stdlib"] = "auto"
+
     # Database: mysql+aiomysql (pure-Python for Windows compatibility)
     db_host: str = "127.0.0.1"
     db_port: int = 3306
@@ -21,6 +24,23 @@ class Settings(BaseSettings):
     # Optional full DSN override
     database_url: Optional[str] = None
 
+    # DB 연결 풀 ("null" 이면 매번 새 연결; 외부 풀러 뒤에서 사용)
+    db_pool_class: Literal["queue", "null"] = "queue"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # 체크아웃 대기 한도 (초)
+    db_pool_recycle: int = -1  # 이 시간(초)보다 오래된 연결은 재연결 (-1: 끔)
+    db_pool_pre_ping: bool = True
+    db_pool_use_lifo: bool = False  # True 면 최근 반납 연결을 우선 사용 (유휴 연결이 자연히 정리됨)
+    db_pool_prewarm: int = 0  # 시작 시 미리 맺어 둘 연결 수
+
+    # 슬로 쿼리 로그 (0 이면 끔) 와 백그라운드 EXPLAIN
+    db_slow_query_ms: float = 500.0
+    db_slow_query_buffer_size: int = 200
+    db_slow_query_explain_rate: float = 0.2
+    db_slow_query_explain_interval_seconds: float = 300.0  # 같은 문장을 다시 EXPLAIN 하기까지 간격
+    db_slow_query_rows_flag: int = 10_000  # 예상 검사 행 수가 이 이상이면 표시
+
     # CORS - 명시적 허용 도메인
     cors_origins: List[str] = [
         "https://devfor.plus",
@@ -34,6 +54,84 @@ class Settings(BaseSettings):
 
     # Ingest token
     ingest_secret: str = "change-me"
+    # 검증된 토큰/세션 존재 여부 캐시 (최대 항목 수, 없는 세션을 기억하는 시간)
+    ingest_auth_cache_max_entries: int = 10_000
+    ingest_session_negative_ttl_seconds: float = 30.0
+
+    # Gameplay 제출 제한
+    gameplay_max_frames: int = 216_000  # 60fps 기준 1시간
+    gameplay_max_body_bytes: int = 64 * 1024 * 1024
+
+    # 랭킹: gameplay_counters 캐시 유지 시간 (다른 워커의 증가분 반영 주기)
+    gameplay_counter_cache_ttl_seconds: float = 5.0
+
+    # 랭킹: 응답 캐시 (TTL 0 이면 비활성화)
+    rankings_cache_ttl_seconds: float = 10.0
+    rankings_cache_max_entries: int = 512
+
+    # 랭킹: 프로세스 내 리더보드 인덱스
+    leaderboard_index_enabled: bool = False
+    leaderboard_resync_seconds: Optional[float] = None  # 다중 워커일 때 주기적 재적재
+
+    # 이벤트 write-behind 버퍼 (켜면 /api/events/batch 가 버퍼에 넣은 즉시 응답)
+    events_write_behind: bool = False
+    events_buffer_max_events: int = 50_000  # 가득 차면 enqueue 대기(backpressure)
+    events_flush_batch_size: int = 5_000  # 한 번에 INSERT 할 최대 이벤트 수
+    events_flush_interval_ms: int = 200  # 가장 오래된 이벤트의 최대 대기 시간
+    events_enqueue_timeout_ms: int = 1_000  # 초과하면 503
+    events_shutdown_timeout_seconds: float = 30.0  # 종료 시 버퍼를 비우는 최대 시간 (넘으면 남은 이벤트는 버림)
+
+    # 이벤트 배치 중복 제거 (request_id): 세션별 메모리 창 크기, 창을 유지할 최대 세션 수,
+    # event_batch_receipts 보관 기간 (scripts/prune_event_receipts.py)
+    events_dedupe_window: int = 256
+    events_dedupe_max_sessions: int = 10_000
+    events_receipt_retention_hours: float = 72.0
+
+    # 압축 요청 본문 (Content-Encoding: gzip/deflate/zstd) 을 받는 경로와 풀린 본문 최대 크기
+    request_decompression_paths: List[str] = ["/api/gameplay", "/api/gameplay/stream", "/api/events/batch"]
+    request_decompressed_max_bytes: int = 64 * 1024 * 1024
+
+    # 응답 압축 (Accept-Encoding: gzip). 이 크기 미만의 응답은 압축하지 않음
+    response_compression_enabled: bool = True
+    response_compression_min_bytes: int = 1024
+    response_compression_level: int = 6
+
+    # 내부(운영용) 엔드포인트 토큰 - 설정하지 않으면 /internal 비활성화
+    internal_token: Optional[str] = None
+
+    # 메트릭: /metrics (Prometheus 텍스트 포맷). 토큰을 두면 Authorization: Bearer 로 인증
+    metrics_enabled: bool = False
+    metrics_token: Optional[str] = None
+    metrics_max_statements: int = 500  # 구분해서 집계할 정규화 SQL 문장 수 (넘치면 "other")
+
+    # 프로파일링: 선택된 요청만 스택 샘플링 (끄면 미들웨어를 붙이지 않음)
+    profiling_enabled: bool = False
+    profiling_routes: List[str] = []  # 경로 템플릿 (예: "/api/gameplay"). 비우면 모든 라우트
+    profiling_sample_rate: float = 0.0
+    profiling_secret: Optional[str] = None  # X-Profile 헤더 토큰 서명 키
+    profiling_interval_ms: float = 5.0
+    profiling_format: Literal["collapsed", "speedscope"] = "collapsed"
+    profiling_max_concurrent: int = 2
+    profiling_output_dir: str = "./var/profiles"
+    profiling_max_files: int = 200
+    profiling_max_bytes: int = 50 * 1024 * 1024
+    profiling_retention_hours: float = 24.0
+
+    # 리플레이: 세션 종료 시 이벤트를 리플레이 파일로 압축 (scripts/build_replays.py 로도 실행)
+    replay_build_on_session_end: bool = False
+    replay_prune_events: bool = False  # 리플레이 업로드 후 원본 events 행 삭제
+    replay_chunk_max_events: int = 2_000
+    replay_chunk_max_span_ms: int = 10_000
+    replay_read_batch_size: int = 5_000  # events keyset 조회 단위
+    replay_chunk_cache_max_bytes: int = 64 * 1024 * 1024  # 구간 조회용 청크 캐시 크기
+    replay_slice_max_chunks: int = 64  # 구간 조회 한 번에 읽을 최대 청크 수
+    replay_batch_max_ids: int = 100  # GET /api/replays?ids= 최대 개수
+
+    # Storage backend: "s3" (S3/MinIO) | "local" (개발용 파일 시스템)
+    storage_backend: Literal["s3", "local"] = "s3"
+    storage_local_root: str = "./var/storage"
+    storage_max_workers: int = 8  # 블로킹 저장소 호출용 전용 스레드 풀 크기
+    storage_multipart_part_bytes: int = 8 * 1024 * 1024  # multipart 파트 / 범위 읽기 단위 (S3 최소 5MiB)
 
     # Storage (S3/MinIO)
     s3_endpoint_url: Optional[str] = None
@@ -41,6 +139,9 @@ class Settings(BaseSettings):
     s3_access_key_id: Optional[str] = None
     s3_secret_access_key: Optional[str] = None
     s3_bucket: Optional[str] = None
+    # presigned URL 캐시: 남은 수명이 이 비율 이상이면 같은 URL 재사용
+    s3_presign_reuse_ratio: float = 0.5
+    s3_presign_cache_max_entries: int = 10_000
 
     @property
     def sqlalchemy_dsn(self) -> str:
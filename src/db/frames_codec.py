@@ -0,0 +1,211 @@
+"""
+게임 플레이 프레임 데이터용 컬럼형(struct-of-arrays) 바이너리 코덱
+
+프레임마다 같은 8개 키를 반복하는 JSON 대신, 필드별 타입 배열로 저장합니다.
+
+레이아웃 (v1)::
+
+    b"GPF" | version(u8) | zlib(body)
+
+    body = frame_count(u32)
+         | 고정 필드 8개 x [typecode(u8) | flags(u8) | nbytes(u32) | raw bytes]
+         | extras_len(u32) | extras JSON
+
+- 정수 컬럼은 값 범위에 맞는 가장 작은 타입(b/h/i/q)을 고릅니다.
+- ``frame_number``, ``player_score`` 는 델타 인코딩 후 저장합니다.
+- 좌표는 float32 로 손실 없이 표현되면 float32, 아니면 float64 로 저장합니다.
+- 고정 필드 외의 추가 필드는 키 카탈로그 + 키별 값 목록으로 저장합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Iterable, Sequence
+
+FORMAT_MAGIC = b"GPF"
+FORMAT_VERSION = 1
+
+INT_FIELDS = (
+    "frame_number",
+    "player_lives",
+    "player_score",
+    "current_weapon",
+    "input_left",
+    "input_right",
+)
+FLOAT_FIELDS = ("player_x", "player_y")
+CORE_FIELDS = (
+    "frame_number",
+    "player_x",
+    "player_y",
+    "player_lives",
+    "player_score",
+    "current_weapon",
+    "input_left",
+    "input_right",
+)
+DELTA_FIELDS = frozenset({"frame_number", "player_score"})
+
+_FLAG_DELTA = 0x01
+_INT_TYPECODES = (
+    ("b", -(2**7), 2**7 - 1),
+    ("h", -(2**15), 2**15 - 1),
+    ("i", -(2**31), 2**31 - 1),
+    ("q", -(2**63), 2**63 - 1),
+)
+_COLUMN_HEADER = struct.Struct("<BBI")
+_U32 = struct.Struct("<I")
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class FrameCodecError(ValueError):
+    """프레임 데이터를 인코딩/디코딩할 수 없을 때 발생합니다."""
+
+
+def _to_bytes(arr: array) -> bytes:
+    if _BIG_ENDIAN:
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_bytes(typecode: str, raw: bytes) -> array:
+    arr = array(typecode)
+    arr.frombytes(raw)
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr
+
+
+def _delta(values: Sequence[int]) -> list[int]:
+    out = list(values)
+    for i in range(len(out) - 1, 0, -1):
+        out[i] -= out[i - 1]
+    return out
+
+
+def _undelta(values: Iterable[int]) -> list[int]:
+    out: list[int] = []
+    acc = 0
+    for v in values:
+        acc += v
+        out.append(acc)
+    return out
+
+
+def _pack_int_column(values: Sequence[int], delta: bool) -> tuple[str, int, bytes]:
+    data = _delta(values) if delta else values
+    lo = min(data, default=0)
+    hi = max(data, default=0)
+    for typecode, tmin, tmax in _INT_TYPECODES:
+        if tmin <= lo and hi <= tmax:
+            return typecode, _FLAG_DELTA if delta else 0, _to_bytes(array(typecode, data))
+    if delta:
+        # 값은 64비트 범위여도 차분은 넘칠 수 있음 (예: -2**63+1 다음 2**63-1) -> 원래 값으로 저장
+        return _pack_int_column(values, delta=False)
+    raise FrameCodecError("integer frame column is out of 64-bit range")
+
+
+def _pack_float_column(values: Sequence[float]) -> tuple[str, int, bytes]:
+    packed = array("f", values)
+    if packed.tolist() != list(values):
+        packed = array("d", values)
+    return packed.typecode, 0, _to_bytes(packed)
+
+
+def encode_frames(frames: Sequence[dict[str, Any]]) -> bytes:
+    """프레임 dict 목록을 컬럼형 바이너리로 인코딩합니다."""
+    count = len(frames)
+    parts: list[bytes] = [_U32.pack(count)]
+
+    try:
+        for field in CORE_FIELDS:
+            column = [frame[field] for frame in frames]
+            if field in FLOAT_FIELDS:
+                typecode, flags, raw = _pack_float_column(column)
+            else:
+                typecode, flags, raw = _pack_int_column(column, field in DELTA_FIELDS)
+            parts.append(_COLUMN_HEADER.pack(ord(typecode), flags, len(raw)))
+            parts.append(raw)
+    except KeyError as e:
+        raise FrameCodecError(f"frame is missing field {e.args[0]!r}") from e
+    except (TypeError, OverflowError) as e:
+        raise FrameCodecError(str(e)) from e
+
+    # 추가 필드: 키 카탈로그(첫 등장 순서) + 키별 값 목록
+    # 모든 프레임에 존재하지 않는 키는 등장한 프레임 인덱스 목록을 함께 저장합니다.
+    catalog: dict[str, int] = {}
+    values: list[list[Any]] = []
+    present: list[list[int]] = []
+    for idx, frame in enumerate(frames):
+        if len(frame) == len(CORE_FIELDS):
+            continue
+        for key, value in frame.items():
+            if key in CORE_FIELDS:
+                continue
+            slot = catalog.get(key)
+            if slot is None:
+                slot = catalog[key] = len(values)
+                values.append([])
+                present.append([])
+            values[slot].append(value)
+            present[slot].append(idx)
+
+    extras = b""
+    if catalog:
+        extras = json.dumps(
+            {
+                "keys": list(catalog),
+                "values": values,
+                "present": [None if len(p) == count else p for p in present],
+            },
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+    parts.append(_U32.pack(len(extras)))
+    parts.append(extras)
+
+    body = zlib.compress(b"".join(parts), 6)
+    return FORMAT_MAGIC + bytes((FORMAT_VERSION,)) + body
+
+
+def decode_frames(blob: bytes) -> list[dict[str, Any]]:
+    """``encode_frames`` 결과를 기존 JSON 형태(프레임 dict 목록)로 복원합니다."""
+    if blob[:3] != FORMAT_MAGIC:
+        raise FrameCodecError("not a gameplay frame blob")
+    version = blob[3]
+    if version != FORMAT_VERSION:
+        raise FrameCodecError(f"unsupported frame blob version: {version}")
+
+    body = zlib.decompress(blob[4:])
+    (count,) = _U32.unpack_from(body, 0)
+    offset = _U32.size
+
+    columns: list[list[Any]] = []
+    for _field in CORE_FIELDS:
+        typecode, flags, nbytes = _COLUMN_HEADER.unpack_from(body, offset)
+        offset += _COLUMN_HEADER.size
+        column = _from_bytes(chr(typecode), body[offset : offset + nbytes]).tolist()
+        offset += nbytes
+        if flags & _FLAG_DELTA:
+            column = _undelta(column)
+        columns.append(column)
+
+    frames = [dict(zip(CORE_FIELDS, row)) for row in zip(*columns)]
+    if len(frames) != count:
+        raise FrameCodecError("frame blob is truncated")
+
+    (extras_len,) = _U32.unpack_from(body, offset)
+    offset += _U32.size
+    if extras_len:
+        extras = json.loads(body[offset : offset + extras_len].decode("utf-8"))
+        for key, vals, present in zip(extras["keys"], extras["values"], extras["present"]):
+            indices = range(count) if present is None else present
+            for idx, value in zip(indices, vals):
+                frames[idx][key] = value
+
+    return frames
@@ -0,0 +1,102 @@
+"""
+게임 플레이 프레임 저장/조회 헬퍼
+
+프레임은 ``gameplay_frames`` 테이블에 고정 크기 구간(청크) 단위로 나뉘어 저장되며,
+각 청크는 ``frames_codec`` 으로 인코딩됩니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Optional, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .frames_codec import decode_frames, encode_frames
+from .models import GamePlayFrameChunk
+
+# 60fps 기준 1분 분량
+FRAME_CHUNK_SIZE = 3600
+
+
+def iter_frame_chunks(
+    frames: Sequence[dict[str, Any]],
+    chunk_size: int = FRAME_CHUNK_SIZE,
+    start_index: int = 0,
+) -> Iterator[dict[str, Any]]:
+    """프레임 목록을 ``gameplay_frames`` 행(dict) 단위로 잘라 인코딩합니다."""
+    for offset in range(0, len(frames), chunk_size):
+        chunk = frames[offset : offset + chunk_size]
+        yield {
+            "chunk_index": start_index + offset // chunk_size,
+            "frame_start": chunk[0]["frame_number"],
+            "frame_end": chunk[-1]["frame_number"],
+            "frame_count": len(chunk),
+            "data": encode_frames(chunk),
+        }
+
+
+def build_frame_chunks(
+    frames: Sequence[dict[str, Any]], chunk_size: int = FRAME_CHUNK_SIZE
+) -> list[GamePlayFrameChunk]:
+    return [GamePlayFrameChunk(**row) for row in iter_frame_chunks(frames, chunk_size)]
+
+
+class FrameChunkWriter:
+    """프레임을 순서대로 받아 청크가 찰 때마다 인코딩해 두었다가 ``write`` 에서 한 번에 기록합니다.
+
+    인코딩된 청크만 들고 있으므로 원본 프레임보다 메모리를 훨씬 적게 쓰고, 프레임을 받는 동안에는
+    DB 연결을 잡지 않습니다. ORM 객체를 만들지 않고 Core INSERT 로 기록합니다.
+    """
+
+    def __init__(self, chunk_size: int = FRAME_CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+        self.frame_count = 0
+        self._pending: list[dict[str, Any]] = []
+        self._rows: list[dict[str, Any]] = []
+
+    def add(self, frames: Sequence[dict[str, Any]]) -> None:
+        self._pending.extend(frames)
+        self.frame_count += len(frames)
+        while len(self._pending) >= self.chunk_size:
+            self._encode(self._pending[: self.chunk_size])
+            del self._pending[: self.chunk_size]
+
+    async def write(self, db: AsyncSession, gameplay_id: str) -> None:
+        if self._pending:
+            self._encode(self._pending)
+            self._pending = []
+        if self._rows:
+            await db.execute(
+                insert(GamePlayFrameChunk),
+                [{"gameplay_id": gameplay_id, **row} for row in self._rows],
+            )
+
+    def _encode(self, frames: Sequence[dict[str, Any]]) -> None:
+        self._rows.extend(iter_frame_chunks(frames, self.chunk_size, len(self._rows)))
+
+
+async def load_frames(
+    db: AsyncSession,
+    gameplay_id: str,
+    frame_from: Optional[int] = None,
+    frame_to: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """게임 플레이의 프레임을 디코딩해 반환합니다. 범위를 주면 겹치는 청크만 읽습니다."""
+    stmt = select(GamePlayFrameChunk.data).where(
+        GamePlayFrameChunk.gameplay_id == gameplay_id
+    )
+    if frame_from is not None:
+        stmt = stmt.where(GamePlayFrameChunk.frame_end >= frame_from)
+    if frame_to is not None:
+        stmt = stmt.where(GamePlayFrameChunk.frame_start <= frame_to)
+    result = await db.execute(stmt.order_by(GamePlayFrameChunk.chunk_index))
+
+    frames: list[dict[str, Any]] = []
+    for data in result.scalars():
+        frames.extend(decode_frames(data))
+    if frame_from is not None or frame_to is not None:
+        lo = frame_from if frame_from is not None else float("-inf")
+        hi = frame_to if frame_to is not None else float("inf")
+        frames = [f for f in frames if lo <= f["frame_number"] <= hi]
+    return frames
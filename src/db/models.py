@@ -12,13 +12,16 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    text,
 )
-from sqlalchemy.dialects.mysql import CHAR
+from sqlalchemy.dialects.mysql import CHAR, LONGBLOB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .frames_codec import decode_frames
 
 
 def uuid_pk() -> str:
@@ -73,7 +76,7 @@ class Event(Base):
     __tablename__ = "events"
 
     id: Mapped[int] = mapped_column(
-        BigInteger().with_variant(BigInteger, "mysql"),
+        BigInteger().with_variant(Integer, "sqlite"),  # sqlite 는 INTEGER PK 만 자동 증가
         primary_key=True,
         autoincrement=True,
     )
@@ -89,6 +92,21 @@ class Event(Base):
     session: Mapped[Session] = relationship(back_populates="events")
 
 
+class EventBatchReceipt(Base):
+    """기록한 이벤트 배치의 request_id (재시도 배치 중복 제거용)"""
+
+    __tablename__ = "event_batch_receipts"
+
+    session_id: Mapped[str] = mapped_column(
+        CHAR(32), ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True
+    )
+    request_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
 class Replay(Base):
     __tablename__ = "replays"
 
@@ -110,6 +128,22 @@ class Replay(Base):
     session: Mapped[Session] = relationship(back_populates="replay")
 
 
+class ReplayChunk(Base):
+    """리플레이 파일 안 청크별 시간 구간과 바이트 위치 (구간 조회용 인덱스)"""
+
+    __tablename__ = "replay_chunks"
+
+    replay_id: Mapped[str] = mapped_column(
+        CHAR(32), ForeignKey("replays.id", ondelete="CASCADE"), primary_key=True
+    )
+    chunk_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    t_start: Mapped[int] = mapped_column(Integer, nullable=False)
+    t_end: Mapped[int] = mapped_column(Integer, nullable=False)
+    byte_offset: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    byte_length: Mapped[int] = mapped_column(Integer, nullable=False)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
 class Experiment(Base):
     __tablename__ = "experiments"
 
@@ -156,14 +190,56 @@ class GamePlay(Base):
     hits: Mapped[Optional[int]] = mapped_column(Integer)
     deaths: Mapped[Optional[int]] = mapped_column(Integer)
 
-    # 프레임 데이터는 JSON으로 저장 (LONGTEXT 사용)
-    frames_data: Mapped[Optional[list[dict[str, Any]]]] = mapped_column(JSON)
-
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True
     )
 
     __table_args__ = (
-        Index("ix_gameplays_score_created", "score", "created_at"),
-        Index("ix_gameplays_model_score", "model_id", "score"),
+        # 랭킹 정렬(ranking_order)과 같은 순서: 커서/OFFSET 조회 모두 정렬 없이 인덱스 순서로 읽음
+        Index("ix_gameplays_ranking", text("score DESC"), "created_at", "id"),
+        Index("ix_gameplays_model_ranking", "model_id", text("score DESC"), "created_at", "id"),
     )
+
+    # 프레임 데이터는 gameplay_frames 테이블에 분리 저장
+    # lazy="raise": 명시적으로 로드(selectinload 등)하지 않으면 절대 읽지 않음
+    frame_chunks: Mapped[list[GamePlayFrameChunk]] = relationship(
+        back_populates="gameplay",
+        order_by="GamePlayFrameChunk.chunk_index",
+        cascade="all, delete-orphan",
+        lazy="raise",
+    )
+
+    @property
+    def frames_data(self) -> list[dict[str, Any]]:
+        """로드된 프레임 청크를 기존 JSON 형태(프레임 dict 목록)로 디코딩합니다."""
+        frames: list[dict[str, Any]] = []
+        for chunk in self.frame_chunks:
+            frames.extend(decode_frames(chunk.data))
+        return frames
+
+
+class GamePlayCounter(Base):
+    """model_id 별 게임 플레이 수 (전역 합계는 model_id="" 행)"""
+
+    __tablename__ = "gameplay_counters"
+
+    model_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class GamePlayFrameChunk(Base):
+    __tablename__ = "gameplay_frames"
+
+    gameplay_id: Mapped[str] = mapped_column(
+        CHAR(32), ForeignKey("gameplays.id", ondelete="CASCADE"), primary_key=True
+    )
+    chunk_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    frame_start: Mapped[int] = mapped_column(Integer, nullable=False)
+    frame_end: Mapped[int] = mapped_column(Integer, nullable=False)
+    frame_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # frames_codec 으로 인코딩된 컬럼형 바이너리
+    data: Mapped[bytes] = mapped_column(
+        LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False
+    )
+
+    gameplay: Mapped[GamePlay] = relationship(back_populates="frame_chunks")
@@ -0,0 +1,165 @@
+"""
+DB 연결 풀 설정과 텔레메트리
+
+풀 종류/크기/타임아웃/재활용/pre-ping 을 ``Settings`` 에서 받아 엔진 인자로 만들고,
+SQLAlchemy 풀 이벤트로 체크아웃/생성/무효화/pre-ping 실패를 집계합니다.
+체크아웃 대기 시간은 풀 이벤트로 알 수 없으므로 ``_do_get`` 을 감싼 풀 클래스에서 잽니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# 체크아웃 대기 시간 히스토그램 경계 (초, 이하)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolTelemetry:
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.pre_ping_failures = 0
+        self.timeouts = 0
+        self.wait_counts = [0] * (len(WAIT_BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        self.wait_counts[bisect_left(WAIT_BUCKETS, seconds)] += 1
+        self.wait_sum += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def attach(self, pool: Pool) -> None:
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "close", self._on_close)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        event.listen(pool, "soft_invalidate", self._on_soft_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, record: Any) -> None:
+        self.connects += 1
+
+    def _on_close(self, dbapi_connection: Any, record: Any) -> None:
+        self.closes += 1
+
+    def _on_checkout(self, dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection: Any, record: Any) -> None:
+        self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection: Any, record: Any, exception: Any) -> None:
+        self.invalidations += 1
+        # pre-ping 이 끊긴 연결을 발견하면 InvalidatePoolError 로 무효화됨
+        if isinstance(exception, exc.InvalidatePoolError):
+            self.pre_ping_failures += 1
+
+    def _on_soft_invalidate(self, dbapi_connection: Any, record: Any, exception: Any) -> None:
+        self.soft_invalidations += 1
+
+    def wait_histogram(self) -> list[tuple[str, int]]:
+        """누적(cumulative) 버킷 목록: [(le, count), ..., ("+Inf", total)]."""
+        buckets: list[tuple[str, int]] = []
+        total = 0
+        for bound, count in zip((*map(str, WAIT_BUCKETS), "+Inf"), self.wait_counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def stats(self, pool: Pool) -> dict[str, Any]:
+        waits = sum(self.wait_counts)
+        stats: dict[str, Any] = {
+            "pool_class": type(pool).__name__,
+            "status": pool.status(),
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "closes": self.closes,
+            "invalidations": self.invalidations,
+            "soft_invalidations": self.soft_invalidations,
+            "pre_ping_failures": self.pre_ping_failures,
+            "timeouts": self.timeouts,
+            "wait_seconds": {
+                "count": waits,
+                "sum": self.wait_sum,
+                "avg": self.wait_sum / waits if waits else 0.0,
+                "max": self.wait_max,
+                "buckets": dict(self.wait_histogram()),
+            },
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        return stats
+
+
+pool_telemetry = PoolTelemetry()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간(새 연결 생성 포함)과 타임아웃을 ``pool_telemetry`` 에 기록하는 풀."""
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_telemetry.timeouts += 1
+            raise
+        finally:
+            pool_telemetry.observe_wait(time.perf_counter() - started)
+
+
+def engine_options() -> dict[str, Any]:
+    """``create_async_engine`` 에 넘길 풀 관련 인자."""
+    if settings.db_pool_class == "null":
+        # 요청마다 연결을 새로 맺음 (외부 풀러/RDS Proxy 뒤에서 사용)
+        return {"poolclass": NullPool, "pool_pre_ping": settings.db_pool_pre_ping}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+    }
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> int:
+    """연결 ``connections`` 개를 미리 맺어 풀에 넣어 둡니다. 실제로 맺은 수를 돌려줍니다."""
+    if connections <= 0 or isinstance(engine.pool, NullPool):
+        return 0
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)), return_exceptions=True
+    )
+    opened = [conn for conn in results if not isinstance(conn, BaseException)]
+    for conn in opened:
+        await conn.close()
+    failed = len(results) - len(opened)
+    if failed:
+        logger.warning("pool prewarm: %d of %d connections failed", failed, connections)
+    return len(opened)
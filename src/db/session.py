@@ -1,11 +1,31 @@
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from ..config import settings
-
-
-engine: AsyncEngine = create_async_engine(settings.sqlalchemy_dsn, pool_pre_ping=True)
+from ..serialization import dumps_str, loads
+from .pool import engine_options, pool_telemetry
+from .slow_queries import slow_query_log
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection: Any, record: Any) -> None:
+    # SQLite 는 연결마다 켜야 FK 를 검사함 (참가자/세션 존재 확인을 FK 에 맡기는 라우트가 있음)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+engine: AsyncEngine = create_async_engine(
+    settings.sqlalchemy_dsn,
+    json_serializer=dumps_str,
+    json_deserializer=loads,
+    **engine_options(),
+)
+pool_telemetry.attach(engine.pool)
+slow_query_log.install(engine)
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
 async_session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
 
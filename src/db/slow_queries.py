@@ -0,0 +1,251 @@
+"""
+슬로 쿼리 로그와 자동 EXPLAIN
+
+``db_slow_query_ms`` 보다 오래 걸린 문장을 바인드 파라미터 형태(값이 아닌 타입), 호출 라우트,
+반환/영향 행 수와 함께 로그로 남기고 최근 ``db_slow_query_buffer_size`` 건을 링 버퍼에 보관합니다.
+
+SELECT/UPDATE/DELETE 중 ``db_slow_query_explain_rate`` 확률로 뽑힌 문장은 같은 파라미터로
+백그라운드에서 EXPLAIN 을 실행해 실행 계획을 항목에 붙입니다. 같은 정규화 문장은
+``db_slow_query_explain_interval_seconds`` 에 한 번만 EXPLAIN 합니다.
+
+계획에서 다음을 자동으로 표시합니다 (MySQL ``EXPLAIN`` / SQLite ``EXPLAIN QUERY PLAN``).
+
+- ``full_scan:<table>``: 테이블 전체 스캔 (MySQL type=ALL, SQLite ``SCAN t``)
+- ``full_index_scan:<table>``: 인덱스 전체 스캔 (MySQL type=index, SQLite ``SCAN t USING ... INDEX``)
+- ``filesort`` / ``temporary``: 정렬/임시 테이블 (MySQL Extra, SQLite ``USE TEMP B-TREE``)
+- ``large_estimate:<table>``: 예상 검사 행 수가 ``db_slow_query_rows_flag`` 이상
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..config import settings
+from ..metrics.db import fingerprint
+from ..metrics.http import current_route
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+# EXPLAIN 자신은 기록하지 않도록 붙이는 실행 옵션
+SKIP_OPTION = "slow_query_log"
+MAX_PENDING_EXPLAINS = 4
+STATEMENT_LOG_CHARS = 2_000
+
+
+@dataclass
+class SlowQuery:
+    at: float  # epoch seconds
+    duration_ms: float
+    route: Optional[str]
+    statement: str
+    fingerprint: str
+    parameters: str
+    rows: Optional[int]
+    executemany: bool
+    plan: Optional[list[dict[str, Any]]] = None
+    flags: list[str] = field(default_factory=list)
+    explain_error: Optional[str] = None
+
+
+def _type_runs(values: Any) -> str:
+    """값 타입을 나열하되 연속된 같은 타입은 ``int x100`` 처럼 묶습니다."""
+    runs: list[list[Any]] = []
+    for value in values:
+        name = type(value).__name__
+        if runs and runs[-1][0] == name:
+            runs[-1][1] += 1
+        else:
+            runs.append([name, 1])
+    return ", ".join(name if count == 1 else f"{name} x{count}" for name, count in runs)
+
+
+def _shape(parameters: Any) -> str:
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + _type_runs(parameters) + ")"
+    return type(parameters).__name__
+
+
+def parameter_shape(parameters: Any, executemany: bool) -> str:
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} x {_shape(rows[0])}" if rows else "0 x ()"
+    return _shape(parameters)
+
+
+def _plan_flags(dialect: str, plan: list[dict[str, Any]]) -> list[str]:
+    flags: list[str] = []
+    if dialect == "mysql":
+        for row in plan:
+            table = row.get("table") or "?"
+            access = (row.get("type") or "").upper()
+            extra = row.get("Extra") or ""
+            if access == "ALL":
+                flags.append(f"full_scan:{table}")
+            elif access == "INDEX":
+                flags.append(f"full_index_scan:{table}")
+            if "Using filesort" in extra:
+                flags.append("filesort")
+            if "Using temporary" in extra:
+                flags.append("temporary")
+            if (row.get("rows") or 0) >= settings.db_slow_query_rows_flag:
+                flags.append(f"large_estimate:{table}")
+    elif dialect == "sqlite":
+        for row in plan:
+            detail = row.get("detail") or ""
+            if detail.startswith("SCAN "):
+                table = detail.split()[1]
+                flags.append(f"full_index_scan:{table}" if " INDEX" in detail else f"full_scan:{table}")
+            if "USE TEMP B-TREE" in detail:
+                flags.append("filesort")
+    return list(dict.fromkeys(flags))
+
+
+class SlowQueryLog:
+    def __init__(self) -> None:
+        self._entries: deque[SlowQuery] = deque(maxlen=settings.db_slow_query_buffer_size)
+        self._explained_at: dict[str, float] = {}  # fingerprint -> 마지막 EXPLAIN 시각
+        self._tasks: set[asyncio.Task] = set()
+        self._engine: Optional[AsyncEngine] = None
+        self.slow_queries = 0
+        self.explains = 0
+        self.explain_failures = 0
+
+    def install(self, engine: AsyncEngine) -> None:
+        target = engine.sync_engine
+        if event.contains(target, "after_cursor_execute", self._after_cursor_execute):
+            return
+        self._engine = engine
+        event.listen(target, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(target, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        context._slow_query_started = time.perf_counter()
+
+    def _after_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        started: Optional[float] = getattr(context, "_slow_query_started", None)
+        if started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        threshold = settings.db_slow_query_ms
+        if threshold <= 0 or elapsed_ms < threshold:
+            return
+        if context.execution_options.get(SKIP_OPTION) is False:
+            return
+        self._record(statement, parameters, executemany, elapsed_ms, cursor.rowcount)
+
+    def _record(
+        self, statement: str, parameters: Any, executemany: bool, elapsed_ms: float, rowcount: int
+    ) -> None:
+        sql = fingerprint(statement)
+        entry = SlowQuery(
+            at=time.time(),
+            duration_ms=round(elapsed_ms, 3),
+            route=current_route(),
+            statement=statement[:STATEMENT_LOG_CHARS],
+            fingerprint=sql,
+            parameters=parameter_shape(parameters, executemany),
+            rows=rowcount if rowcount is not None and rowcount >= 0 else None,
+            executemany=executemany,
+        )
+        if self._entries.maxlen != settings.db_slow_query_buffer_size:
+            self._entries = deque(self._entries, maxlen=settings.db_slow_query_buffer_size)
+        self._entries.append(entry)
+        self.slow_queries += 1
+        logger.warning(
+            "slow query %.1fms route=%s rows=%s params=%s: %s",
+            entry.duration_ms, entry.route or "-", entry.rows, entry.parameters, entry.fingerprint,
+        )
+        if not executemany and self._should_explain(sql):
+            self._schedule_explain(entry, statement, parameters)
+
+    def _should_explain(self, sql: str) -> bool:
+        if not sql.lstrip("( ").upper().startswith(EXPLAINABLE):
+            return False
+        if random.random() >= settings.db_slow_query_explain_rate:
+            return False
+        if len(self._tasks) >= MAX_PENDING_EXPLAINS:
+            return False
+        now = time.monotonic()
+        last = self._explained_at.get(sql)
+        if last is not None and now - last < settings.db_slow_query_explain_interval_seconds:
+            return False
+        if len(self._explained_at) >= settings.metrics_max_statements:
+            self._explained_at.clear()
+        self._explained_at[sql] = now
+        return True
+
+    def _schedule_explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # 이벤트 루프 밖(동기 엔진/스크립트)에서는 건너뜀
+            return
+        task = loop.create_task(self._explain(entry, statement, parameters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        if self._engine is None:
+            return
+        dialect = self._engine.dialect.name
+        prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+        try:
+            async with self._engine.connect() as conn:
+                result = await conn.exec_driver_sql(
+                    prefix + statement, parameters, execution_options={SKIP_OPTION: False}
+                )
+                plan = [dict(row) for row in result.mappings().all()]
+                await conn.rollback()
+        except Exception as exc:
+            self.explain_failures += 1
+            entry.explain_error = f"{type(exc).__name__}: {exc}"[:500]
+            logger.info("EXPLAIN failed for slow query %s: %s", entry.fingerprint, entry.explain_error)
+            return
+        self.explains += 1
+        entry.plan = plan
+        entry.flags = _plan_flags(dialect, plan)
+        if entry.flags:
+            logger.warning("slow query plan flags %s: %s", ",".join(entry.flags), entry.fingerprint)
+
+    async def stop(self) -> None:
+        """진행 중인 EXPLAIN 을 취소합니다 (연결 풀을 닫기 전에 호출)."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def entries(self, flagged_only: bool = False) -> list[dict[str, Any]]:
+        entries = reversed(self._entries)  # 최신 먼저
+        return [asdict(e) for e in entries if e.flags or not flagged_only]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._explained_at.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "threshold_ms": settings.db_slow_query_ms,
+            "slow_queries": self.slow_queries,
+            "buffered": len(self._entries),
+            "explains": self.explains,
+            "explain_failures": self.explain_failures,
+            "pending_explains": len(self._tasks),
+        }
+
+
+slow_query_log = SlowQueryLog()
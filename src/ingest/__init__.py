@@ -0,0 +1,3 @@
+"""Event ingestion package."""
+
+
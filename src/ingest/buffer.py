@@ -0,0 +1,297 @@
+"""
+이벤트 write-behind 버퍼
+
+``/api/events/batch`` 요청마다 트랜잭션을 만들지 않고, 받은 이벤트를 프로세스 내
+버퍼에 쌓아 두었다가 백그라운드 작업이 크기/시간 기준으로 모아 다중 행 INSERT 로
+기록합니다.
+
+전달 보장 (at-least-once):
+- 버퍼에 들어간 이벤트는 커밋에 성공할 때까지 재시도합니다. 커밋 응답 유실 등으로
+  같은 이벤트가 두 번 기록될 수 있습니다.
+- 정상 종료(lifespan shutdown) 시 버퍼를 모두 비운 뒤 종료합니다. DB 에 닿지 않아
+  ``events_shutdown_timeout_seconds`` 안에 비우지 못하면 남은 이벤트는 버리고 집계합니다.
+- 프로세스가 강제 종료되면 아직 기록되지 않은 이벤트는 유실됩니다. 유실이 허용되지
+  않는 클라이언트는 write-behind 를 끈 동기 모드를 사용해야 합니다.
+- 무결성 오류(FK 등)로 기록할 수 없는 배치는 재시도하지 않고 버린 뒤 집계합니다.
+- ``request_id`` 가 있는 배치는 영수증과 함께 기록되므로 재시도 중복이 생기지 않습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import settings
+from ..db.session import async_session_factory
+from .events import insert_events
+from .receipts import existing_receipts, insert_receipts, receipt_window
+
+logger = logging.getLogger(__name__)
+
+RETRY_BACKOFF_SECONDS = (0.1, 0.5, 1.0, 2.0, 5.0)
+
+
+class BufferFullError(Exception):
+    """버퍼가 가득 차 제한 시간 안에 이벤트를 받을 수 없을 때 발생합니다."""
+
+
+class _Batch:
+    __slots__ = ("rows", "receipt", "enqueued_at")
+
+    def __init__(self, rows: list[dict[str, Any]], receipt: Optional[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.receipt = receipt  # request_id 가 있는 요청이면 event_batch_receipts 행
+        self.enqueued_at = time.monotonic()
+
+
+class EventWriteBuffer:
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._batches: deque[_Batch] = deque()
+        self._pending = 0
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._waiters = 0  # 자리가 나기를 기다리는 put 수
+        self._inflight = 0  # 기록 중인 flush 수
+
+        # 지표
+        self.accepted_events = 0
+        self.flushed_events = 0
+        self.dropped_events = 0
+        self.flushes = 0
+        self.flush_failures = 0
+        self.rejected_batches = 0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self.total_flush_seconds = 0.0
+        self.max_queue_delay_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """새 이벤트 수신을 멈추고 버퍼를 모두 기록한 뒤 종료합니다."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        timeout = settings.events_shutdown_timeout_seconds
+        try:
+            # 시간 안에 끝나지 않으면 재시도 중인 작업을 취소 (종료가 멈추지 않도록)
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            lost = self._pending
+            self.dropped_events += lost
+            self._batches.clear()
+            self._pending = 0
+            logger.error(
+                "event buffer could not drain within %.1fs on shutdown; dropping %d events",
+                timeout,
+                lost,
+            )
+        finally:
+            self._task = None
+
+    async def put(
+        self, rows: list[dict[str, Any]], receipt: Optional[dict[str, Any]] = None
+    ) -> None:
+        """이벤트 행을 버퍼에 넣습니다. 가득 차 있으면 공간이 날 때까지 기다립니다(backpressure)."""
+        if not rows and receipt is None:
+            return
+        deadline = time.monotonic() + settings.events_enqueue_timeout_ms / 1000
+        while self._pending + len(rows) > settings.events_buffer_max_events and self._pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stopping:
+                self.rejected_batches += 1
+                raise BufferFullError("event buffer is full")
+            self._space.clear()
+            self._wakeup.set()
+            self._waiters += 1
+            try:
+                await asyncio.wait_for(self._space.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._waiters -= 1
+
+        self._batches.append(_Batch(rows, receipt))
+        self._pending += len(rows)
+        self.accepted_events += len(rows)
+        if self._pending >= settings.events_flush_batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        interval = settings.events_flush_interval_ms / 1000
+        failures = 0
+        while True:
+            if not self._batches:
+                if self._stopping:
+                    return
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # 크기 기준을 넘지 않았고 기다리는 put 도 없다면 가장 오래된 배치가
+            # interval 이 될 때까지 더 모음
+            age = time.monotonic() - self._batches[0].enqueued_at
+            if (
+                not self._stopping
+                and not self._waiters
+                and self._pending < settings.events_flush_batch_size
+                and age < interval
+            ):
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), interval - age)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self.flush_once()
+                failures = 0
+            except Exception:
+                self.flush_failures += 1
+                delay = RETRY_BACKOFF_SECONDS[min(failures, len(RETRY_BACKOFF_SECONDS) - 1)]
+                failures += 1
+                logger.exception("event buffer flush failed; retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+
+    async def drain(self) -> None:
+        """지금까지 버퍼에 들어온 이벤트가 모두 기록될 때까지 기다립니다."""
+        while self._batches or self._inflight:
+            if self._batches:
+                await self.flush_once()
+            else:
+                await asyncio.sleep(0.01)
+
+    def _take(self) -> list[_Batch]:
+        taken: list[_Batch] = []
+        count = 0
+        while self._batches and (
+            not taken or count + len(self._batches[0].rows) <= settings.events_flush_batch_size
+        ):
+            batch = self._batches.popleft()
+            taken.append(batch)
+            count += len(batch.rows)
+        return taken
+
+    async def flush_once(self) -> int:
+        """버퍼 앞쪽에서 최대 ``events_flush_batch_size`` 건을 한 트랜잭션으로 기록합니다."""
+        batches = self._take()
+        if not batches:
+            return 0
+        started = time.monotonic()
+        self._inflight += 1
+        try:
+            try:
+                async with self._session_factory() as db:
+                    rows = await self._write(db, batches)
+                    await db.commit()
+            except IntegrityError:
+                # 문제 배치만 골라내기 위해 배치 단위로 다시 기록
+                rows = await self._flush_individually(batches)
+        except BaseException:
+            # 실패(또는 종료 시 취소)한 배치는 순서를 유지한 채 앞으로 되돌려 재시도
+            self._batches.extendleft(reversed(batches))
+            raise
+        finally:
+            self._inflight -= 1
+
+        finished = time.monotonic()
+        elapsed = finished - started
+        self._pending -= sum(len(batch.rows) for batch in batches)
+        self._space.set()
+        self.flushes += 1
+        self.flushed_events += len(rows)
+        self.last_flush_seconds = elapsed
+        self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+        self.total_flush_seconds += elapsed
+        self.max_queue_delay_seconds = max(
+            self.max_queue_delay_seconds, finished - batches[0].enqueued_at
+        )
+        return len(rows)
+
+    async def _write(self, db: AsyncSession, batches: list[_Batch]) -> list[dict[str, Any]]:
+        """이미 영수증이 있는 배치를 SELECT 한 번으로 걸러 내고, 나머지의 영수증과 이벤트를 INSERT."""
+        keys = [
+            (batch.receipt["session_id"], batch.receipt["request_id"])
+            for batch in batches
+            if batch.receipt
+        ]
+        done = await existing_receipts(db, keys)
+        fresh: list[_Batch] = []
+        for batch in batches:
+            if batch.receipt and (batch.receipt["session_id"], batch.receipt["request_id"]) in done:
+                receipt_window.record_duplicate(len(batch.rows), from_db=True)
+            else:
+                fresh.append(batch)
+        await insert_receipts(db, [batch.receipt for batch in fresh if batch.receipt])
+        rows = [row for batch in fresh for row in batch.rows]
+        await insert_events(db, rows)
+        return rows
+
+    async def _flush_individually(self, batches: list[_Batch]) -> list[dict[str, Any]]:
+        written: list[dict[str, Any]] = []
+        for batch in batches:
+            async with self._session_factory() as db:
+                try:
+                    rows = await self._write(db, [batch])
+                    await db.commit()
+                    written.extend(rows)
+                except IntegrityError:
+                    await db.rollback()
+                    self.dropped_events += len(batch.rows)
+                    logger.error(
+                        "dropping %d buffered events for session %s: integrity error",
+                        len(batch.rows),
+                        (batch.receipt or batch.rows[0])["session_id"],
+                    )
+        return written
+
+    def stats(self) -> dict[str, Any]:
+        oldest = self._batches[0].enqueued_at if self._batches else None
+        return {
+            "running": self.running,
+            "pending_events": self._pending,
+            "pending_batches": len(self._batches),
+            "oldest_pending_age_seconds": time.monotonic() - oldest if oldest else 0.0,
+            "accepted_events": self.accepted_events,
+            "flushed_events": self.flushed_events,
+            "dropped_events": self.dropped_events,
+            "rejected_batches": self.rejected_batches,
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "flush_seconds": {
+                "last": self.last_flush_seconds,
+                "max": self.max_flush_seconds,
+                "avg": self.total_flush_seconds / self.flushes if self.flushes else 0.0,
+            },
+            "max_queue_delay_seconds": self.max_queue_delay_seconds,
+        }
+
+
+event_buffer = EventWriteBuffer(async_session_factory)
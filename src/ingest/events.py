@@ -0,0 +1,31 @@
+"""
+이벤트 일괄 INSERT
+
+검증이 끝난 요청 본문에서 바로 행 dict 를 만들어 Core ``insert(Event)`` 한 번으로
+기록합니다. ORM 객체 생성과 unit-of-work(identity map, flush 순서 계산)를 거치지 않으며,
+드라이버가 executemany 를 다중 행 VALUES 로 묶어 보냅니다. ``payload`` 는 JSON
+컬럼의 바인드 처리에서 행마다 한 번만 직렬화됩니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..api.schemas import EventsBatchItem
+from ..db.models import Event
+
+
+def event_rows(session_id: str, events: Iterable[EventsBatchItem]) -> list[dict[str, Any]]:
+    return [
+        {"session_id": session_id, "t_ms": e.t_ms, "type": e.type, "payload": e.payload}
+        for e in events
+    ]
+
+
+async def insert_events(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """행 dict 목록을 한 문장으로 INSERT 합니다. 커밋은 호출한 쪽에서 합니다."""
+    if rows:
+        await db.execute(insert(Event), rows)
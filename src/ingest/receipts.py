@@ -0,0 +1,115 @@
+"""
+이벤트 배치 중복 제거 (request_id 기준)
+
+클라이언트가 타임아웃 뒤 같은 배치를 다시 보내면 ``request_id`` 로 알아보고 INSERT 없이
+200 을 돌려줍니다.
+
+- 메모리: 세션마다 최근 ``events_dedupe_window`` 개의 request_id 를 기억하고,
+  세션은 최대 ``events_dedupe_max_sessions`` 개까지 LRU 로 유지합니다.
+- DB: ``event_batch_receipts`` (session_id, request_id) 기본 키로 영속 보장합니다.
+  영수증은 이벤트와 같은 트랜잭션에 기록되므로, 둘 중 하나만 남는 일은 없습니다.
+  동기 경로는 영수증 INSERT 의 키 충돌로, write-behind 경로는 flush 마다 한 번의
+  SELECT 로 이미 기록된 배치를 걸러 냅니다.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..db.models import EventBatchReceipt
+
+ReceiptKey = tuple[str, str]  # (session_id, request_id)
+
+
+def receipt_row(session_id: str, request_id: str, event_count: int) -> dict[str, Any]:
+    return {
+        "session_id": session_id,
+        "request_id": request_id,
+        "event_count": event_count,
+        "created_at": datetime.now(tz=timezone.utc),
+    }
+
+
+async def insert_receipts(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """영수증을 기록합니다. 이미 있는 키가 섞여 있으면 IntegrityError. 커밋은 호출한 쪽에서 합니다."""
+    if rows:
+        await db.execute(insert(EventBatchReceipt), rows)
+
+
+async def existing_receipts(db: AsyncSession, keys: Iterable[ReceiptKey]) -> set[ReceiptKey]:
+    keys = list(keys)
+    if not keys:
+        return set()
+    result = await db.execute(
+        select(EventBatchReceipt.session_id, EventBatchReceipt.request_id).where(
+            tuple_(EventBatchReceipt.session_id, EventBatchReceipt.request_id).in_(keys)
+        )
+    )
+    return {(row.session_id, row.request_id) for row in result}
+
+
+async def prune_receipts(db: AsyncSession, older_than: datetime) -> int:
+    """``older_than`` 이전 영수증을 지웁니다. 지운 행 수를 돌려줍니다."""
+    result = await db.execute(
+        delete(EventBatchReceipt).where(EventBatchReceipt.created_at < older_than)
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+class ReceiptWindow:
+    """세션별 최근 request_id 창 (메모리)."""
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[str, OrderedDict[str, None]] = OrderedDict()
+        self.memory_duplicates = 0
+        self.db_duplicates = 0
+        self.duplicate_events = 0
+
+    def seen(self, session_id: str, request_id: str) -> bool:
+        window = self._sessions.get(session_id)
+        if window is None or request_id not in window:
+            return False
+        self._sessions.move_to_end(session_id)
+        return True
+
+    def add(self, session_id: str, request_id: str) -> None:
+        window = self._sessions.get(session_id)
+        if window is None:
+            window = self._sessions[session_id] = OrderedDict()
+            while len(self._sessions) > settings.events_dedupe_max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        window[request_id] = None
+        window.move_to_end(request_id)
+        while len(window) > settings.events_dedupe_window:
+            window.popitem(last=False)
+
+    def record_duplicate(self, event_count: int, from_db: bool) -> None:
+        if from_db:
+            self.db_duplicates += 1
+        else:
+            self.memory_duplicates += 1
+        self.duplicate_events += event_count
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "duplicate_batches": self.memory_duplicates + self.db_duplicates,
+            "memory_duplicates": self.memory_duplicates,
+            "db_duplicates": self.db_duplicates,
+            "duplicate_events": self.duplicate_events,
+        }
+
+
+receipt_window = ReceiptWindow()
@@ -1,8 +1,10 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .config import settings
 from .api.routes.health import router as health_router
@@ -12,19 +14,56 @@ from .api.routes.sessions import router as sessions_router
 from .api.routes.replays import router as replays_router
 from .api.routes.agents import router as agents_router
 from .api.routes.gameplay import router as gameplay_router
-from .db.session import engine
+from .api.routes.internal import router as internal_router
+from .api.routes.metrics import router as metrics_router
+from .api.decompression import RequestDecompressionMiddleware
+from .db.pool import prewarm_pool
+from .db.session import async_session_factory, engine
+from .ingest.buffer import event_buffer
+from .metrics.db import db_metrics
+from .db.slow_queries import slow_query_log
+from .metrics.http import MetricsMiddleware, RouteContextMiddleware
+from .profiling.middleware import ProfilingMiddleware
+from .ranking.leaderboard import leaderboard
+from .serialization import FastJSONResponse
+from .storage.base import shutdown_storage_executor
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Startup
+    background: list[asyncio.Task] = []
+    if settings.db_pool_prewarm:
+        await prewarm_pool(engine, settings.db_pool_prewarm)
+    if settings.events_write_behind:
+        event_buffer.start()
+    if settings.leaderboard_index_enabled:
+        await leaderboard.warm(async_session_factory)
+        if settings.leaderboard_resync_seconds:
+            background.append(
+                asyncio.create_task(
+                    leaderboard.resync_forever(
+                        async_session_factory, settings.leaderboard_resync_seconds
+                    )
+                )
+            )
     yield
     # Shutdown
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    # 버퍼에 남은 이벤트를 모두 기록한 뒤 연결 풀을 닫음
+    await event_buffer.stop()
+    await slow_query_log.stop()
     await engine.dispose()
+    shutdown_storage_executor()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    app = FastAPI(
+        title=settings.app_name, lifespan=lifespan, default_response_class=FastJSONResponse
+    )
 
     # CORS
     app.add_middleware(
@@ -36,6 +75,30 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # 응답 압축 (클라이언트가 gzip 을 받고 응답이 충분히 클 때만)
+    if settings.response_compression_enabled:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=settings.response_compression_min_bytes,
+            compresslevel=settings.response_compression_level,
+        )
+
+    # 압축된 요청 본문 (제출/이벤트 업로드)
+    if settings.request_decompression_paths:
+        app.add_middleware(RequestDecompressionMiddleware)
+
+    # Profiling (선택된 요청만 샘플링)
+    if settings.profiling_enabled:
+        app.add_middleware(ProfilingMiddleware)
+
+    # Metrics (가장 바깥에서 CORS 응답까지 포함해 기록)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        db_metrics.install(engine)
+    elif settings.db_slow_query_ms > 0:
+        # 슬로 쿼리 로그에 호출 라우트를 남기기 위한 문맥만 설정
+        app.add_middleware(RouteContextMiddleware)
+
     # Routers
     app.include_router(health_router)
     app.include_router(participants_router, prefix="/api")
@@ -44,6 +107,9 @@ def create_app() -> FastAPI:
     app.include_router(replays_router, prefix="/api")
     app.include_router(agents_router, prefix="/api")
     app.include_router(gameplay_router, prefix="/api")
+    app.include_router(internal_router)
+    if settings.metrics_enabled:
+        app.include_router(metrics_router)
 
     return app
 
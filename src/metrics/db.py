@@ -0,0 +1,105 @@
+"""
+SQL 문장별 실행 시간
+
+``before_cursor_execute``/``after_cursor_execute`` 로 커서 실행 시간을 재고, 리터럴과
+IN/VALUES 목록 길이를 지운 정규화 문장(fingerprint) 단위로 묶습니다.
+컴파일 캐시에서 나온 같은 문장 문자열은 정규화 결과를 재사용하므로 빠른 경로는 dict 조회 한 번입니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..config import settings
+from .registry import Histogram
+
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+OTHER_STATEMENT = "other"
+# 정규화 결과를 기억할 원문 문장 수 (IN 목록이 펼쳐진 문장은 매번 달라지므로 제한)
+_STATEMENT_CACHE_MAX = 4_096
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})*\s*\)")
+_ROW_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """리터럴/바인드 목록을 ``?`` 로 바꾼 정규화 문장."""
+    text = _STRING.sub("?", statement)
+    text = _NUMBER.sub("?", text)
+    text = _PARAM_LIST.sub("(?)", text)
+    text = _ROW_LIST.sub("(?), ...", text)
+    return _SPACE.sub(" ", text).strip()
+
+
+class StatementStats:
+    __slots__ = ("id", "sql", "latency", "errors")
+
+    def __init__(self, sql: str) -> None:
+        self.id = hashlib.sha1(sql.encode("utf-8")).hexdigest()[:12] if sql != OTHER_STATEMENT else sql
+        self.sql = sql
+        self.latency = Histogram(DB_BUCKETS)
+        self.errors = 0
+
+
+class DbMetrics:
+    def __init__(self) -> None:
+        self.statements: dict[str, StatementStats] = {}  # fingerprint -> stats
+        self._by_text: dict[str, StatementStats] = {}  # 원문 문장 -> stats
+
+    def stats_for(self, statement: str) -> StatementStats:
+        stats = self._by_text.get(statement)
+        if stats is not None:
+            return stats
+        sql = fingerprint(statement)
+        stats = self.statements.get(sql)
+        if stats is None:
+            if len(self.statements) >= settings.metrics_max_statements:
+                sql = OTHER_STATEMENT
+                stats = self.statements.get(sql)
+            if stats is None:
+                stats = self.statements[sql] = StatementStats(sql)
+        if len(self._by_text) < _STATEMENT_CACHE_MAX:
+            self._by_text[statement] = stats
+        return stats
+
+    def clear(self) -> None:
+        self.statements.clear()
+        self._by_text.clear()
+
+    def _before_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        context._metrics_started = time.perf_counter()
+
+    def _after_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        started: Optional[float] = getattr(context, "_metrics_started", None)
+        if started is not None:
+            self.stats_for(statement).latency.observe(time.perf_counter() - started)
+
+    def _handle_error(self, exception_context: Any) -> None:
+        if exception_context.statement:
+            self.stats_for(exception_context.statement).errors += 1
+
+    def install(self, engine: AsyncEngine) -> None:
+        target = engine.sync_engine
+        if event.contains(target, "before_cursor_execute", self._before_cursor_execute):
+            return
+        event.listen(target, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(target, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(target, "handle_error", self._handle_error)
+
+
+db_metrics = DbMetrics()
@@ -0,0 +1,136 @@
+"""
+``/metrics`` 출력 조립
+
+HTTP/DB 메트릭과 함께, 각 모듈이 이미 들고 있는 버퍼/캐시/풀 통계를 수집 시점에 읽어 게이지로 냅니다.
+값은 워커 프로세스 단위입니다.
+"""
+
+from __future__ import annotations
+
+from ..config import settings
+from ..db.pool import pool_telemetry
+from ..db.session import engine
+from ..ingest.buffer import event_buffer
+from ..ingest.receipts import receipt_window
+from ..ranking.leaderboard import leaderboard
+from ..ranking.response_cache import rankings_cache
+from ..replays.chunk_cache import replay_chunk_cache
+from ..security.auth_cache import ingest_auth
+from ..storage.s3 import peek_s3_client
+from .db import db_metrics
+from .http import http_metrics
+from .registry import MetricsWriter
+
+PREFIX = "rldda_"
+
+
+def _write_http(w: MetricsWriter) -> None:
+    routes = sorted(
+        (route, method, stats)
+        for route, methods in http_metrics.routes.items()
+        for method, stats in methods.items()
+    )
+    name = w.family("http_requests_total", "counter", "HTTP requests by route template, method and status.")
+    for route, method, stats in routes:
+        for status, count in sorted(stats.statuses.items()):
+            w.sample(name, count, {"route": route, "method": method, "status": str(status)})
+    for metric, attr, help_ in (
+        ("http_request_duration_seconds", "latency", "Time until the last response body byte was sent."),
+        ("http_request_size_bytes", "request_bytes", "Request body size as received."),
+        ("http_response_size_bytes", "response_bytes", "Response body size as sent."),
+    ):
+        name = w.family(metric, "histogram", help_)
+        for route, method, stats in routes:
+            hist = getattr(stats, attr)
+            w.histogram(name, hist.cumulative(), hist.sum, {"route": route, "method": method})
+    w.gauge("http_requests_in_flight", "Requests currently being handled.", http_metrics.in_flight)
+
+
+def _write_db(w: MetricsWriter) -> None:
+    statements = sorted(db_metrics.statements.values(), key=lambda s: s.id)
+    name = w.family("db_statement_info", "gauge", "Normalized SQL text for each statement id.")
+    for stats in statements:
+        w.sample(name, 1, {"statement": stats.id, "sql": stats.sql})
+    name = w.family("db_statement_duration_seconds", "histogram", "Cursor execution time by statement.")
+    for stats in statements:
+        w.histogram(name, stats.latency.cumulative(), stats.latency.sum, {"statement": stats.id})
+    name = w.family("db_statement_errors_total", "counter", "Failed executions by statement.")
+    for stats in statements:
+        w.sample(name, stats.errors, {"statement": stats.id})
+
+
+def _write_pool(w: MetricsWriter) -> None:
+    stats = pool_telemetry.stats(engine.pool)
+    for key, help_ in (
+        ("size", "Configured pool size."),
+        ("checked_out", "Connections currently checked out."),
+        ("checked_in", "Idle connections in the pool."),
+        ("overflow", "Current overflow (negative while the pool is not full)."),
+    ):
+        if key in stats:
+            w.gauge(f"db_pool_{key}", help_, stats[key])
+    for key, help_ in (
+        ("checkouts", "Connection checkouts."),
+        ("connects", "New DBAPI connections."),
+        ("invalidations", "Invalidated connections."),
+        ("pre_ping_failures", "Connections found dead by pre-ping."),
+        ("timeouts", "Checkouts that timed out waiting for a connection."),
+    ):
+        w.counter(f"db_pool_{key}_total", help_, stats[key])
+    name = w.family("db_pool_checkout_wait_seconds", "histogram", "Time spent waiting for a pooled connection.")
+    w.histogram(name, pool_telemetry.wait_histogram(), pool_telemetry.wait_sum)
+
+
+def _write_ingest(w: MetricsWriter) -> None:
+    buffer = event_buffer.stats()
+    w.gauge("event_buffer_pending_events", "Events waiting in the write-behind buffer.", buffer["pending_events"])
+    w.gauge("event_buffer_pending_batches", "Batches waiting in the write-behind buffer.", buffer["pending_batches"])
+    w.gauge(
+        "event_buffer_oldest_pending_age_seconds",
+        "Age of the oldest buffered batch.",
+        buffer["oldest_pending_age_seconds"],
+    )
+    for key in ("accepted_events", "flushed_events", "dropped_events", "rejected_batches", "flush_failures"):
+        w.counter(f"event_buffer_{key}_total", f"Write-behind buffer {key.replace('_', ' ')}.", buffer[key])
+    dedupe = receipt_window.stats()
+    w.counter("events_duplicate_batches_total", "Event batches skipped as duplicates.", dedupe["duplicate_batches"])
+
+
+def _write_caches(w: MetricsWriter) -> None:
+    auth = ingest_auth.stats()
+    chunks = replay_chunk_cache.stats()
+    rankings = rankings_cache.stats()
+    caches = [
+        ("rankings", rankings["entries"], rankings["hits"], rankings["misses"]),
+        ("ingest_tokens", auth["tokens"], auth["token_hits"], auth["token_misses"]),
+        ("ingest_sessions", auth["sessions"], auth["session_hits"], auth["session_misses"]),
+        ("replay_chunks", chunks["entries"], chunks["hits"], chunks["misses"]),
+    ]
+    client = peek_s3_client()
+    if client is not None:
+        presign = client.presign_cache.stats()
+        caches.append(("presign", presign["entries"], presign["hits"], presign["misses"]))
+    for index, (metric, help_) in enumerate(
+        (
+            ("cache_entries", "Entries held by in-process caches."),
+            ("cache_hits_total", "In-process cache hits."),
+            ("cache_misses_total", "In-process cache misses."),
+        ),
+        start=1,
+    ):
+        name = w.family(metric, "counter" if metric.endswith("_total") else "gauge", help_)
+        for cache in caches:
+            w.sample(name, cache[index], {"cache": cache[0]})
+    w.gauge("replay_chunk_cache_bytes", "Bytes held by the replay chunk cache.", chunks["bytes"])
+    if settings.leaderboard_index_enabled and leaderboard.ready:
+        w.gauge("leaderboard_entries", "Gameplays in the in-memory leaderboard index.", leaderboard.total())
+
+
+def render_metrics() -> str:
+    w = MetricsWriter(PREFIX)
+    _write_http(w)
+    _write_db(w)
+    _write_pool(w)
+    _write_ingest(w)
+    _write_caches(w)
+    return w.render()
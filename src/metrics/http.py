@@ -0,0 +1,149 @@
+"""
+라우트별 HTTP 메트릭 (ASGI 미들웨어)
+
+라우트 라벨은 실제 경로가 아니라 매칭된 경로 템플릿(``/api/replays/{replay_id}``)이라
+라벨 수가 라우트 수로 제한됩니다. 매칭되지 않은 요청은 ``<unmatched>`` 하나로 묶습니다.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .registry import LATENCY_BUCKETS, SIZE_BUCKETS, Histogram
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 처리 중인 요청의 ASGI scope. 라우팅이 끝나면 scope["route"] 가 채워짐
+_current_scope: ContextVar[Optional[Scope]] = ContextVar("metrics_scope", default=None)
+
+
+def current_route() -> Optional[str]:
+    """지금 처리 중인 요청의 라우트 템플릿 (요청 밖이거나 라우팅 전이면 None)."""
+    scope = _current_scope.get()
+    if scope is None:
+        return None
+    route = scope.get("route")
+    return getattr(route, "path", None)
+
+
+class RouteStats:
+    __slots__ = ("statuses", "latency", "request_bytes", "response_bytes")
+
+    def __init__(self) -> None:
+        self.statuses: dict[int, int] = {}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.request_bytes = Histogram(SIZE_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+
+
+class HttpMetrics:
+    def __init__(self) -> None:
+        # route -> method -> stats (튜플 키를 만들지 않도록 두 단계로 둠)
+        self.routes: dict[str, dict[str, RouteStats]] = {}
+        self.in_flight = 0
+
+    def stats_for(self, route: str, method: str) -> RouteStats:
+        methods = self.routes.get(route)
+        if methods is None:
+            methods = self.routes[route] = {}
+        stats = methods.get(method)
+        if stats is None:
+            stats = methods[method] = RouteStats()
+        return stats
+
+    def observe(
+        self,
+        route: str,
+        method: str,
+        status: int,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        stats = self.stats_for(route, method)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        stats.latency.observe(seconds)
+        stats.request_bytes.observe(request_bytes)
+        stats.response_bytes.observe(response_bytes)
+
+    def clear(self) -> None:
+        self.routes.clear()
+
+
+http_metrics = HttpMetrics()
+
+
+class RouteContextMiddleware:
+    """``current_route`` 만 제공합니다. 메트릭을 끈 채 슬로 쿼리 로그의 라우트를 남길 때 사용합니다."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
+
+
+class MetricsMiddleware:
+    """요청 수/상태 코드/지연 시간/요청·응답 본문 크기를 라우트별로 기록합니다.
+
+    지연 시간은 마지막 응답 본문을 보낸 시점까지이며, 그 뒤에 도는 BackgroundTasks 는 포함하지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        finished: Optional[float] = None
+        status = 500
+        request_bytes = 0
+        response_bytes = 0
+
+        async def receive_counted() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_counted(message: Message) -> None:
+            nonlocal status, response_bytes, finished
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    finished = time.perf_counter()
+            await send(message)
+
+        token = _current_scope.set(scope)
+        http_metrics.in_flight += 1
+        try:
+            await self.app(scope, receive_counted, send_counted)
+        finally:
+            http_metrics.in_flight -= 1
+            _current_scope.reset(token)
+            route: Any = scope.get("route")
+            http_metrics.observe(
+                getattr(route, "path", UNMATCHED_ROUTE),
+                scope["method"],
+                status,
+                (finished or time.perf_counter()) - started,
+                request_bytes,
+                response_bytes,
+            )
@@ -0,0 +1,102 @@
+"""
+메트릭 기본 자료구조와 Prometheus 텍스트 포맷 출력
+
+기록은 워커(프로세스)마다 따로 모으고 잠금을 쓰지 않습니다. 모든 기록은 이벤트 루프 스레드에서
+일어나므로 정수 증가가 서로 끼어들지 않습니다. 히스토그램은 버킷 배열을 미리 만들어 두고
+``observe`` 에서는 버킷 위치 계산과 덧셈만 합니다.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable, Optional, Sequence
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        buckets: list[tuple[str, int]] = []
+        total = 0
+        for bound, count in zip((*map(_format_value, self.bounds), "+Inf"), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Optional[dict[str, str]], extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = list(labels.items()) if labels else []
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+
+class MetricsWriter:
+    """텍스트 포맷 작성기. 같은 이름의 샘플은 ``family`` 호출 바로 뒤에 모아서 써야 합니다."""
+
+    def __init__(self, prefix: str = "") -> None:
+        self._prefix = prefix
+        self._lines: list[str] = []
+
+    def family(self, name: str, type_: str, help_: str) -> str:
+        name = self._prefix + name
+        self._lines.append(f"# HELP {name} {help_}")
+        self._lines.append(f"# TYPE {name} {type_}")
+        return name
+
+    def sample(self, name: str, value: float, labels: Optional[dict[str, str]] = None) -> None:
+        self._lines.append(f"{name}{_labels(labels)} {_format_value(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        buckets: Iterable[tuple[str, int]],
+        sum_: float,
+        labels: Optional[dict[str, str]] = None,
+    ) -> None:
+        count = 0
+        for le, count in buckets:
+            self._lines.append(f"{name}_bucket{_labels(labels, ('le', le))} {count}")
+        self._lines.append(f"{name}_sum{_labels(labels)} {_format_value(sum_)}")
+        self._lines.append(f"{name}_count{_labels(labels)} {count}")
+
+    def gauge(self, name: str, help_: str, value: float, labels: Optional[dict[str, str]] = None) -> None:
+        self.sample(self.family(name, "gauge", help_), value, labels)
+
+    def counter(self, name: str, help_: str, value: float, labels: Optional[dict[str, str]] = None) -> None:
+        self.sample(self.family(name, "counter", help_), value, labels)
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
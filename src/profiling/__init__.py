@@ -0,0 +1,3 @@
+"""Profiling package."""
+
+
@@ -0,0 +1,126 @@
+"""
+요청 프로파일링 미들웨어
+
+다음 중 하나에 해당하는 요청만 ``StackSampler`` 로 샘플링합니다.
+
+- ``X-Profile`` 헤더에 ``profiling_secret`` 으로 서명한 유효한 토큰이 있음 (``scripts/profile_token.py``)
+- ``profiling_routes`` (비우면 전체) 에 맞는 경로이고 ``profiling_sample_rate`` 확률에 당첨
+
+``profiling_enabled`` 가 꺼져 있으면 미들웨어를 붙이지 않으므로 비용이 없습니다.
+켜져 있어도 선택되지 않은 요청은 헤더 확인과 난수 한 번으로 끝납니다.
+프로파일된 응답에는 ``X-Profile-Id`` 헤더로 결과 파일 이름이 붙습니다 (``GET /internal/profiles/{name}``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import time
+import uuid
+from typing import Optional
+
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import settings
+from ..security.ingest_token import verify_ingest_token
+from .sampler import StackSampler
+from .store import EXTENSIONS, write_profile
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_SUBJECT = "profile"  # 서명 토큰의 sid
+
+
+def verify_profile_token(token: str) -> bool:
+    if not settings.profiling_secret:
+        return False
+    try:
+        payload = verify_ingest_token(settings.profiling_secret, token)
+    except Exception:
+        return False
+    return payload.get("sid") == PROFILE_SUBJECT
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", value).strip("_") or "root"
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._routes = [compile_path(route)[0] for route in settings.profiling_routes]
+        self._active = 0
+
+    def _selected(self, scope: Scope) -> bool:
+        if self._active >= settings.profiling_max_concurrent:
+            return False
+        if settings.profiling_secret:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return verify_profile_token(value.decode("latin-1"))
+        rate = settings.profiling_sample_rate
+        if rate <= 0 or random.random() >= rate:
+            return False
+        return not self._routes or any(r.match(scope["path"]) for r in self._routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        if task is None:
+            await self.app(scope, receive, send)
+            return
+        loop = asyncio.get_running_loop()
+        sampler = StackSampler(
+            task,
+            loop,
+            settings.profiling_interval_ms / 1000,
+            root_code=ProfilingMiddleware.__call__.__code__,
+        )
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        fmt = settings.profiling_format
+        name: Optional[str] = None
+        status: Optional[int] = None
+
+        def route() -> str:
+            return getattr(scope.get("route"), "path", scope["path"])
+
+        def file_name() -> str:
+            return f"{profile_id}-{scope['method']}-{_slug(route())}{EXTENSIONS[fmt]}"
+
+        async def send_tagged(message: Message) -> None:
+            nonlocal name, status
+            if message["type"] == "http.response.start":
+                # 응답 시작 시점에는 라우팅이 끝나 있으므로 라우트 템플릿으로 파일 이름을 정함
+                name = file_name()
+                status = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", name.encode())]
+            await send(message)
+
+        self._active += 1
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_tagged)
+        finally:
+            sampler.stop()
+            self._active -= 1
+            name = name or file_name()
+            if fmt == "collapsed":
+                data = sampler.collapsed()
+            else:
+                data = sampler.speedscope(f"{scope['method']} {route()}")
+            try:
+                await loop.run_in_executor(None, write_profile, name, data)
+            except OSError:
+                logger.exception("failed to write profile %s", name)
+            else:
+                logger.info(
+                    "profiled %s %s -> %s (status %s, samples %s)",
+                    scope["method"], route(), name, status, dict(sampler.kinds),
+                )
@@ -0,0 +1,156 @@
+"""
+요청 단위 통계적 스택 샘플러
+
+별도 스레드가 ``interval`` 마다 대상 요청의 태스크 상태를 보고 스택 하나를 기록합니다.
+
+- ``cpu``: 이벤트 루프가 대상 태스크를 실행 중 → 루프 스레드의 실제 스택
+- ``await``: 대상 태스크가 멈춰 있고 루프는 한가함 → DB/저장소 등 I/O 대기. 태스크가 멈춘 await 지점의 스택
+- ``loop_busy``: 대상 태스크가 멈춰 있고 루프는 다른 태스크를 실행 중 → I/O 는 끝났어도 루프 차례를 기다리는 중일 수 있음
+
+스레드 풀에서 도는 동기 코드(동기 의존성, 저장소 호출)는 대상 태스크 입장에서 ``await`` 로 보입니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Optional
+
+SAMPLE_KINDS = ("cpu", "await", "loop_busy")
+
+
+def _frame_name(code: CodeType, cache: dict[CodeType, str], module: str) -> str:
+    name = cache.get(code)
+    if name is None:
+        qualname = getattr(code, "co_qualname", code.co_name)
+        name = cache[code] = f"{module}.{qualname}:{code.co_firstlineno}"
+    return name
+
+
+def _task_frames(task: asyncio.Task) -> list[FrameType]:
+    """멈춰 있는 태스크의 await 체인을 바깥쪽부터 따라갑니다."""
+    frames: list[FrameType] = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None:
+        frame = (
+            getattr(awaitable, "cr_frame", None)
+            or getattr(awaitable, "ag_frame", None)
+            or getattr(awaitable, "gi_frame", None)
+        )
+        if frame is None:
+            break
+        frames.append(frame)
+        awaitable = (
+            getattr(awaitable, "cr_await", None)
+            or getattr(awaitable, "ag_await", None)
+            or getattr(awaitable, "gi_yieldfrom", None)
+        )
+    return frames
+
+
+def _thread_frames(frame: Optional[FrameType]) -> list[FrameType]:
+    frames: list[FrameType] = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+class StackSampler:
+    def __init__(
+        self,
+        task: asyncio.Task,
+        loop: asyncio.AbstractEventLoop,
+        interval: float,
+        root_code: Optional[CodeType] = None,
+    ) -> None:
+        self._task = task
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._interval = interval
+        self._root_code = root_code  # 이 함수 아래 프레임만 남김 (서버/미들웨어 프레임 제거)
+        self._names: dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.kinds: Counter[str] = Counter()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.sample()
+
+    def sample(self) -> None:
+        running = asyncio.current_task(self._loop)
+        if running is self._task:
+            kind = "cpu"
+            frames = _thread_frames(sys._current_frames().get(self._loop_thread))
+        else:
+            kind = "await" if running is None else "loop_busy"
+            frames = _task_frames(self._task)
+        if self._root_code is not None:
+            for i, frame in enumerate(frames):
+                if frame.f_code is self._root_code:
+                    frames = frames[i + 1 :]
+                    break
+        names = self._names
+        stack = tuple(
+            _frame_name(f.f_code, names, f.f_globals.get("__name__", "?")) for f in frames
+        )
+        self.stacks[(kind, *stack)] += 1
+        self.kinds[kind] += 1
+
+    @property
+    def interval_ms(self) -> float:
+        return self._interval * 1000
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 가 읽는 collapsed-stack 텍스트. 맨 아래 프레임이 샘플 종류입니다."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def speedscope(self, name: str) -> str:
+        frames: list[dict[str, str]] = []
+        index: dict[str, int] = {}
+        samples: list[list[int]] = []
+        weights: list[float] = []
+        for stack, count in self.stacks.most_common():
+            sample = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({"name": frame})
+                sample.append(index[frame])
+            samples.append(sample)
+            weights.append(count * self.interval_ms)
+        total = sum(weights)
+        return json.dumps(
+            {
+                "$schema": "https://www.speedscope.app/file-format-schema.json",
+                "shared": {"frames": frames},
+                "profiles": [
+                    {
+                        "type": "sampled",
+                        "name": name,
+                        "unit": "milliseconds",
+                        "startValue": 0,
+                        "endValue": total,
+                        "samples": samples,
+                        "weights": weights,
+                    }
+                ],
+                "name": name,
+                "exporter": "rl-dda-demo-back",
+            },
+            separators=(",", ":"),
+        )
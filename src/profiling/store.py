@@ -0,0 +1,84 @@
+"""
+프로파일 결과 보관
+
+``profiling_output_dir`` 아래에 파일 하나씩 쓰고, 쓸 때마다 보관 기간/파일 수/총 크기 한도를 넘는
+오래된 파일부터 지웁니다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from ..config import settings
+
+_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+EXTENSIONS = {"collapsed": ".collapsed.txt", "speedscope": ".speedscope.json"}
+
+
+def output_dir() -> Path:
+    return Path(settings.profiling_output_dir)
+
+
+def write_profile(name: str, data: str) -> Path:
+    directory = output_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(data, encoding="utf-8")
+    os.replace(tmp, path)
+    prune_profiles()
+    return path
+
+
+def _entries() -> list[tuple[Path, os.stat_result]]:
+    directory = output_dir()
+    if not directory.is_dir():
+        return []
+    entries = []
+    for path in directory.iterdir():
+        if path.suffix == ".tmp" or not path.is_file():
+            continue
+        try:
+            entries.append((path, path.stat()))
+        except FileNotFoundError:
+            continue
+    entries.sort(key=lambda e: e[1].st_mtime, reverse=True)  # 최신 먼저
+    return entries
+
+
+def prune_profiles() -> int:
+    """한도를 넘는 파일을 지우고 지운 수를 돌려줍니다."""
+    cutoff = time.time() - settings.profiling_retention_hours * 3600
+    kept = 0
+    total = 0
+    removed = 0
+    for path, stat in _entries():
+        total += stat.st_size
+        kept += 1
+        if (
+            stat.st_mtime < cutoff
+            or kept > settings.profiling_max_files
+            or total > settings.profiling_max_bytes
+        ):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def list_profiles() -> list[dict[str, Any]]:
+    return [
+        {"name": path.name, "bytes": stat.st_size, "created_at": stat.st_mtime}
+        for path, stat in _entries()
+    ]
+
+
+def profile_path(name: str) -> Optional[Path]:
+    """보관 중인 프로파일 경로 (이름이 잘못되었거나 없으면 None)."""
+    if not _NAME.match(name) or name.endswith(".tmp"):
+        return None
+    path = output_dir() / name
+    return path if path.is_file() else None
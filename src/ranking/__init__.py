@@ -0,0 +1,3 @@
+"""Ranking helpers package."""
+
+
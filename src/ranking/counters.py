@@ -0,0 +1,116 @@
+"""
+게임 플레이 수 카운터
+
+랭킹 전체 개수를 매 요청 COUNT(*) 로 세는 대신 ``gameplay_counters`` 테이블에
+model_id 별 합계와 전역 합계(model_id="")를 유지합니다. 제출과 같은 트랜잭션에서
+증가시키고, 조회는 프로세스 캐시(TTL)에서 응답합니다.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..db.models import GamePlay, GamePlayCounter
+
+GLOBAL_SCOPE = ""
+
+
+def _scopes(model_id: Optional[str]) -> list[str]:
+    # 잠금 순서를 항상 같게 유지 (전역 -> 모델)
+    return [GLOBAL_SCOPE, model_id] if model_id else [GLOBAL_SCOPE]
+
+
+async def increment_counters(db: AsyncSession, model_id: Optional[str]) -> None:
+    """게임 플레이 1건 저장에 맞춰 카운터를 증가시킵니다. 호출자가 커밋합니다."""
+    rows = [{"model_id": scope, "total": 1} for scope in _scopes(model_id)]
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql.insert(GamePlayCounter).values(rows)
+        stmt = stmt.on_duplicate_key_update(total=GamePlayCounter.total + 1)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(GamePlayCounter).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GamePlayCounter.model_id],
+            set_={"total": GamePlayCounter.total + 1},
+        )
+    else:
+        await _increment_portable(db, [row["model_id"] for row in rows])
+        return
+    await db.execute(stmt)
+
+
+async def _increment_portable(db: AsyncSession, scopes: list[str]) -> None:
+    """upsert 구문이 없는 DB 용: UPDATE 후 행이 없으면 INSERT (동시 INSERT 충돌 시 다시 UPDATE)."""
+    for scope in scopes:
+        bump = (
+            update(GamePlayCounter)
+            .where(GamePlayCounter.model_id == scope)
+            .values(total=GamePlayCounter.total + 1)
+        )
+        if (await db.execute(bump)).rowcount:
+            continue
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(GamePlayCounter).values(model_id=scope, total=1))
+        except IntegrityError:
+            await db.execute(bump)
+
+
+async def reconcile_counters(db: AsyncSession) -> dict[str, int]:
+    """gameplays 테이블에서 카운터를 다시 계산해 덮어씁니다."""
+    # 기존 카운터 행을 잠가 동시 제출의 증가분이 유실되지 않게 함
+    await db.execute(select(GamePlayCounter.model_id).with_for_update())
+
+    result = await db.execute(
+        select(GamePlay.model_id, func.count(GamePlay.id)).group_by(GamePlay.model_id)
+    )
+    totals: dict[str, int] = {GLOBAL_SCOPE: 0}
+    for model_id, count in result.all():
+        totals[GLOBAL_SCOPE] += count
+        if model_id:
+            totals[model_id] = count
+
+    await db.execute(delete(GamePlayCounter))
+    await db.execute(
+        insert(GamePlayCounter),
+        [{"model_id": scope, "total": total} for scope, total in totals.items()],
+    )
+    await db.commit()
+    gameplay_counters.invalidate()
+    return totals
+
+
+class GamePlayCounterCache:
+    """gameplay_counters 전체(작은 테이블)를 TTL 동안 메모리에 보관합니다."""
+
+    def __init__(self) -> None:
+        self._totals: dict[str, int] = {}
+        self._loaded_at: Optional[float] = None
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def bump(self, model_id: Optional[str]) -> None:
+        """이 프로세스에서 커밋한 증가분을 캐시에 바로 반영합니다."""
+        if self._loaded_at is None:
+            return
+        for scope in _scopes(model_id):
+            self._totals[scope] = self._totals.get(scope, 0) + 1
+
+    async def get(self, db: AsyncSession, model_id: Optional[str] = None) -> int:
+        now = time.monotonic()
+        if self._loaded_at is None or now - self._loaded_at > settings.gameplay_counter_cache_ttl_seconds:
+            result = await db.execute(select(GamePlayCounter.model_id, GamePlayCounter.total))
+            self._totals = dict(result.tuples().all())
+            self._loaded_at = now
+        return self._totals.get(model_id or GLOBAL_SCOPE, 0)
+
+
+gameplay_counters = GamePlayCounterCache()
@@ -0,0 +1,65 @@
+"""
+랭킹 키셋(커서) 페이지네이션
+
+커서는 직전 페이지 마지막 항목의 (score, created_at, id) 와 순위, 필터(model_id)를
+담은 불투명 토큰입니다. 다음 페이지는 OFFSET 대신 이 키 뒤부터 읽는 조건으로 조회합니다.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..serialization import dumps, loads
+from .leaderboard import SortKey, ranked_after
+
+
+@dataclass(frozen=True)
+class RankingCursor:
+    score: int
+    created_at: datetime  # naive UTC
+    id: str
+    rank: int  # 마지막 항목의 순위
+    model_id: Optional[str] = None
+
+    @property
+    def sort_key(self) -> SortKey:
+        return (-self.score, self.created_at, self.id)
+
+    @classmethod
+    def after(cls, row: Any, rank: int, model_id: Optional[str]) -> RankingCursor:
+        created_at = row.created_at
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return cls(row.score, created_at, row.id, rank, model_id or None)
+
+    def encode(self) -> str:
+        payload = [self.score, self.created_at.isoformat(), self.id, self.rank, self.model_id]
+        return base64.urlsafe_b64encode(dumps(payload)).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> RankingCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            score, created_at, gameplay_id, rank, model_id = loads(
+                base64.urlsafe_b64decode(padded.encode("ascii"))
+            )
+            cursor = cls(
+                int(score), datetime.fromisoformat(created_at), str(gameplay_id), int(rank), model_id
+            )
+        except Exception as e:
+            raise ValueError("invalid cursor") from e
+        # 직접 만든 커서: 음수 순위(페이지 0 이하)나 시간대가 붙은 시각(naive UTC 와 비교 불가)은 거부
+        if cursor.rank < 0 or cursor.created_at.tzinfo is not None:
+            raise ValueError("invalid cursor")
+        if cursor.model_id is not None and not isinstance(cursor.model_id, str):
+            raise ValueError("invalid cursor")
+        return cursor
+
+    def seek_predicate(self) -> ColumnElement[bool]:
+        """(score desc, created_at, id) 순서에서 커서 뒤에 오는 행 조건."""
+        return ranked_after(self.score, self.created_at, self.id)
@@ -0,0 +1,272 @@
+"""
+프로세스 내 리더보드 인덱스
+
+(score 내림차순, created_at 오름차순, id 오름차순) 키로 정렬된 배열을 전역 1개,
+model_id 별로 1개씩 유지합니다. 페이지 조회와 전체 개수는 bisect/슬라이스로
+O(log n + page_size) 에 응답하므로 MySQL 을 거치지 않습니다.
+
+인덱스는 이 프로세스에서 저장한 게임 플레이만 실시간으로 반영합니다. 워커가 여러 개라면
+``leaderboard_resync_seconds`` 로 주기적으로 DB 에서 다시 적재해야 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import and_, desc, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..db.models import GamePlay
+
+logger = logging.getLogger(__name__)
+
+WARM_BATCH_SIZE = 10_000
+
+SortKey = tuple[int, datetime, str]
+
+
+class LeaderboardEntry(NamedTuple):
+    id: str
+    nickname: str
+    score: int
+    final_stage: int
+    model_id: Optional[str]
+    total_frames: Optional[int]
+    play_duration: Optional[float]
+    created_at: datetime  # naive UTC (DB 에서 읽은 값과 같은 형태)
+
+    @property
+    def sort_key(self) -> SortKey:
+        return (-self.score, self.created_at, self.id)
+
+    @classmethod
+    def from_row(cls, row: Any) -> LeaderboardEntry:
+        created_at = row.created_at
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return cls(
+            id=row.id,
+            nickname=row.nickname,
+            score=row.score,
+            final_stage=row.final_stage,
+            model_id=row.model_id,
+            total_frames=row.total_frames,
+            play_duration=row.play_duration,
+            created_at=created_at,
+        )
+
+
+def ranking_columns() -> tuple:
+    return (
+        GamePlay.id,
+        GamePlay.nickname,
+        GamePlay.score,
+        GamePlay.final_stage,
+        GamePlay.model_id,
+        GamePlay.total_frames,
+        GamePlay.play_duration,
+        GamePlay.created_at,
+    )
+
+
+def ranking_order() -> tuple:
+    return (desc(GamePlay.score), GamePlay.created_at, GamePlay.id)
+
+
+def ranked_before(score: int, created_at: Optional[datetime], gameplay_id: Optional[str]) -> ColumnElement[bool]:
+    """랭킹 순서에서 (score, created_at, id) 키보다 앞에 오는 행 조건.
+
+    created_at 이 None 이면 "같은 점수 중 맨 뒤"(지금 새로 제출될 위치)로 봅니다.
+    범위 조건(score >= ...)을 앞에 두어 score 인덱스 범위 스캔을 유도합니다.
+    """
+    if created_at is None:
+        return GamePlay.score >= score
+    return and_(
+        GamePlay.score >= score,
+        or_(
+            GamePlay.score > score,
+            GamePlay.created_at < created_at,
+            and_(GamePlay.created_at == created_at, GamePlay.id < gameplay_id),
+        ),
+    )
+
+
+def ranked_after(score: int, created_at: Optional[datetime], gameplay_id: Optional[str]) -> ColumnElement[bool]:
+    """랭킹 순서에서 키보다 뒤에 오는 행 조건 (``ranked_before`` 의 반대쪽)."""
+    if created_at is None:
+        return GamePlay.score < score
+    return and_(
+        GamePlay.score <= score,
+        or_(
+            GamePlay.score < score,
+            GamePlay.created_at > created_at,
+            and_(GamePlay.created_at == created_at, GamePlay.id > gameplay_id),
+        ),
+    )
+
+
+class LeaderboardIndex:
+    """정렬 키 배열 + 항목 배열. 조회는 O(log n + k), 삽입은 O(log n) 탐색 + 배열 이동."""
+
+    def __init__(self) -> None:
+        self._keys: list[SortKey] = []
+        self._entries: list[LeaderboardEntry] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def insert(self, entry: LeaderboardEntry) -> bool:
+        key = entry.sort_key
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return False
+        self._keys.insert(i, key)
+        self._entries.insert(i, entry)
+        return True
+
+    def extend_sorted(self, entries: list[LeaderboardEntry]) -> None:
+        self._entries = sorted(entries, key=lambda e: e.sort_key)
+        self._keys = [e.sort_key for e in self._entries]
+
+    def slice(self, offset: int, limit: int) -> list[LeaderboardEntry]:
+        return self._entries[offset : offset + limit]
+
+    def position(self, key: SortKey) -> int:
+        """키보다 앞에 있는 항목 수 (0부터)."""
+        return bisect_left(self._keys, key)
+
+    def position_after(self, key: SortKey) -> int:
+        """키와 같거나 앞에 있는 항목 수 (커서 다음 위치)."""
+        return bisect_right(self._keys, key)
+
+    def entries(self) -> list[LeaderboardEntry]:
+        return self._entries
+
+
+class Leaderboard:
+    def __init__(self) -> None:
+        self._global = LeaderboardIndex()
+        self._by_model: dict[str, LeaderboardIndex] = {}
+        self._by_id: dict[str, LeaderboardEntry] = {}
+        self._ready = False
+        self._warming = False
+        self._pending: list[LeaderboardEntry] = []
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def index_for(self, model_id: Optional[str]) -> LeaderboardIndex:
+        if not model_id:
+            return self._global
+        return self._by_model.get(model_id) or LeaderboardIndex()
+
+    def add(self, entry: LeaderboardEntry) -> None:
+        if self._warming:
+            # 적재 중 들어온 항목은 적재가 끝난 뒤 다시 반영
+            self._pending.append(entry)
+        if self._global.insert(entry):
+            self._by_id[entry.id] = entry
+            if entry.model_id:
+                self._by_model.setdefault(entry.model_id, LeaderboardIndex()).insert(entry)
+
+    def get(self, gameplay_id: str) -> Optional[LeaderboardEntry]:
+        return self._by_id.get(gameplay_id)
+
+    def total(self, model_id: Optional[str] = None) -> int:
+        return len(self.index_for(model_id))
+
+    def page(self, offset: int, limit: int, model_id: Optional[str] = None) -> list[LeaderboardEntry]:
+        return self.index_for(model_id).slice(offset, limit)
+
+    async def warm(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """DB 의 게임 플레이 전체를 읽어 인덱스를 새로 만듭니다."""
+        self._warming = True
+        self._pending = []
+        try:
+            entries: list[LeaderboardEntry] = []
+            async with session_factory() as db:
+                result = await db.stream(
+                    select(*ranking_columns()).execution_options(yield_per=WARM_BATCH_SIZE)
+                )
+                async for partition in result.partitions():
+                    entries.extend(LeaderboardEntry.from_row(row) for row in partition)
+
+            by_model: dict[str, list[LeaderboardEntry]] = {}
+            for entry in entries:
+                if entry.model_id:
+                    by_model.setdefault(entry.model_id, []).append(entry)
+
+            new_global = LeaderboardIndex()
+            new_global.extend_sorted(entries)
+            new_by_model: dict[str, LeaderboardIndex] = {}
+            for model_id, model_entries in by_model.items():
+                index = new_by_model[model_id] = LeaderboardIndex()
+                index.extend_sorted(model_entries)
+
+            self._global, self._by_model = new_global, new_by_model
+            self._by_id = {entry.id: entry for entry in entries}
+            pending, self._pending = self._pending, []
+            self._warming = False
+            for entry in pending:
+                self.add(entry)
+            self._ready = True
+            logger.info("leaderboard index warmed with %d gameplays", len(new_global))
+        finally:
+            self._warming = False
+
+    async def resync_forever(
+        self, session_factory: async_sessionmaker[AsyncSession], interval_seconds: float
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.warm(session_factory)
+            except Exception:
+                logger.exception("leaderboard resync failed")
+
+    async def check_consistency(self, db: AsyncSession, max_mismatches: int = 20) -> dict[str, Any]:
+        """DB 정렬 결과와 인덱스를 한 번에 비교해 불일치 내역을 돌려줍니다."""
+        result = await db.stream(
+            select(*ranking_columns())
+            .order_by(*ranking_order())
+            .execution_options(yield_per=WARM_BATCH_SIZE)
+        )
+
+        mismatches: list[dict[str, Any]] = []
+        db_totals: dict[str, int] = {}
+        db_global = 0
+        global_entries = self._global.entries()
+
+        def compare(scope: str, position: int, entries: list[LeaderboardEntry], row_id: str) -> None:
+            indexed = entries[position].id if position < len(entries) else None
+            if indexed != row_id and len(mismatches) < max_mismatches:
+                mismatches.append(
+                    {"scope": scope, "rank": position + 1, "db_id": row_id, "index_id": indexed}
+                )
+
+        async for partition in result.partitions():
+            for row in partition:
+                compare("global", db_global, global_entries, row.id)
+                db_global += 1
+                if row.model_id:
+                    position = db_totals.get(row.model_id, 0)
+                    compare(row.model_id, position, self.index_for(row.model_id).entries(), row.id)
+                    db_totals[row.model_id] = position + 1
+
+        totals = {"global": {"db": db_global, "index": len(self._global)}}
+        for model_id in sorted(set(db_totals) | set(self._by_model)):
+            totals[model_id] = {
+                "db": db_totals.get(model_id, 0),
+                "index": self.total(model_id),
+            }
+        consistent = not mismatches and all(t["db"] == t["index"] for t in totals.values())
+        return {"consistent": consistent, "totals": totals, "mismatches": mismatches}
+
+
+leaderboard = Leaderboard()
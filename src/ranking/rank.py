@@ -0,0 +1,102 @@
+"""
+단일 게임 플레이/점수의 순위 조회
+
+리더보드 인덱스가 적재되어 있으면 bisect 로, 아니면 (model_id, score) 인덱스를 타는
+COUNT 한 번과 앞뒤 이웃을 읽는 LIMIT 쿼리 두 번으로 계산합니다. 전체 스캔은 하지 않습니다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import asc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.models import GamePlay
+from .counters import gameplay_counters
+from .leaderboard import (
+    LeaderboardEntry,
+    leaderboard,
+    ranked_after,
+    ranked_before,
+    ranking_columns,
+    ranking_order,
+)
+
+# 인덱스에서 "같은 점수 중 맨 뒤" 위치를 찾기 위한 키 값
+_LAST_CREATED_AT = datetime.max
+_LAST_ID = "\U0010ffff"
+
+
+class RankPosition(NamedTuple):
+    rank: int
+    total: int
+    neighbors: list[tuple[int, Any]]  # (순위, 랭킹 행) - 대상 자신이 있으면 포함
+
+
+async def locate(
+    db: AsyncSession,
+    score: int,
+    model_id: Optional[str] = None,
+    neighbors: int = 2,
+    entry: Optional[LeaderboardEntry] = None,
+) -> RankPosition:
+    """점수(또는 저장된 게임 플레이 ``entry``)의 순위를 구합니다.
+
+    entry 가 없으면 해당 점수를 지금 제출했을 때의 순위이며, 있으면 그 항목 자신의
+    순위이고 이웃 목록에도 자신이 포함됩니다.
+    """
+    created_at = entry.created_at if entry else None
+    gameplay_id = entry.id if entry else None
+
+    if leaderboard.ready:
+        index = leaderboard.index_for(model_id)
+        if entry:
+            key = entry.sort_key
+        else:
+            key = (-score, _LAST_CREATED_AT, _LAST_ID)
+        before = index.position(key)
+        end = before + neighbors + (1 if entry else 0)
+        start = max(before - neighbors, 0)
+        rows = index.slice(start, end - start)
+        return RankPosition(
+            rank=before + 1,
+            total=len(index),
+            neighbors=[(start + i + 1, row) for i, row in enumerate(rows)],
+        )
+
+    def scoped(stmt: Any) -> Any:
+        return stmt.where(GamePlay.model_id == model_id) if model_id else stmt
+
+    before_cond = ranked_before(score, created_at, gameplay_id)
+    after_cond = ranked_after(score, created_at, gameplay_id)
+
+    count = await db.execute(scoped(select(func.count()).where(before_cond)))
+    before = count.scalar_one()
+
+    above: list[Any] = []
+    below: list[Any] = []
+    if neighbors:
+        # 바로 위 이웃: 역순으로 읽어 뒤집음
+        result = await db.execute(
+            scoped(select(*ranking_columns()).where(before_cond))
+            .order_by(asc(GamePlay.score), GamePlay.created_at.desc(), GamePlay.id.desc())
+            .limit(neighbors)
+        )
+        above = list(reversed(result.all()))
+        result = await db.execute(
+            scoped(select(*ranking_columns()).where(after_cond))
+            .order_by(*ranking_order())
+            .limit(neighbors)
+        )
+        below = result.all()
+
+    rows: list[Any] = [*above, *([entry] if entry else []), *below]
+
+    start = before - len(above)
+    return RankPosition(
+        rank=before + 1,
+        total=await gameplay_counters.get(db, model_id),
+        neighbors=[(start + i + 1, row) for i, row in enumerate(rows)],
+    )
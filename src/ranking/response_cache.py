@@ -0,0 +1,139 @@
+"""
+랭킹 응답 캐시
+
+(model_id, page, page_size, cursor) 별로 직렬화가 끝난 응답 바이트와 ETag 를 보관합니다.
+TTL 과 LRU 로 크기를 제한하고, 새 점수가 저장되면 그 점수가 들어갈 수 있는 구간의
+항목만 무효화합니다. 점수가 페이지 최저 점수 이하인 꽉 찬 페이지는 항목/순위가
+바뀌지 않으므로 유지되며, 이때 ``total`` 만 최대 TTL 동안 뒤처질 수 있습니다.
+
+무효화는 이 프로세스의 제출만 반영하므로, 다른 워커의 제출은 TTL 이 지나야 보입니다.
+
+응답을 만드는 동안(DB 조회 대기 중) 무효화가 일어나면 그 응답은 이미 낡았을 수 있으므로,
+조회 전에 ``generation`` 을 읽어 두고 ``put`` 에 넘기면 그 사이 세대가 바뀐 경우 저장하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..config import settings
+
+CacheKey = tuple[Optional[str], int, int, Optional[str]]
+
+
+@dataclass
+class CachedRankings:
+    body: bytes
+    etag: str
+    expires_at: float
+    model_id: Optional[str]
+    min_score: Optional[int]  # 페이지 마지막(최저) 점수, 빈 페이지면 None
+    full: bool  # 페이지가 page_size 만큼 꽉 찼는지
+
+    def affected_by(self, model_id: Optional[str], score: int) -> bool:
+        if self.model_id is not None and self.model_id != model_id:
+            return False
+        # 동점은 기존 기록 뒤에 붙으므로 최저 점수와 같으면 꽉 찬 페이지에 들어오지 않음
+        return not self.full or self.min_score is None or score > self.min_score
+
+
+class RankingsResponseCache:
+    def __init__(self) -> None:
+        self._entries: OrderedDict[CacheKey, CachedRankings] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.stale_fills = 0
+        # 무효화할 때마다 증가 (조회 중에 무효화된 응답을 저장하지 않기 위한 세대 번호)
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.rankings_cache_ttl_seconds > 0 and settings.rankings_cache_max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[CachedRankings]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        body: bytes,
+        min_score: Optional[int],
+        full: bool,
+        generation: Optional[int] = None,
+    ) -> CachedRankings:
+        entry = CachedRankings(
+            body=body,
+            # 약한 ETag: GZipMiddleware 가 인코딩만 바꾼 응답에도 같은 값이 붙기 때문 (RFC 9110 8.8.3)
+            etag='W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"',
+            expires_at=time.monotonic() + settings.rankings_cache_ttl_seconds,
+            model_id=key[0],
+            min_score=min_score,
+            full=full,
+        )
+        if not self.enabled:
+            return entry
+        if generation is not None and generation != self.generation:
+            self.stale_fills += 1
+            return entry
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.rankings_cache_max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def invalidate_for_score(self, model_id: Optional[str], score: int) -> None:
+        self.generation += 1
+        stale = [key for key, entry in self._entries.items() if entry.affected_by(model_id, score)]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "stale_fills": self.stale_fills,
+        }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 의 약한 비교 (W/ 접두사는 무시)."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+rankings_cache = RankingsResponseCache()
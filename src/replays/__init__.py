@@ -0,0 +1,3 @@
+"""Replay building and reading package."""
+
+
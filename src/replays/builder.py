@@ -0,0 +1,238 @@
+"""
+리플레이 빌더
+
+종료된 세션의 events 를 ``ix_events_session_t`` (session_id, t_ms) 순서로 keyset 조회하며
+``ReplayWriter`` 로 임시 파일에 기록하고, 저장소에 업로드한 뒤 ``replays`` 행과 청크 인덱스
+(``replay_chunks``) 를 만듭니다.
+메모리에는 조회 배치 하나와 청크 하나만 올라오므로 세션 크기와 무관하게 일정합니다.
+
+선택적으로 업로드가 끝난 세션의 원본 events 행을 같은 순서로 배치 삭제합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import and_, delete, insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..config import settings
+from ..db.models import Event, Replay, ReplayChunk, Session
+from ..ingest.buffer import event_buffer
+from ..storage.backend import get_storage
+from ..storage.base import Storage
+from .format import COMPRESSION, FORMAT_VERSION, ReplayIndex, ReplayWriter
+
+logger = logging.getLogger(__name__)
+
+REPLAY_CONTENT_TYPE = "application/x-rldda-replay"
+GENERATED_BY = "server"
+
+
+class ReplayBuildError(Exception):
+    """리플레이를 만들 수 없는 세션(없음/미종료)일 때 발생합니다."""
+
+
+@dataclass
+class ReplayBuildResult:
+    session_id: str
+    replay_id: str
+    events: int
+    chunks: int
+    size: int
+    created: bool  # False 면 이미 리플레이가 있어 건너뜀
+    pruned_events: int = 0
+
+
+def replay_key(session_id: str, replay_id: str) -> str:
+    return f"replays/{session_id}/{replay_id}.rpl"
+
+
+def chunk_rows(replay_id: str, index: ReplayIndex) -> list[dict[str, Any]]:
+    return [
+        {
+            "replay_id": replay_id,
+            "chunk_index": i,
+            "t_start": chunk.t_start,
+            "t_end": chunk.t_end,
+            "byte_offset": chunk.offset,
+            "byte_length": chunk.length,
+            "event_count": chunk.count,
+        }
+        for i, chunk in enumerate(index.chunks)
+    ]
+
+
+def _after(t_ms: int, event_id: int) -> ColumnElement[bool]:
+    return or_(Event.t_ms > t_ms, and_(Event.t_ms == t_ms, Event.id > event_id))
+
+
+async def _write_events(db: AsyncSession, session_id: str, writer: ReplayWriter) -> None:
+    batch_size = settings.replay_read_batch_size
+    last: Optional[tuple[int, int]] = None
+    while True:
+        stmt = (
+            select(Event.id, Event.t_ms, Event.type, Event.payload)
+            .where(Event.session_id == session_id)
+            .order_by(Event.t_ms, Event.id)
+            .limit(batch_size)
+        )
+        if last is not None:
+            stmt = stmt.where(_after(*last))
+        rows = (await db.execute(stmt)).all()
+        for row in rows:
+            writer.add(row.t_ms, row.type, row.payload)
+        if len(rows) < batch_size:
+            return
+        last = (rows[-1].t_ms, rows[-1].id)
+
+
+async def prune_session_events(db: AsyncSession, session_id: str) -> int:
+    """세션의 events 행을 ``replay_read_batch_size`` 단위로 지웁니다."""
+    batch_size = settings.replay_read_batch_size
+    deleted = 0
+    while True:
+        ids = (
+            await db.execute(
+                select(Event.id)
+                .where(Event.session_id == session_id)
+                .order_by(Event.t_ms, Event.id)
+                .limit(batch_size)
+            )
+        ).scalars().all()
+        if not ids:
+            return deleted
+        await db.execute(delete(Event).where(Event.id.in_(ids)))
+        await db.commit()
+        deleted += len(ids)
+
+
+async def build_replay(
+    session_factory: async_sessionmaker[AsyncSession],
+    session_id: str,
+    prune_events: Optional[bool] = None,
+    storage: Optional[Storage] = None,
+) -> ReplayBuildResult:
+    """세션 하나의 리플레이를 만듭니다. 이미 있으면 아무것도 하지 않습니다."""
+    if prune_events is None:
+        prune_events = settings.replay_prune_events
+
+    async with session_factory() as db:
+        session = (
+            await db.execute(
+                select(Session.ended_at, Session.duration_ms).where(Session.id == session_id)
+            )
+        ).one_or_none()
+        if session is None:
+            raise ReplayBuildError(f"session not found: {session_id}")
+        if session.ended_at is None:
+            raise ReplayBuildError(f"session has not ended: {session_id}")
+        existing = (
+            await db.execute(select(Replay).where(Replay.session_id == session_id))
+        ).scalar_one_or_none()
+        if existing is not None:
+            return ReplayBuildResult(
+                session_id=session_id,
+                replay_id=existing.id,
+                events=existing.frames_count or 0,
+                chunks=0,
+                size=0,
+                created=False,
+            )
+
+        replay_id = uuid.uuid4().hex
+        key = replay_key(session_id, replay_id)
+        fd, path = tempfile.mkstemp(prefix="replay-", suffix=".rpl")
+        try:
+            with os.fdopen(fd, "wb") as fileobj:
+                writer = ReplayWriter(
+                    fileobj,
+                    max_events=settings.replay_chunk_max_events,
+                    max_span_ms=settings.replay_chunk_max_span_ms,
+                )
+                await _write_events(db, session_id, writer)
+                index, checksum = writer.close()
+                size = writer.size
+            # 업로드 동안 DB 연결을 붙잡지 않도록 읽기 트랜잭션을 닫음
+            await db.rollback()
+
+            storage = storage or get_storage()
+            await storage.upload_file(path, key, REPLAY_CONTENT_TYPE)
+        finally:
+            os.unlink(path)
+
+        db.add(
+            Replay(
+                id=replay_id,
+                session_id=session_id,
+                storage_url=key,
+                frames_count=index.events,
+                duration_ms=session.duration_ms if session.duration_ms is not None else index.duration_ms,
+                compression=COMPRESSION,
+                schema_version=str(FORMAT_VERSION),
+                generated_by=GENERATED_BY,
+                checksum=checksum,
+                created_at=datetime.now(tz=timezone.utc),
+            )
+        )
+        try:
+            await db.flush()
+            if index.chunks:
+                await db.execute(insert(ReplayChunk), chunk_rows(replay_id, index))
+            await db.commit()
+        except IntegrityError:
+            # 동시에 다른 빌드가 먼저 행을 만든 경우 (업로드한 객체는 고아로 남음)
+            await db.rollback()
+            logger.warning("replay for session %s was created concurrently; %s is orphaned", session_id, key)
+            return ReplayBuildResult(
+                session_id=session_id, replay_id=replay_id, events=0, chunks=0, size=0, created=False
+            )
+
+        result = ReplayBuildResult(
+            session_id=session_id,
+            replay_id=replay_id,
+            events=index.events,
+            chunks=len(index.chunks),
+            size=size,
+            created=True,
+        )
+        if prune_events:
+            result.pruned_events = await prune_session_events(db, session_id)
+        return result
+
+
+async def build_replay_in_background(
+    session_factory: async_sessionmaker[AsyncSession], session_id: str
+) -> None:
+    """``/api/session/end`` 의 BackgroundTasks 용. 실패는 로그만 남깁니다."""
+    try:
+        # write-behind 버퍼에 남은 이 세션의 이벤트가 먼저 기록되도록 비움
+        if event_buffer.running:
+            await event_buffer.drain()
+        result = await build_replay(session_factory, session_id)
+        logger.info(
+            "replay %s built for session %s (%d events, %d chunks, %d bytes)",
+            result.replay_id, session_id, result.events, result.chunks, result.size,
+        )
+    except Exception:
+        logger.exception("replay build failed for session %s", session_id)
+
+
+async def ended_sessions_without_replay(db: AsyncSession, limit: Optional[int] = None) -> list[str]:
+    stmt = (
+        select(Session.id)
+        .outerjoin(Replay, Replay.session_id == Session.id)
+        .where(Session.ended_at.is_not(None), Replay.id.is_(None))
+        .order_by(Session.ended_at)
+    )
+    if limit:
+        stmt = stmt.limit(limit)
+    return list((await db.execute(stmt)).scalars().all())
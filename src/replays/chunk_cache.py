@@ -0,0 +1,65 @@
+"""
+리플레이 청크 캐시
+
+구간 조회에서 읽은 청크(압축된 바이트)를 (replay_id, chunk_index) 키로 보관합니다.
+리플레이 파일은 만든 뒤 바뀌지 않으므로 만료 없이 총 바이트 수 기준 LRU 로만 비웁니다.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+from ..config import settings
+
+ChunkKey = tuple[str, int]
+
+
+class ReplayChunkCache:
+    def __init__(self) -> None:
+        self._entries: OrderedDict[ChunkKey, bytes] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: ChunkKey) -> Optional[bytes]:
+        data = self._entries.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def put(self, key: ChunkKey, data: bytes) -> None:
+        limit = settings.replay_chunk_cache_max_bytes
+        if len(data) > limit:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > limit:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+replay_chunk_cache = ReplayChunkCache()
@@ -0,0 +1,158 @@
+"""
+리플레이 파일 포맷 (v1)
+
+세션 이벤트를 t_ms 순서로 잘라 청크마다 zlib 으로 압축하고, 파일 끝에 시간 인덱스를 둡니다.
+뷰어는 끝 12바이트와 인덱스만 읽은 뒤 필요한 청크를 범위 요청(Range)으로 가져올 수 있습니다.
+
+레이아웃::
+
+    b"RPL" | version(u8)
+    chunk 0 | chunk 1 | ...            각 청크 = zlib(JSON [[t_ms, type, payload], ...])
+    index                              zlib(JSON {"events": n, "chunks": [[t_start, t_end, offset, length, count], ...]})
+    index_length(u64, big-endian) | b"RPLI"
+
+청크는 이벤트 수(``max_events``) 또는 시간 폭(``max_span_ms``) 중 먼저 닿는 기준으로 닫힙니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+import zlib
+from typing import Any, BinaryIO, NamedTuple, Sequence
+
+FORMAT_MAGIC = b"RPL"
+FORMAT_VERSION = 1
+HEADER = FORMAT_MAGIC + bytes([FORMAT_VERSION])
+TRAILER = struct.Struct(">Q4s")
+TRAILER_MAGIC = b"RPLI"
+COMPRESSION = "zlib"
+
+
+class ReplayFormatError(ValueError):
+    """리플레이 파일이 손상되었거나 지원하지 않는 버전일 때 발생합니다."""
+
+
+class ChunkInfo(NamedTuple):
+    t_start: int
+    t_end: int
+    offset: int  # 파일 안 바이트 위치
+    length: int
+    count: int
+
+
+class ReplayIndex(NamedTuple):
+    events: int
+    chunks: list[ChunkInfo]
+
+    @property
+    def duration_ms(self) -> int:
+        return self.chunks[-1].t_end if self.chunks else 0
+
+    def chunks_between(self, from_ms: int, to_ms: int) -> list[ChunkInfo]:
+        """[from_ms, to_ms] 구간과 겹치는 청크."""
+        return [c for c in self.chunks if c.t_end >= from_ms and c.t_start <= to_ms]
+
+
+class ReplayWriter:
+    """이벤트를 순서대로 받아 청크 단위로 파일에 씁니다. 메모리에는 청크 하나만 둡니다."""
+
+    def __init__(self, fileobj: BinaryIO, max_events: int = 2_000, max_span_ms: int = 10_000) -> None:
+        self._file = fileobj
+        self._max_events = max_events
+        self._max_span_ms = max_span_ms
+        self._pending: list[list[Any]] = []
+        self._chunks: list[ChunkInfo] = []
+        self._offset = 0
+        self._hash = hashlib.sha256()
+        self.events = 0
+        self._write(HEADER)
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._hash.update(data)
+        self._offset += len(data)
+
+    def add(self, t_ms: int, type_: str, payload: Any) -> None:
+        if self._pending and (
+            len(self._pending) >= self._max_events
+            or t_ms - self._pending[0][0] >= self._max_span_ms
+        ):
+            self._flush()
+        self._pending.append([t_ms, type_, payload])
+        self.events += 1
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        body = zlib.compress(
+            json.dumps(self._pending, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        )
+        chunk = ChunkInfo(
+            t_start=self._pending[0][0],
+            t_end=self._pending[-1][0],
+            offset=self._offset,
+            length=len(body),
+            count=len(self._pending),
+        )
+        self._write(body)
+        self._chunks.append(chunk)
+        self._pending = []
+
+    def close(self) -> tuple[ReplayIndex, str]:
+        """남은 청크와 인덱스를 쓰고 (인덱스, 파일 sha256 hex) 를 돌려줍니다."""
+        self._flush()
+        index = ReplayIndex(events=self.events, chunks=self._chunks)
+        body = zlib.compress(
+            json.dumps(
+                {"events": index.events, "chunks": [list(c) for c in index.chunks]},
+                separators=(",", ":"),
+            ).encode("utf-8")
+        )
+        self._write(body)
+        self._write(TRAILER.pack(len(body), TRAILER_MAGIC))
+        return index, self._hash.hexdigest()
+
+    @property
+    def size(self) -> int:
+        return self._offset
+
+
+def index_length_from_trailer(trailer: bytes) -> int:
+    """파일 끝 ``TRAILER.size`` 바이트에서 인덱스 길이를 읽습니다."""
+    if len(trailer) != TRAILER.size:
+        raise ReplayFormatError("truncated replay trailer")
+    length, magic = TRAILER.unpack(trailer)
+    if magic != TRAILER_MAGIC:
+        raise ReplayFormatError("not a replay file")
+    return length
+
+
+def decode_index(data: bytes) -> ReplayIndex:
+    try:
+        raw = json.loads(zlib.decompress(data))
+    except (zlib.error, ValueError) as exc:
+        raise ReplayFormatError(f"corrupt replay index: {exc}") from exc
+    return ReplayIndex(events=raw["events"], chunks=[ChunkInfo(*c) for c in raw["chunks"]])
+
+
+def read_index(blob: bytes) -> ReplayIndex:
+    """파일 전체 바이트에서 인덱스를 읽습니다."""
+    if blob[: len(HEADER)] != HEADER:
+        raise ReplayFormatError("unsupported replay header")
+    length = index_length_from_trailer(blob[-TRAILER.size :])
+    end = len(blob) - TRAILER.size
+    return decode_index(blob[end - length : end])
+
+
+def decode_chunk(data: bytes) -> list[list[Any]]:
+    """청크 바이트를 [[t_ms, type, payload], ...] 로 풉니다."""
+    try:
+        return json.loads(zlib.decompress(data))
+    except (zlib.error, ValueError) as exc:
+        raise ReplayFormatError(f"corrupt replay chunk: {exc}") from exc
+
+
+def slice_events(events: Sequence[list[Any]], from_ms: int, to_ms: int) -> list[list[Any]]:
+    return [e for e in events if from_ms <= e[0] <= to_ms]
@@ -0,0 +1,85 @@
+"""
+리플레이 구간 조회
+
+``replay_chunks`` 인덱스로 [from_ms, to_ms] 와 겹치는 청크만 골라, 캐시에 없는 청크는
+연속된 것끼리 묶어 범위 요청 한 번으로 읽습니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.models import ReplayChunk
+from ..storage.base import Storage
+from .chunk_cache import replay_chunk_cache
+from .format import decode_chunk, slice_events
+
+
+async def chunks_between(
+    db: AsyncSession, replay_id: str, from_ms: int, to_ms: int
+) -> list[ReplayChunk]:
+    result = await db.execute(
+        select(ReplayChunk)
+        .where(
+            ReplayChunk.replay_id == replay_id,
+            ReplayChunk.t_end >= from_ms,
+            ReplayChunk.t_start <= to_ms,
+        )
+        .order_by(ReplayChunk.chunk_index)
+    )
+    return list(result.scalars().all())
+
+
+async def has_chunk_index(db: AsyncSession, replay_id: str) -> bool:
+    """청크 인덱스가 있는지 (이 형식 이전에 만든 리플레이는 replay_chunks 행이 없음)."""
+    result = await db.execute(
+        select(ReplayChunk.chunk_index).where(ReplayChunk.replay_id == replay_id).limit(1)
+    )
+    return result.first() is not None
+
+
+def _contiguous_runs(chunks: Sequence[ReplayChunk]) -> list[list[ReplayChunk]]:
+    runs: list[list[ReplayChunk]] = []
+    for chunk in chunks:
+        if runs and runs[-1][-1].byte_offset + runs[-1][-1].byte_length == chunk.byte_offset:
+            runs[-1].append(chunk)
+        else:
+            runs.append([chunk])
+    return runs
+
+
+async def read_chunks(storage: Storage, key: str, chunks: Sequence[ReplayChunk]) -> dict[int, bytes]:
+    """청크 바이트를 chunk_index 별로 돌려줍니다. 캐시에 없는 것만 저장소에서 읽습니다."""
+    found: dict[int, bytes] = {}
+    missing: list[ReplayChunk] = []
+    for chunk in chunks:
+        data = replay_chunk_cache.get((chunk.replay_id, chunk.chunk_index))
+        if data is None:
+            missing.append(chunk)
+        else:
+            found[chunk.chunk_index] = data
+
+    for run in _contiguous_runs(missing):
+        start = run[0].byte_offset
+        length = run[-1].byte_offset + run[-1].byte_length - start
+        blob = await storage.get_range(key, start, length)
+        for chunk in run:
+            offset = chunk.byte_offset - start
+            data = blob[offset : offset + chunk.byte_length]
+            replay_chunk_cache.put((chunk.replay_id, chunk.chunk_index), data)
+            found[chunk.chunk_index] = data
+    return found
+
+
+async def read_slice(
+    storage: Storage, key: str, chunks: Sequence[ReplayChunk], from_ms: int, to_ms: int
+) -> list[list[Any]]:
+    """[from_ms, to_ms] 구간의 이벤트를 [[t_ms, type, payload], ...] 로 돌려줍니다."""
+    data = await read_chunks(storage, key, chunks)
+    events: list[list[Any]] = []
+    for chunk in chunks:
+        events.extend(slice_events(decode_chunk(data[chunk.chunk_index]), from_ms, to_ms))
+    return events
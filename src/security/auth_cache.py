@@ -0,0 +1,120 @@
+"""
+이벤트 수집 인증 캐시
+
+``/api/events/batch`` 는 배치마다 같은 토큰을 검증하고 같은 세션의 존재를 확인합니다.
+토큰의 검증 결과(sid, exp)와 세션 존재 여부는 토큰 수명 동안 바뀌지 않으므로
+만료 시각까지 메모리에 보관해, 정상 상태의 수집 경로가 DB 를 읽지 않게 합니다.
+
+- 토큰: 검증에 성공한 토큰만 exp 까지 보관합니다 (실패한 토큰은 매번 다시 검증).
+- 세션: 존재하는 세션은 그 세션 토큰의 exp 까지, 없는 세션은
+  ``ingest_session_negative_ttl_seconds`` 동안 보관합니다.
+- ``start_session`` 이 발급한 토큰과 세션을 미리 넣고, ``end_session`` 이 세션 항목을 지웁니다.
+
+두 캐시 모두 ``ingest_auth_cache_max_entries`` 개를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+from ..config import settings
+from .ingest_token import verify_ingest_token
+
+
+class VerifiedToken(NamedTuple):
+    sid: str
+    exp: int  # epoch seconds
+
+
+class _SessionState(NamedTuple):
+    live: bool
+    expires_at: float  # epoch seconds
+
+
+class IngestAuthCache:
+    def __init__(self) -> None:
+        self._tokens: OrderedDict[str, VerifiedToken] = OrderedDict()
+        self._sessions: OrderedDict[str, _SessionState] = OrderedDict()
+        self.token_hits = 0
+        self.token_misses = 0
+        self.session_hits = 0
+        self.session_misses = 0
+
+    @staticmethod
+    def _bounded(cache: OrderedDict) -> None:
+        while len(cache) > settings.ingest_auth_cache_max_entries:
+            cache.popitem(last=False)
+
+    def verify(self, token: str) -> VerifiedToken:
+        """토큰을 검증해 (sid, exp) 를 돌려줍니다. 잘못되었거나 만료되면 ValueError."""
+        now = time.time()
+        cached = self._tokens.get(token)
+        if cached is not None:
+            if cached.exp >= int(now):
+                self._tokens.move_to_end(token)
+                self.token_hits += 1
+                return cached
+            del self._tokens[token]
+            raise ValueError("token expired")
+
+        self.token_misses += 1
+        payload = verify_ingest_token(settings.ingest_secret, token)
+        verified = VerifiedToken(sid=str(payload.get("sid")), exp=int(payload["exp"]))
+        self._tokens[token] = verified
+        self._bounded(self._tokens)
+        return verified
+
+    def seed(self, token: str, sid: str, ttl_seconds: int) -> None:
+        """방금 발급한 토큰과 새 세션을 등록합니다. exp 는 토큰의 실제 exp 이하로 잡힙니다."""
+        exp = int(time.time()) + ttl_seconds
+        self._tokens[token] = VerifiedToken(sid=sid, exp=exp)
+        self._bounded(self._tokens)
+        self.remember_session(sid, exp)
+
+    def session_live(self, sid: str) -> Optional[bool]:
+        """캐시된 세션 존재 여부. 모르면 None."""
+        state = self._sessions.get(sid)
+        if state is None or state.expires_at < time.time():
+            if state is not None:
+                del self._sessions[sid]
+            self.session_misses += 1
+            return None
+        self._sessions.move_to_end(sid)
+        self.session_hits += 1
+        return state.live
+
+    def remember_session(self, sid: str, until: float) -> None:
+        """존재가 확인된 세션을 ``until``(보통 토큰 exp)까지 기억합니다."""
+        self._put_session(sid, _SessionState(live=True, expires_at=until))
+
+    def remember_missing(self, sid: str) -> None:
+        """없는 세션을 잠시 기억해 반복 조회를 막습니다(네거티브 캐시)."""
+        expires_at = time.time() + settings.ingest_session_negative_ttl_seconds
+        self._put_session(sid, _SessionState(live=False, expires_at=expires_at))
+
+    def _put_session(self, sid: str, state: _SessionState) -> None:
+        self._sessions[sid] = state
+        self._sessions.move_to_end(sid)
+        self._bounded(self._sessions)
+
+    def forget_session(self, sid: str) -> None:
+        self._sessions.pop(sid, None)
+
+    def clear(self) -> None:
+        self._tokens.clear()
+        self._sessions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tokens": len(self._tokens),
+            "sessions": len(self._sessions),
+            "token_hits": self.token_hits,
+            "token_misses": self.token_misses,
+            "session_hits": self.session_hits,
+            "session_misses": self.session_misses,
+        }
+
+
+ingest_auth = IngestAuthCache()
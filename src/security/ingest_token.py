@@ -1,17 +1,20 @@
 import base64
 import hmac
-import json
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
 from typing import Any
 
+from ..serialization import dumps, loads
+
+_SIG_LEN = sha256().digest_size
+
 
 def sign_ingest_token(secret: str, session_id: str, ttl_seconds: int = 3600) -> str:
     payload = {
         "sid": session_id,
         "exp": int((datetime.now(tz=timezone.utc) + timedelta(seconds=ttl_seconds)).timestamp()),
     }
-    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    body = dumps(payload)
     sig = hmac.new(secret.encode("utf-8"), body, sha256).digest()
     token = base64.urlsafe_b64encode(body + b"." + sig).decode("ascii").rstrip("=")
     return token
@@ -20,11 +23,14 @@ def sign_ingest_token(secret: str, session_id: str, ttl_seconds: int = 3600) ->
 def verify_ingest_token(secret: str, token: str) -> dict[str, Any]:
     padded = token + "=" * (-len(token) % 4)
     data = base64.urlsafe_b64decode(padded.encode("ascii"))
-    body, sig = data.rsplit(b".", 1)
+    # 서명(32바이트)에도 b"." 가 나올 수 있으므로 구분자는 길이로 찾음
+    body, sep, sig = data[:-_SIG_LEN - 1], data[-_SIG_LEN - 1 : -_SIG_LEN], data[-_SIG_LEN:]
+    if sep != b".":
+        raise ValueError("malformed token")
     expected = hmac.new(secret.encode("utf-8"), body, sha256).digest()
     if not hmac.compare_digest(sig, expected):
         raise ValueError("invalid signature")
-    payload = json.loads(body.decode("utf-8"))
+    payload = loads(body)
     if int(payload.get("exp", 0)) < int(datetime.now(tz=timezone.utc).timestamp()):
         raise ValueError("token expired")
     return payload
@@ -0,0 +1,88 @@
+"""
+JSON 직렬화
+
+기본 응답 클래스, DB 엔진의 JSON 컬럼 변환(``json_serializer`` / ``json_deserializer``),
+인제스트 토큰, 랭킹 응답 본문이 같은 인코더를 씁니다.
+
+``json_backend`` 가 "auto" 면 orjson 이 설치되어 있을 때 orjson, 없으면 pydantic-core
+(FastAPI 와 함께 항상 설치되는 Rust 구현)를 쓰고, "stdlib" 은 표준 ``json`` 입니다.
+어느 쪽이든 출력은 공백 없는 UTF-8 JSON (비 ASCII 문자를 이스케이프하지 않음) 입니다.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Union
+from uuid import UUID
+
+import pydantic_core
+from starlette.responses import JSONResponse
+
+from .config import settings
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (pip install orjson)
+    orjson = None  # type: ignore[assignment]
+
+BACKENDS = ("orjson", "pydantic", "stdlib")
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID, Decimal)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # 64비트를 넘는 정수처럼 orjson 이 다루지 못하는 값은 표준 json 으로 처리
+        return _stdlib_dumps(obj)
+
+
+def _pydantic_dumps(obj: Any) -> bytes:
+    return pydantic_core.to_json(obj, fallback=_default)
+
+
+def resolve_backend(name: str) -> str:
+    if name == "auto":
+        return "orjson" if orjson is not None else "pydantic"
+    if name not in BACKENDS:
+        raise ValueError(f"unknown json backend: {name}")
+    if name == "orjson" and orjson is None:
+        raise RuntimeError("APP_JSON_BACKEND=orjson 이지만 orjson 이 설치되어 있지 않습니다.")
+    return name
+
+
+BACKEND = resolve_backend(settings.json_backend)
+
+dumps: Callable[[Any], bytes]
+loads: Callable[[Union[bytes, str]], Any]
+if BACKEND == "orjson":
+    dumps, loads = _orjson_dumps, orjson.loads
+elif BACKEND == "pydantic":
+    dumps, loads = _pydantic_dumps, pydantic_core.from_json
+else:
+    dumps, loads = _stdlib_dumps, json.loads
+
+
+def dumps_str(obj: Any) -> str:
+    """문자열이 필요한 곳(SQLAlchemy ``json_serializer``)용."""
+    return dumps(obj).decode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """FastAPI 기본 응답 클래스. 본문 인코딩만 ``dumps`` 로 바꿉니다."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
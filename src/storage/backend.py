@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from ..config import settings
+from .base import Storage
+from .local import LocalStorage
+from .s3 import S3Storage
+
+_s3_storage = S3Storage()
+_local_storage: Optional[LocalStorage] = None
+
+
+def get_storage() -> Storage:
+    """``storage_backend`` 설정에 맞는 저장소. 프로세스 전체에서 같은 인스턴스를 재사용합니다."""
+    global _local_storage
+    if settings.storage_backend == "local":
+        root = Path(settings.storage_local_root).resolve()
+        if _local_storage is None or _local_storage.root != root:
+            _local_storage = LocalStorage(settings.storage_local_root)
+        return _local_storage
+    return _s3_storage
@@ -0,0 +1,109 @@
+"""
+비동기 저장소 인터페이스
+
+라우트와 백그라운드 작업은 이 인터페이스만 사용합니다. 블로킹 I/O(boto3, 파일)는
+``storage_max_workers`` 크기의 전용 스레드 풀에서 실행되므로 이벤트 루프를 막지 않고,
+저장소 호출이 몰려도 기본 executor(다른 ``to_thread`` 사용처)를 잠식하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Callable, Optional, TypeVar
+
+from ..config import settings
+
+T = TypeVar("T")
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+@dataclass
+class PresignResult:
+    url: str
+    expires_in: int
+
+
+def storage_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.storage_max_workers, thread_name_prefix="storage"
+                )
+    return _executor
+
+
+async def run_blocking(fn: Callable[..., T], *args: object, **kwargs: object) -> T:
+    """블로킹 함수를 저장소 전용 스레드 풀에서 실행합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(storage_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def shutdown_storage_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+async def iter_file(path: str, part_size: int) -> AsyncIterator[bytes]:
+    """파일을 ``part_size`` 단위로 읽습니다 (읽기는 스레드 풀에서)."""
+    fileobj = await run_blocking(open, path, "rb")
+    try:
+        while True:
+            data = await run_blocking(fileobj.read, part_size)
+            if not data:
+                return
+            yield data
+    finally:
+        await run_blocking(fileobj.close)
+
+
+class Storage(ABC):
+    """객체 저장소. 키는 버킷(또는 루트 디렉터리) 안의 상대 경로입니다."""
+
+    @abstractmethod
+    async def presign_get(self, key: str, expires_in: int = 3600) -> PresignResult:
+        """객체를 내려받을 수 있는 URL."""
+
+    @abstractmethod
+    async def upload_stream(
+        self, key: str, chunks: AsyncIterable[bytes], content_type: str = DEFAULT_CONTENT_TYPE
+    ) -> int:
+        """바이트 조각을 받는 대로 올립니다. 메모리에는 파트 하나만 둡니다. 올린 바이트 수를 돌려줍니다."""
+
+    async def upload_file(
+        self, path: str, key: str, content_type: str = DEFAULT_CONTENT_TYPE
+    ) -> int:
+        return await self.upload_stream(
+            key, iter_file(path, settings.storage_multipart_part_bytes), content_type
+        )
+
+    @abstractmethod
+    async def get_range(self, key: str, start: int, length: int) -> bytes:
+        """객체의 [start, start + length) 구간만 읽습니다."""
+
+    async def iter_range(
+        self, key: str, start: int, length: int, part_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """[start, start + length) 구간을 ``part_size`` 단위 범위 요청으로 나눠 읽습니다."""
+        part_size = part_size or settings.storage_multipart_part_bytes
+        end = start + length
+        while start < end:
+            size = min(part_size, end - start)
+            data = await self.get_range(key, start, size)
+            if not data:
+                return
+            yield data
+            start += len(data)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import AsyncIterable, Optional
+
+from ..config import settings
+from .base import DEFAULT_CONTENT_TYPE, PresignResult, Storage, run_blocking
+
+
+class LocalStorage(Storage):
+    """개발/벤치마크용 파일 시스템 저장소. 키는 ``storage_local_root`` 아래 상대 경로입니다.
+
+    쓰기는 ``.part`` 파일에 한 뒤 rename 하므로 읽는 쪽이 쓰다 만 파일을 보지 않습니다.
+    presigned URL 대신 ``file://`` URL 을 돌려줍니다.
+    """
+
+    def __init__(self, root: Optional[str] = None) -> None:
+        self._root = Path(root or settings.storage_local_root).resolve()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def path_for(self, key: str) -> Path:
+        path = (self._root / key).resolve()
+        if self._root not in path.parents:
+            raise ValueError(f"invalid storage key: {key!r}")
+        return path
+
+    async def presign_get(self, key: str, expires_in: int = 3600) -> PresignResult:
+        return PresignResult(url=self.path_for(key).as_uri(), expires_in=expires_in)
+
+    async def upload_stream(
+        self, key: str, chunks: AsyncIterable[bytes], content_type: str = DEFAULT_CONTENT_TYPE
+    ) -> int:
+        target = self.path_for(key)
+        tmp = target.with_name(target.name + ".part")
+        await run_blocking(target.parent.mkdir, parents=True, exist_ok=True)
+        fileobj = await run_blocking(open, tmp, "wb")
+        total = 0
+        try:
+            async for data in chunks:
+                await run_blocking(fileobj.write, data)
+                total += len(data)
+        except BaseException:
+            await run_blocking(fileobj.close)
+            await run_blocking(tmp.unlink, missing_ok=True)
+            raise
+        await run_blocking(fileobj.close)
+        await run_blocking(os.replace, tmp, target)
+        return total
+
+    async def upload_file(
+        self, path: str, key: str, content_type: str = DEFAULT_CONTENT_TYPE
+    ) -> int:
+        target = self.path_for(key)
+        tmp = target.with_name(target.name + ".part")
+
+        def copy() -> int:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, target)
+            return target.stat().st_size
+
+        return await run_blocking(copy)
+
+    async def get_range(self, key: str, start: int, length: int) -> bytes:
+        path = self.path_for(key)
+
+        def read() -> bytes:
+            with open(path, "rb") as fileobj:
+                fileobj.seek(start)
+                return fileobj.read(length)
+
+        return await run_blocking(read)
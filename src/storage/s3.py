@@ -1,20 +1,61 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterable, Optional
 
 import boto3
 
 from ..config import settings
+from .base import DEFAULT_CONTENT_TYPE, PresignResult, Storage, run_blocking
 
 
-@dataclass
-class PresignResult:
-    url: str
-    expires_in: int
+class PresignCache:
+    """발급한 presigned URL 을 만료 시각과 함께 보관합니다.
+
+    남은 수명이 ``s3_presign_reuse_ratio`` 이상이면 같은 URL 을 다시 돌려주고,
+    응답의 ``expires_in`` 은 실제 남은 시간으로 줄여 줍니다.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, int], tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, expires_in: int) -> Optional[PresignResult]:
+        with self._lock:
+            entry = self._entries.get((key, expires_in))
+            if entry is not None:
+                url, expires_at = entry
+                remaining = expires_at - time.time()
+                if remaining >= expires_in * settings.s3_presign_reuse_ratio:
+                    self._entries.move_to_end((key, expires_in))
+                    self.hits += 1
+                    return PresignResult(url=url, expires_in=int(remaining))
+                del self._entries[(key, expires_in)]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, expires_in: int, url: str, issued_at: float) -> None:
+        with self._lock:
+            self._entries[(key, expires_in)] = (url, issued_at + expires_in)
+            self._entries.move_to_end((key, expires_in))
+            while len(self._entries) > settings.s3_presign_cache_max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
 
 
 class S3Client:
+    """boto3 기반 동기 클라이언트. 라우트에서는 ``S3Storage`` 를 통해 스레드 풀에서 호출합니다."""
+
     def __init__(self) -> None:
         self._client = boto3.client(
             "s3",
@@ -24,15 +65,146 @@ class S3Client:
             aws_secret_access_key=settings.s3_secret_access_key,
         )
         self._bucket = settings.s3_bucket
+        self.presign_cache = PresignCache()
+
+    @property
+    def bucket(self) -> str:
+        if not self._bucket:
+            raise RuntimeError("S3 bucket is not configured")
+        return self._bucket
 
     def presign_get(self, key: str, expires_in: int = 3600) -> PresignResult:
+        cached = self.presign_cache.get(key, expires_in)
+        if cached is not None:
+            return cached
+        return self.sign_get(key, expires_in)
+
+    def sign_get(self, key: str, expires_in: int = 3600) -> PresignResult:
+        """캐시를 보지 않고 새로 서명해 캐시에 넣습니다 (조회는 호출한 쪽에서 이미 한 경우)."""
         if not self._bucket:
             raise RuntimeError("S3 bucket is not configured")
+        issued_at = time.time()
         url = self._client.generate_presigned_url(
             ClientMethod="get_object",
             Params={"Bucket": self._bucket, "Key": key},
             ExpiresIn=expires_in,
         )
+        self.presign_cache.put(key, expires_in, url, issued_at)
         return PresignResult(url=url, expires_in=expires_in)
 
+    def put_object(self, key: str, data: bytes, content_type: str = DEFAULT_CONTENT_TYPE) -> None:
+        self._client.put_object(Bucket=self.bucket, Key=key, Body=data, ContentType=content_type)
+
+    def create_multipart_upload(self, key: str, content_type: str = DEFAULT_CONTENT_TYPE) -> str:
+        response = self._client.create_multipart_upload(
+            Bucket=self.bucket, Key=key, ContentType=content_type
+        )
+        return response["UploadId"]
+
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        response = self._client.upload_part(
+            Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=data
+        )
+        return response["ETag"]
+
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict[str, Any]]) -> None:
+        self._client.complete_multipart_upload(
+            Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        self._client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+
+    def get_range(self, key: str, start: int, length: int) -> bytes:
+        """객체의 [start, start + length) 구간만 읽습니다 (HTTP Range)."""
+        if not self._bucket:
+            raise RuntimeError("S3 bucket is not configured")
+        response = self._client.get_object(
+            Bucket=self._bucket, Key=key, Range=f"bytes={start}-{start + length - 1}"
+        )
+        return response["Body"].read()
+
+
+_client: Optional[S3Client] = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client() -> S3Client:
+    """프로세스 전체에서 공유하는 S3Client. 처음 호출될 때 한 번만 만듭니다.
+
+    boto3 client 는 스레드 간 공유해도 안전하므로, 생성만 잠금으로 보호합니다.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = S3Client()
+    return _client
+
+
+def peek_s3_client() -> Optional[S3Client]:
+    """이미 만들어진 S3Client (없으면 만들지 않고 None)."""
+    return _client
+
+
+class S3Storage(Storage):
+    """``S3Client`` 호출을 저장소 전용 스레드 풀에서 실행하는 비동기 저장소."""
+
+    def __init__(self, client: Optional[S3Client] = None) -> None:
+        self._client = client
+
+    async def get_client(self) -> S3Client:
+        """첫 사용 시점까지 boto3 client 생성을 미룹니다. 생성(자격 증명 조회 포함)은 스레드 풀에서."""
+        client = self._client or peek_s3_client()
+        if client is None:
+            client = await run_blocking(get_s3_client)
+        return client
+
+    async def presign_get(self, key: str, expires_in: int = 3600) -> PresignResult:
+        # 캐시 적중은 스레드 전환 없이 바로 돌려줌 (서명 생성/자격 증명 조회만 스레드 풀에서)
+        client = await self.get_client()
+        cached = client.presign_cache.get(key, expires_in)
+        if cached is not None:
+            return cached
+        return await run_blocking(client.sign_get, key, expires_in)
+
+    async def upload_stream(
+        self, key: str, chunks: AsyncIterable[bytes], content_type: str = DEFAULT_CONTENT_TYPE
+    ) -> int:
+        """``storage_multipart_part_bytes`` 단위 multipart 업로드. 한 파트도 안 되면 put_object 한 번."""
+        client = await self.get_client()
+        part_size = settings.storage_multipart_part_bytes
+        buffer = bytearray()
+        upload_id: Optional[str] = None
+        parts: list[dict[str, Any]] = []
+        total = 0
+
+        async def send_part(data: bytes) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                upload_id = await run_blocking(client.create_multipart_upload, key, content_type)
+            etag = await run_blocking(client.upload_part, key, upload_id, len(parts) + 1, data)
+            parts.append({"PartNumber": len(parts) + 1, "ETag": etag})
+
+        try:
+            async for data in chunks:
+                buffer += data
+                total += len(data)
+                while len(buffer) >= part_size:
+                    await send_part(bytes(buffer[:part_size]))
+                    del buffer[:part_size]
+            if upload_id is None:
+                await run_blocking(client.put_object, key, bytes(buffer), content_type)
+                return total
+            if buffer:
+                await send_part(bytes(buffer))
+            await run_blocking(client.complete_multipart_upload, key, upload_id, parts)
+        except BaseException:
+            if upload_id is not None:
+                await run_blocking(client.abort_multipart_upload, key, upload_id)
+            raise
+        return total
 
+    async def get_range(self, key: str, start: int, length: int) -> bytes:
+        client = await self.get_client()
+        return await run_blocking(client.get_range, key, start, length)